@@ -22,18 +22,239 @@ Change Log:
             Added file management functionality.
             Added in-program tutorial.
         Added scrollbar to accommodate large lists.
+    Version 1.0 (October 17, 2026)
+        Added a virtualized list mode for large lists.
+            Only the rows that fit in the window are built, and they are reused while scrolling.
+            Task data is kept in a list of records instead of being read back from the widgets.
+        Fixed loaded tasks' delete buttons all deleting the last row.
+    Version 1.1 (October 17, 2026)
+        Added a task store that owns the list's data.
+            Each task is a compact record with a stable id; widgets only display it.
+            Saving, loading, and the completion tracker no longer read from the widgets.
+    Version 1.2 (October 17, 2026)
+        Deleting a task now only touches that task's widgets.
+            Rows keep their grid position instead of being shifted up, and empty rows collapse.
+            Rows are renumbered in one pass only when Tk's grid row limit gets close.
+    Version 1.3 (October 17, 2026)
+        Loading now adds tasks in small batches so the window stays responsive.
+            The first tasks appear right away, and the rest follow a batch at a time.
+            Long loads show their progress in the header and can be cancelled.
+    Version 1.4 (October 17, 2026)
+        Moved the task model into the "tasklist" package so it can be used without the window.
+            The window is only built when this file is run directly.
+            Added a command line ("python -m tasklist") for adding, completing, deleting, listing, and exporting tasks.
+    Version 1.5 (October 17, 2026)
+        Added autosave.
+            Each change is appended to a small journal beside the current file instead of rewriting the file.
+            Once the journal gets large, it is folded back into the file in the background.
+            Loading a file replays any journaled changes.
+    Version 1.6 (October 17, 2026)
+        Added SQLite databases as a way to store very large lists.
+            Load and Save accept ".db" files; a loaded database is read a page at a time as the list scrolls.
+            Each change to a database list is saved right away as a single-row update.
+    Version 1.7 (October 17, 2026)
+        Deadlines are now understood as dates when they use a common format (like "10/31/2026", "Oct 31", or "friday 5pm").
+            Overdue tasks are shown in red, and the header counts overdue tasks and tasks due today.
+            Any text is still accepted as a deadline; text that isn't a date just isn't tracked.
+    Version 1.8 (October 17, 2026)
+        Added a search box to the header.
+            Typing filters the list to tasks whose description or deadline contains every word typed, including half-typed words.
+            Searches use an index of every word in the list, which is kept up to date as tasks change.
+            Filtering hides and shows the existing rows instead of rebuilding them.
+    Version 1.9 (October 17, 2026)
+        Added profiling hooks for finding slow commands.
+            The buttons' commands and the list's resize handlers are timed and counted while profiling is on.
+            F12 shows an overlay with the widget count, the last command's time, and how late the event loop is running.
+            Shift+F12 starts and stops a full cProfile capture, saved as "tasklist.prof".
+            Profiling is off by default (or on from the start with TASKLIST_PROFILE=1), and costs almost nothing while off.
+    Version 1.10 (October 17, 2026)
+        The scroll region, column widths, and completion tracker are now redrawn at most once per idle cycle.
+            Changes only mark them as needing a redraw, so a load or bulk change is laid out once instead of once per task.
+    Version 1.11 (October 17, 2026)
+        Added multi-selection and bulk actions.
+            Clicking a task selects it; Ctrl+click adds or removes tasks, and Shift+click selects a range.
+            New buttons complete, uncomplete, or delete the selected tasks, delete every completed task, or select every overdue task.
+            Each bulk action is a single change to the list, redrawn once.
+    Version 1.12 (October 17, 2026)
+        Added a compact save file format for large lists.
+            Files saved with the ".tlist" extension are less than half the size of JSON and load several times faster.
+            Load recognizes these files by their contents, and JSON files work exactly as before.
+    Version 1.13 (October 17, 2026)
+        Saving and loading now read and write files on a background thread, so the window never freezes.
+            A save writes a copy of the list taken when Save was clicked, so tasks can keep being changed while it runs.
+            The header shows "Saving..." or "Reading..." until the file is done.
+    Version 1.14 (October 17, 2026)
+        The Help window is now built once and reused, and remembers the page it was left on.
+            Decoded help images are kept in a small cache, and the pages next to the current one are loaded in the background.
+    Version 1.15 (October 17, 2026)
+        Added a theme that every task row is built from.
+            Fonts are shared named fonts instead of a font description per widget, and row colors come from one set of row styles.
+            Ctrl+= and Ctrl+- make all of the program's text bigger or smaller at once.
+    Version 1.16 (October 17, 2026)
+        Added undo and redo (the Undo and Redo buttons, or Ctrl+Z and Ctrl+Y).
+            Adding, deleting, completing, and editing tasks can all be undone, including bulk actions as a whole.
+            Deleted tasks come back in the same place they were deleted from.
+            Only the changes themselves are remembered, not copies of the list; the oldest ones are moved to a temporary file.
+        Double-clicking a task now opens it for editing.
+    Version 1.17 (October 17, 2026)
+        Added tabs, so several lists can be open at once (New List, Close List, and Ctrl+T, Ctrl+W, and Ctrl+Tab).
+            Only the shown list has widgets; switching tabs gives the rows already built to the other list's tasks.
+            Lists in other tabs are kept as plain data, and once they hold too many tasks the least recently shown are unloaded to disk.
+            Each tab remembers its file, scroll position, selection, and autosave setting.
+    Version 1.18 (October 17, 2026)
+        Loading a file over a list that is already shown now only changes the tasks that differ.
+            Tasks are matched by id, so a file that changed by one task changes one row instead of rebuilding the list.
+        Added Watch File, which brings in changes other programs (like the command line) make to the open file.
+            The file is checked every second by its size and modification time, and only read when those change.
+    Version 1.19 (October 17, 2026)
+        Added shared lists, so several windows can work on one list at once without overwriting each other's saves.
+            "python -m tasklist -f FILE serve" shares FILE from a small server on this computer; Join Shared List opens it in a tab.
+            Only the tasks that changed are sent, and changes from other windows only touch those tasks' rows.
+            The server saves every change to FILE as it arrives.
+    Version 1.20 (October 17, 2026)
+        Added CSV and iCalendar files, for moving tasks to and from other programs.
+            Save and Load accept ".csv" and ".ics" files; in iCalendar files each task is a to-do, with its deadline as the due date.
+            Import adds a file's tasks to the end of the shown list, reading it a chunk at a time and adding each chunk as one batch.
+            "python -m tasklist convert SOURCE OUTPUT" converts between any two formats, reading and writing CSV and iCalendar files a task at a time.
+    Version 1.21 (October 17, 2026)
+        Added reopening the last session: the lists open when the window closes are opened again, as they were, when it next starts.
+            Each list is saved as a compact snapshot in ~/.tasklist (or TASKLIST_SESSION_DIR), and the shown list's first page is saved with the session itself,
+            so that page is drawn before the rest of the list is read in the background; other tabs are read when they are first shown.
+            A snapshot is only used while its file is unchanged, so edits made by other programs in the meantime are read from the file.
+        Made startup quicker by loading the file explorer, dialogs, shared lists, and profiler only when they are first used.
+            The time until the list is first drawn is measured, and printed while profiling is on (TASKLIST_PROFILE=1).
+    Version 1.22 (October 17, 2026)
+        Added reminders: when a task comes due, a small notice names it, without stopping the list from working.
+            Upcoming deadlines are kept in a heap, and a single timer is armed for the next one, however many tasks have deadlines.
+            This replaces the check every 30 seconds for newly overdue tasks; rows now turn red the moment they come due.
+    Version 1.23 (October 17, 2026)
+        Task rows no longer hold their own callbacks or checkbox variables: one handler per kind of event serves the whole list,
+            finding the clicked task through the row it is on. Whether a task is completed is read from the list itself,
+            and its checkbox is only selected or cleared to show it, so rows are built and reused without an IntVar each.
+    Version 1.24 (October 17, 2026)
+        Recycled rows show as much of each task and deadline as their columns have room for, instead of a fixed number of characters.
 """
 
 ### HOUSEKEEPING
 # IMPORT
+import time # used for time-slicing long loads and timing startup
+startTime = time.perf_counter() # taken before the other imports, so startup timings include them
 import tkinter as tk # used for GUI
-from tkinter import filedialog # used for file management - processing
+from tkinter import font as tkfont # used for shared fonts
 import json # used for file management - writing/reading
+import os # used for comparing file paths
+import base64 # used for handing preloaded images to Tk
+import tempfile # used for finding a place for old undo history
+from collections import OrderedDict # used for the help image cache
+from itertools import islice # used for reading imported files a chunk at a time
+from tasklist import TaskStore, saveRecords, streamRecords, isDatabasePath # the task model, shared with the command line
+from tasklist.sqlitestore import SqliteTaskStore, readDatabaseRecords # used for very large lists
+from tasklist.deadlines import DeadlineIndex, dayBounds # used for finding overdue tasks
+from tasklist.reminders import ReminderQueue # used for knowing which task comes due next
+from tasklist.search import SearchIndex # used for searching the list
+from tasklist import profiling # used for timing commands
+from tasklist.background import BackgroundWorker # used for reading and writing files without freezing the window
+from tasklist.undo import UndoLog # used for undo and redo
+from tasklist.workspace import Workspace # used for keeping several lists open in tabs
+from tasklist.watch import FileWatcher # used for noticing changes other programs make to the open file
+from tasklist.session import saveSession, readSession, restoreTabs, previewLength, defaultSessionDirectory # used for reopening the last session's lists
+from tasklist.binaryfile import readBinaryFile # used for reading session snapshots
+from tasklist import TaskJournal, readJournaledFile, discardJournal # used for autosaving
 
 # INITIALIZE
-tasksInList = 0 # counts the items in the list
-tasksCompleted = 0 # counts the tasks completed
-dataReferences = {}
+taskStore = TaskStore() # holds the tasks in the list
+deadlineIndex = DeadlineIndex(taskStore) # pending tasks sorted by deadline
+themeColors = { # the colors task rows are drawn with
+    "background": "#1A558C", # dark blue
+    "accent": "#00A2E8", # light blue
+    "text": "#FFFFFF", # white
+    "overdue": "#FF9999", # colors overdue tasks' text - light red
+    "selected": "#2F6FAB" # colors selected tasks' rows - medium blue
+}
+themeFontSizes = { # name -> (size, weight) of every shared font
+    "title": (30, "bold"),
+    "heading": (20, "bold"),
+    "label": (15, "bold"),
+    "body": (15, "normal"),
+    "small": (12, "normal")
+}
+themeFamily = "Arial Rounded MT Bold"
+themeFonts = {} # name -> shared tkfont.Font, made once the window exists
+rowStyles = {} # widget kind -> options shared by every task row's widgets of that kind
+rowBindTag = "TaskRow" # the bind tag every row widget carries, so one set of handlers serves the whole list
+textSizeStep = 0 # points added to every font by Ctrl+= and Ctrl+-
+reminderQueue = ReminderQueue(taskStore) # pending tasks' deadlines still to come, soonest first
+reminderJob = None # the one timer armed for the next task to come due
+reminderTime = float("inf") # when that timer goes off
+reminderDelayLimit = 3600 # seconds a timer is armed for at most, so a changed clock or a sleeping computer is caught up with
+reminderShowTime = 15000 # milliseconds a reminder stays up unless dismissed
+reminderListLimit = 5 # tasks named in one reminder; the rest are counted
+reminderWindow = None # the reminder notice, built the first time a task comes due and hidden instead of closed
+reminderMessage = None # the notice's text
+reminderHideJob = None # the scheduled hiding of the notice
+searchIndex = SearchIndex(taskStore) # every word in the list -> the tasks that use it
+undoLog = UndoLog(taskStore, spillPath = os.path.join(tempfile.gettempdir(), f"tasklist-undo-{os.getpid()}.jsonl")) # the changes Undo can reverse
+workspace = Workspace() # every open list, one per tab; the shown one is taskStore
+workspace.activate(workspace.addTab("List 1", taskStore))
+tabCount = 1 # numbers new, unsaved lists
+tabButtons = [] # the tab bar's buttons, in tab order
+searchDelay = 200 # milliseconds of no typing before the search runs
+searchJob = None # the scheduled search, if typing hasn't paused yet
+searchQuery = "" # the text the list is currently filtered by
+searchMatches = None # taskIds matching the search, or None when the list isn't filtered
+filteredIds = None # the same taskIds in list order, for drawing recycled rows
+hiddenRows = set() # taskIds whose rows are hidden because they don't match the search
+overlayVisible = False # whether the performance overlay is shown
+overlayDelay = 500 # milliseconds between overlay refreshes
+overlayJob = None # the scheduled overlay refresh
+lagCheckDelay = 100 # milliseconds between event loop lag checks
+lagCheckJob = None # the scheduled lag check
+lagCheckDue = 0.0 # when the scheduled lag check should run, if the loop isn't behind
+profilingBeforeOverlay = False # whether profiling was on before the overlay turned it on
+profileOutputPath = "tasklist.prof" # where cProfile captures are saved
+layoutDirty = set() # parts of the window waiting to be redrawn: "columns", "scrollRegion", and "tracker"
+layoutJob = None # the scheduled redraw, if one is waiting for the window to go idle
+canvasWidth = 0 # the list canvas's latest width, applied to the list on the next redraw
+selectedIds = set() # taskIds of the selected tasks
+selectionAnchor = None # the task a Shift+click range starts from
+taskRows = {} # taskId -> that task's widgets and grid row, when every task has its own row
+rowTasks = {} # grid row -> the taskId drawn on it
+nextGridRow = 1 # the grid row given to the next task; rows are never shifted, so emptied rows simply collapse
+gridRowLimit = 9000 # Tk refuses grid rows past 10000, so rows are renumbered before reaching it
+
+listMode = "auto" # "classic" builds widgets for every task, "virtual" recycles a fixed set of rows, "auto" picks by list length
+virtualListThreshold = 200 # lists longer than this use recycled rows in "auto" mode
+virtualTextWidths = (0, 0) # pixels of text that fit in a recycled row's task and deadline columns
+virtualMode = False # whether the list is currently drawn with recycled rows
+virtualRowPool = [] # the recycled rows, top to bottom
+virtualRowHeight = 1 # pixel height of one recycled row, measured once it is built
+virtualFirstRow = 0 # index of the task shown in the top recycled row
+
+currentFilePath = None # the file last saved or loaded
+taskJournal = None # records every change to the current file while autosave is on
+journalSyncDelay = 1000 # milliseconds between forcing autosaved changes to disk
+
+fileWatcher = None # checks the open file for changes while Watch File is on
+watchDelay = 1000 # milliseconds between checks of the watched file
+watchJob = None # the scheduled check, while Watch File is on
+syncClients = {} # tab -> the connection keeping its shared list in step with the server
+syncPollDelay = 20 # milliseconds between applying changes from shared lists' servers
+syncPollJob = None # the scheduled check, while a shared list is open
+loadState = None # the load in progress, if any
+loadSliceTime = 0.012 # seconds of loading done before the window is given a chance to redraw
+loadingTotal = 0 # how many tasks the load in progress will end with
+importState = None # the import in progress, if any
+sessionDirectory = defaultSessionDirectory # where the open lists are remembered between runs; "" turns this off
+restoringSnapshot = None # the shown list's snapshot from the last session, until it has been read back in
+firstPaintTime = None # seconds from starting to the list first being drawn
+importChunkSize = 5000 # tasks read from an imported file, and added to the list, at a time
+ioWorker = BackgroundWorker() # reads and writes files off the window's thread
+ioPollDelay = 20 # milliseconds between checks for finished file work
+ioPollJob = None # the scheduled check, while file work is running
+helpWindow = None # the Help window, built the first time Help is clicked and hidden instead of closed
+helpImageCache = OrderedDict() # image path -> decoded PhotoImage, least recently shown first
+helpImageCacheSize = 4 # how many decoded help images are kept
+helpImagesLoading = set() # image paths being preloaded
 
 # DEFINE FUNCTIONS (BUTTON COMMANDS)
 """
@@ -42,123 +263,522 @@ Some functions involve the creation of new windows.
 """
 
 def saveToFile():
+    from tkinter import filedialog # the file explorer is only loaded once it is first used
+    
     filePath = filedialog.asksaveasfilename( # determines the constraints of the file explorer
         defaultextension = ".json",
-        filetypes = [("JSON files (*.json)", "*.json"), ("All files", "*.*")],
+        filetypes = [("JSON files (*.json)", "*.json"), ("Compact task files (*.tlist)", "*.tlist"), ("Task databases (*.db)", "*.db"), ("CSV files (*.csv)", "*.csv"), ("iCalendar files (*.ics)", "*.ics"), ("All files", "*.*")],
         title = "Save as"
     )
     
-    if filePath: # will only save the file if the user chose a location and file name
-        tasksToSave = {} # organizes saved data
-        
-        for widget in tasksFrame.winfo_children(): # records data to be saved
-            rowInfo = widget.grid_info() # gathers necessary data for proper organization
-            rowNumber = rowInfo["row"]
-            columnNumber = rowInfo["column"]
-            
-            if rowNumber not in tasksToSave: # organizes data by row number
-                tasksToSave[rowNumber] = {}
-            
-            if columnNumber == 1 and isinstance(widget, tk.Checkbutton):
-                if rowNumber in dataReferences:
-                    completionStatus = dataReferences[rowNumber].get()
-                    tasksToSave[rowNumber]["completed"] = completionStatus
-            elif columnNumber == 2 and isinstance(widget, tk.Label): # records a task's description
-                tasksToSave[rowNumber]["task"] = widget.cget("text")
-            elif columnNumber == 3 and isinstance(widget, tk.Label): # records a task's deadline
-                tasksToSave[rowNumber]["deadline"] = widget.cget("text")
-        
-        try: # actually saves the file
-            with open(filePath, 'w') as saveFile:
-                json.dump(tasksToSave, saveFile, indent = 4)
-                print(f"File saved successfully as \"{filePath}\".")
-        except Exception as error:
-            print(f"An unexpected error occurred: {error}")
-
-def deleteTask(buttonWidget):
-    global tasksInList # will be updated in the function
-    deletingRow = buttonWidget.grid_info()["row"] # ensures the button deletes only its own row
-    deletingWidgets = [] # temporarily stores the items to be deleted
+    if not filePath: # will only save the file if the user chose a location and file name
+        return
     
-    for widget in tasksFrame.winfo_children(): # checks to see if an item is valid for deleting
-        examine = widget.grid_info()
-        if examine["row"] == deletingRow: # if the item is on the same row as the delete button
-            deletingWidgets.append(widget) # it is added to the list of items to be deleted
+    closeJournal() # a full save replaces whatever the old journal held
+    if isinstance(taskStore, SqliteTaskStore):
+        if os.path.abspath(filePath) == os.path.abspath(taskStore.databasePath): # every change is already in it
+            finishSave(filePath)
+            return
+        databasePath = taskStore.databasePath
+        readRecords = lambda: readDatabaseRecords(databasePath) # read on the worker thread, through its own connection
+    else:
+        records = taskStore.records() # a copy, so changes made while saving don't end up half-saved
+        readRecords = lambda: records
     
-    for widget in deletingWidgets:
-        widget.destroy() # deletes the items
+    workspace.active.changed = False # the copy has everything so far; changes made while saving mark the list changed again
     
-    for widget in tasksFrame.winfo_children(): # repositions remaining items
-        examine = widget.grid_info()
-        if examine["row"] > deletingRow: # if the row was below the deleted one
-            widget.grid_configure(row = examine["row"] - 1) # it's moved up to remove blank space
+    def writeFile():
+        saveRecords(filePath, readRecords())
+        discardJournal(filePath) # the saved file already has any changes an older journal beside it recorded
     
-    tasksInList -= 1 # reduces the count of total list items
-    taskCompletion.config(text = f"{tasksCompleted}/{tasksInList} Tasks Completed") # updates the tracker
+    runInBackground(writeFile, lambda result: finishSave(filePath), failSave, "Saving")
 
-def updateTaskCompletion(checkVar):
-    global tasksCompleted
+def finishSave(filePath):
+    global currentFilePath
     
-    if checkVar.get() == 1:
-        tasksCompleted += 1
+    currentFilePath = filePath
+    workspace.active.nameAfter(filePath) # the tab is named after the file
+    drawTabBar()
+    resetFileWatcher() # the save isn't a change made by another program
+    print(f"File saved successfully as \"{filePath}\".")
+    if autosaveEnabled.get() == 1: # journals the changes made since the copy was taken
+        openJournal()
+
+def failSave(error):
+    print(f"An unexpected error occurred: {error}")
+    workspace.active.changed = True # the list still isn't saved anywhere
+    if autosaveEnabled.get() == 1:
+        openJournal()
+
+def deleteTask(taskId):
+    taskStore.remove(taskId) # the task's row is removed when the store reports the change
+
+def toggleTaskCompletion(taskId):
+    record = taskStore.get(taskId)
+    if record is not None: # the store holds whether the task is completed; the checkbox only shows it
+        taskStore.setCompleted(taskId, 0 if record.completed else 1) # the tracker is updated when the store reports the change
+
+def updateTracker():
+    trackerText = f"{taskStore.completedCount}/{len(taskStore)} Tasks Completed"
+    overdueCount = deadlineIndex.countOverdue() # found with a binary search, not by checking every task
+    dueTodayCount = deadlineIndex.countDueToday()
+    if overdueCount:
+        trackerText += f" | {overdueCount} Overdue"
+    if dueTodayCount:
+        trackerText += f" | {dueTodayCount} Due Today"
+    if searchMatches is not None:
+        trackerText += f" | {len(searchMatches)} Found"
+    if selectedIds:
+        trackerText += f" | {len(selectedIds)} Selected"
+    taskCompletion.config(text = trackerText) # updates the tracker
+
+def isOverdue(record, now):
+    return record.due is not None and not record.completed and record.due < now
+
+def textColor(record, now):
+    return themeColors["overdue"] if isOverdue(record, now) else themeColors["text"] # overdue tasks stand out; the rest are white
+
+def recolorTaskRow(taskId, now):
+    record = taskStore.get(taskId)
+    row = taskRows.get(taskId)
+    if record is None or row is None: # the task isn't drawn on its own row
+        return
+    color = textColor(record, now)
+    for widget in row["widgets"][1:3]: # the task and deadline labels
+        widget.config(fg = color)
+
+def showCompletion(checkbox, completed):
+    if completed: # the store holds whether the task is completed; the checkbox only shows it
+        checkbox.select()
     else:
-        tasksCompleted -= 1
+        checkbox.deselect()
+
+def destroyRowWidget(widget):
+    """Destroys one of a row's widgets. A checkbox made without a variable still gets a global Tcl variable
+    named after it, which Tk keeps once the checkbox is gone, so it is unset too."""
+    variableName = str(widget.cget("variable")) if isinstance(widget, tk.Checkbutton) else None
+    widget.destroy()
+    if variableName:
+        try:
+            tasksFrame.globalunsetvar(variableName)
+        except tk.TclError: # never set, so there is nothing to unset
+            pass
+
+def buildTaskRow():
+    newListCheck = tk.Checkbutton(tasksFrame, **rowStyles["check"]) # generates item checkbox; its look is shared by every row
+    newListTask = tk.Label(tasksFrame, **rowStyles["label"]) # generates item task
+    newListDeadline = tk.Label(tasksFrame, **rowStyles["label"]) # generates item deadline
+    newListDelete = tk.Button(tasksFrame, **rowStyles["delete"]) # generates delete button
+    widgets = (newListCheck, newListTask, newListDeadline, newListDelete)
+    tagRowWidgets(widgets) # clicks are handled by the list's shared handlers
+    return {"widgets": widgets}
+
+def createTaskRow(record, spareRow = None):
+    """Shows record on the next grid row, reusing spareRow's widgets (a row no longer needed) if given."""
+    global nextGridRow
+    
+    if nextGridRow > gridRowLimit: # the row numbers have run out, so the remaining rows are packed together first
+        compactTaskRows()
+    rowNumber = nextGridRow
+    nextGridRow += 1
+    
+    row = spareRow if spareRow is not None else buildTaskRow()
+    newListCheck, newListTask, newListDeadline, newListDelete = row["widgets"]
+    taskId = record.taskId
+    background = rowBackground(taskId) # dark blue, or medium blue if selected
+    foreground = textColor(record, time.time()) # white, or red if overdue
+    
+    showCompletion(newListCheck, record.completed)
+    newListCheck.config(bg = background, activebackground = background)
+    newListCheck.grid(row = rowNumber, column = 1, padx = 5, sticky = "ew") # places checkbox in the main window list
+    
+    newListTask.config(text = record.task, fg = foreground, bg = background)
+    newListTask.grid(row = rowNumber, column = 2, padx = 5, sticky = "ew")
+    
+    newListDeadline.config(text = record.deadline, fg = foreground, bg = background)
+    newListDeadline.grid(row = rowNumber, column = 3, padx = 5, sticky = "ew")
     
-    taskCompletion.config(text = f"{tasksCompleted}/{tasksInList} Tasks Completed")
+    newListDelete.grid(row = rowNumber, column = 4, padx = 5, sticky = "ew")
+    
+    row["row"] = rowNumber
+    taskRows[taskId] = row # lets the store's changes find this task's widgets
+    rowTasks[rowNumber] = taskId # lets clicks on the row find its task
+    if searchMatches is not None and taskId not in searchMatches: # new rows that don't match the search start hidden
+        hideTaskRow(taskId)
+
+def removeTaskRow(taskId):
+    deletingRow = taskRows.pop(taskId) # only this task's widgets are touched
+    del rowTasks[deletingRow["row"]]
+    hiddenRows.discard(taskId)
+    
+    for widget in deletingRow["widgets"]:
+        destroyRowWidget(widget) # deletes the items; the empty grid row collapses, so nothing below has to move
+
+def compactTaskRows():
+    global nextGridRow
+    
+    nextGridRow = 1
+    for oldRow in sorted(rowTasks): # renumbers the rows top to bottom without changing their order
+        taskId = rowTasks.pop(oldRow)
+        rowTasks[nextGridRow] = taskId
+        taskRows[taskId]["row"] = nextGridRow
+        for widget in taskRows[taskId]["widgets"]:
+            widget.grid_configure(row = nextGridRow)
+            if taskId in hiddenRows: # grid_configure shows the widget again
+                widget.grid_remove()
+        nextGridRow += 1
 
 def addNewTask(newTask, newDeadline):
-    global tasksInList
-    tasksInList += 1 # increases the count of total list items
+    taskStore.add(newTask, newDeadline) # new tasks start out incomplete; the row is built when the store reports it
+
+def editTask(taskId, newTask, newDeadline):
+    if taskStore.get(taskId) is not None: # the task may have been deleted while the window was open
+        taskStore.edit(taskId, newTask, newDeadline) # the row is redrawn when the store reports the change
+
+def undoChange(event = None):
+    if not undoLog.undo():
+        print("Nothing to undo.")
+
+def redoChange(event = None):
+    if not undoLog.redo():
+        print("Nothing to redo.")
+
+def onTasksChanged(action, tasks, previous):
+    global selectionAnchor
+    
+    if action == "reset" or (action == "remove" and selectedIds): # deleted tasks can't stay selected
+        if action == "reset":
+            selectedIds.clear()
+        else:
+            selectedIds.difference_update(record.taskId for record in tasks)
+        if selectionAnchor is not None and taskStore.get(selectionAnchor) is None:
+            selectionAnchor = None
+    if searchMatches is not None and (action != "update" or any(values[1:] != (record.task, record.deadline) for record, values in zip(tasks, previous))): # completing a task doesn't change its words
+        refreshSearchResults() # the search index has already taken in the change
+    
+    if action == "reset": # a whole new list was loaded
+        rebuildTaskRows()
+    elif virtualMode: # recycled rows only need to be redrawn
+        renderVirtualRows()
+    elif action == "add":
+        if shouldUseVirtualRows():
+            enterVirtualMode() # the list has outgrown one widget row per task
+        elif previous is not None: # tasks put back in the middle of the list (by undo), so the rows are rebuilt in order once
+            rebuildTaskRows()
+        else:
+            for record in tasks:
+                createTaskRow(record)
+    elif action == "remove":
+        for record in tasks:
+            removeTaskRow(record.taskId)
+    elif action == "update":
+        now = time.time()
+        for record in tasks:
+            row = taskRows[record.taskId]
+            showCompletion(row["widgets"][0], record.completed) # keeps the checkbox in step with the store
+            row["widgets"][1].config(text = record.task) # edited tasks show their new text
+            row["widgets"][2].config(text = record.deadline)
+            recolorTaskRow(record.taskId, now) # completed tasks are no longer overdue
+    
+    scheduleLayout("tracker")
+    scheduleReminder() # a new or edited task may come due before the timer goes off
+
+### ROW EVENTS
+"""
+Every row widget carries rowBindTag, so the whole list is served by one handler per kind of event
+instead of each widget holding its own callbacks and checkbox variable.
+A click finds its task through the grid row it landed on, and its column says what was clicked.
+The checkboxes and delete buttons still act like any other: on release over them, or with Space once focused.
+"""
+
+def tagRowWidgets(widgets):
+    for widget in widgets:
+        tags = widget.bindtags()
+        widget.bindtags(tags[:2] + (rowBindTag,) + tags[2:]) # after the widget's class, so buttons still look pressed
+
+def clickedTask(event):
+    """Returns the task and column of the row widget an event happened on; the task is None for an empty recycled row."""
+    cell = event.widget.grid_info()
+    if not cell: # the widget left the grid before the event was handled
+        return None, None
+    rowNumber = int(cell["row"])
+    if virtualMode: # recycled rows are numbered by slot
+        taskId = virtualRowPool[rowNumber]["taskId"] if rowNumber < len(virtualRowPool) else None
+    else:
+        taskId = rowTasks.get(rowNumber)
+    return taskId, int(cell["column"])
+
+def pressTaskRow(event):
+    taskId, column = clickedTask(event)
+    if taskId is not None and column in (2, 3): # clicking a task selects it
+        clickTask(taskId, event)
+
+def doubleClickTaskRow(event):
+    taskId, column = clickedTask(event)
+    if taskId is not None and column in (2, 3): # double-clicking a task opens it for editing
+        newTaskWindow(taskId)
+
+def activateTaskRow(taskId, column):
+    if column == 1: # the checkbox has already flipped itself; the store's change sets it for good
+        toggleTaskCompletion(taskId)
+    elif column == 4:
+        deleteTask(taskId) # the task's row is removed, or the rows below move up, when the store reports the change
+
+def releaseTaskRow(event):
+    taskId, column = clickedTask(event)
+    if taskId is not None and event.widget.winfo_containing(event.x_root, event.y_root) is event.widget: # like any button, letting go elsewhere cancels it
+        activateTaskRow(taskId, column)
+
+def spaceTaskRow(event):
+    taskId, column = clickedTask(event)
+    if taskId is not None: # the focused checkbox or delete button
+        activateTaskRow(taskId, column)
+
+def scrollTaskRow(event):
+    if virtualMode: # the wheel works anywhere over the list
+        scrollVirtualWheel(event)
+
+def bindTaskRows():
+    taskList.bind_class(rowBindTag, "<Button-1>", pressTaskRow)
+    taskList.bind_class(rowBindTag, "<Double-Button-1>", doubleClickTaskRow)
+    taskList.bind_class(rowBindTag, "<ButtonRelease-1>", releaseTaskRow)
+    taskList.bind_class(rowBindTag, "<space>", spaceTaskRow)
+    for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"): # Linux reports the wheel as buttons 4 and 5
+        taskList.bind_class(rowBindTag, sequence, scrollTaskRow)
+
+### VIRTUALIZED LIST
+"""
+Large lists are drawn with a fixed pool of recycled rows instead of one set of widgets per task.
+Only the rows that fit inside the canvas are built; scrolling rebinds them to different tasks.
+"""
+
+def shouldUseVirtualRows():
+    if listMode == "virtual":
+        return True
+    if listMode == "classic":
+        return False
+    return max(len(taskStore), loadingTotal) > virtualListThreshold # "auto" switches once the list gets long
+
+def shownTaskCount():
+    return len(taskStore) if filteredIds is None else len(filteredIds) # a search shortens the list
+
+def fitText(text, width):
+    """Cuts text short with an ellipsis if it is wider than width pixels, since recycled rows are a single line tall."""
+    font = themeFonts["body"]
+    if font.measure(text) <= width:
+        return text
+    shortest, longest = 0, len(text) # finds the longest start that fits with a binary search, measuring a few times at most
+    while shortest < longest:
+        middle = (shortest + longest + 1) // 2
+        if font.measure(text[:middle] + "\u2026") <= width:
+            shortest = middle
+        else:
+            longest = middle - 1
+    return text[:shortest] + "\u2026"
+
+def measureVirtualColumns():
+    """Works out how much text fits in the task and deadline columns at the canvas's width.
+    The two columns share what the checkbox and delete columns leave equally, as set up by enterVirtualMode."""
+    global virtualTextWidths
+    
+    firstRow = virtualRowPool[0]
+    fixedWidth = max(30, firstRow["checkbox"].winfo_reqwidth()) + max(80, firstRow["delete"].winfo_reqwidth()) + 20 # with their padding
+    columnWidth = max(200, (canvasWidth - fixedWidth) // 2) # the task column's minimum size holds for both
+    textWidth = columnWidth - 16 # less the cell's padding and the label's border
+    virtualTextWidths = (textWidth, textWidth)
+
+def createVirtualRow(slotNumber):
+    slot = {"taskId": None, "shown": None, "gridded": False} # remembers what the row is showing to skip redundant updates
     
-    createCheck = tk.IntVar() # used for checkbox generation
-    newListCheck = tk.Checkbutton( # generates item checkbox
+    slot["checkbox"] = tk.Checkbutton( # generates the recycled checkbox
         tasksFrame,
-        variable = createCheck,
-        command = lambda: updateTaskCompletion(createCheck),
-        selectcolor = "#1A558C", # colors checkbox - dark blue
-        bg = "#1A558C",
-        activebackground = "#1A558C",
-        fg = "#FFFFFF", # colors check mark - white
-        activeforeground = "#FFFFFF"
+        bg = themeColors["background"],
+        activebackground = themeColors["background"],
+        **rowStyles["check"] # the rest of its look is shared by every row
     )
-    newListCheck.grid(row = tasksInList, column = 1, padx = 5, sticky = "ew") # places checkbox in the main window list
-    
-    newListTask = tk.Label( # generates item task
+    slot["task"] = tk.Label( # generates the recycled task label
         tasksFrame,
-        text = newTask,
-        font = ("Arial Rounded MT Bold", 15), # changes the font and text size
-        fg = "#FFFFFF", # colors the text - white
-        wraplength = 300, # enables word-wrapping on the text
-        bg = "#1A558C" # prevents a gray block in the window
+        text = "",
+        fg = themeColors["text"],
+        bg = themeColors["background"],
+        **rowStyles["recycledLabel"]
     )
-    newListTask.grid(row = tasksInList, column = 2, padx = 5, sticky = "ew")
-    
-    newListDeadline = tk.Label( # generates item task
+    slot["deadline"] = tk.Label( # generates the recycled deadline label
         tasksFrame,
-        text = newDeadline,
-        font = ("Arial Rounded MT Bold", 15), # changes the font and text size
-        fg = "#FFFFFF", # colors the text - white
-        bg = "#1A558C" # prevents a gray block in the window
+        text = "",
+        fg = themeColors["text"],
+        bg = themeColors["background"],
+        **rowStyles["recycledLabel"]
     )
-    newListDeadline.grid(row = tasksInList, column = 3, padx = 5, sticky = "ew")
-    
-    newListDelete = tk.Button( # generates delete button unique to the new item
+    slot["delete"] = tk.Button( # generates the recycled delete button
         tasksFrame,
-        command = lambda: deleteTask(newListDelete), 
-        text = "Delete",
-        font = ("Arial Rounded MT Bold", 15),
-        bg = "#00A2E8",
-        fg = "#FFFFFF",
-        activeforeground = "#00A2E8"
+        **rowStyles["delete"]
     )
-    newListDelete.grid(row = tasksInList, column = 4, padx = 5, sticky = "ew")
+    slot["widgets"] = (slot["checkbox"], slot["task"], slot["deadline"], slot["delete"])
+    tagRowWidgets(slot["widgets"]) # clicks find the slot's current task through its grid row
+    
+    for columnNumber, widget in enumerate(slot["widgets"], start = 1): # places the row, then hides it until it is needed
+        widget.grid(row = slotNumber, column = columnNumber, padx = 5, sticky = "ew")
+        widget.grid_remove()
+    
+    return slot
+
+def resizeVirtualPool():
+    global virtualRowHeight
+    
+    if not virtualRowPool: # the first row tells us how tall every row is
+        virtualRowPool.append(createVirtualRow(0))
+        tasksFrame.update_idletasks() # lets Tk work out the row's size
+        virtualRowHeight = max(widget.winfo_reqheight() for widget in virtualRowPool[0]["widgets"])
+    measureVirtualColumns() # the window may be wider or narrower than before
+    
+    visibleRows = max(1, tasksCanvas.winfo_height() // virtualRowHeight)
+    while len(virtualRowPool) < visibleRows + 1: # one extra row covers a partly visible row at the bottom
+        virtualRowPool.append(createVirtualRow(len(virtualRowPool)))
+    
+    renderVirtualRows()
+
+def renderVirtualRows():
+    global virtualFirstRow
+    
+    totalRows = shownTaskCount()
+    visibleRows = max(1, tasksCanvas.winfo_height() // virtualRowHeight)
+    virtualFirstRow = max(0, min(virtualFirstRow, totalRows - visibleRows)) # keeps the list from scrolling past its end
+    if filteredIds is None:
+        visibleTasks = taskStore.page(virtualFirstRow, visibleRows + 1) # only the tasks in view are read
+    else: # only the matching tasks in view are read
+        visibleTasks = [taskStore.get(taskId) for taskId in filteredIds[virtualFirstRow:virtualFirstRow + visibleRows + 1]]
+    now = time.time()
+    
+    for slotNumber, slot in enumerate(virtualRowPool):
+        if slotNumber < len(visibleTasks):
+            record = visibleTasks[slotNumber]
+            shown = record.values() + (textColor(record, now), rowBackground(record.taskId), virtualTextWidths)
+            if slot["taskId"] != record.taskId or slot["shown"] != shown: # only touches rows whose contents changed
+                showCompletion(slot["checkbox"], record.completed)
+                slot["checkbox"].config(bg = shown[4], activebackground = shown[4])
+                slot["task"].config(text = fitText(record.task, virtualTextWidths[0]), fg = shown[3], bg = shown[4]) # as much as the column has room for
+                slot["deadline"].config(text = fitText(record.deadline, virtualTextWidths[1]), fg = shown[3], bg = shown[4])
+                slot["taskId"] = record.taskId
+                slot["shown"] = shown
+            if not slot["gridded"]:
+                for widget in slot["widgets"]:
+                    widget.grid()
+                slot["gridded"] = True
+        elif slot["gridded"]: # hides rows past the end of the list
+            for widget in slot["widgets"]:
+                widget.grid_remove()
+            slot["taskId"] = None
+            slot["shown"] = None
+            slot["gridded"] = False
+    
+    if totalRows: # sizes the scrollbar handle to the visible share of the list
+        scrollbar.set(virtualFirstRow / totalRows, min(1.0, (virtualFirstRow + visibleRows) / totalRows))
+    else:
+        scrollbar.set(0.0, 1.0)
+
+def scrollVirtualList(*args):
+    global virtualFirstRow
+    
+    visibleRows = max(1, tasksCanvas.winfo_height() // virtualRowHeight)
+    if args[0] == "moveto": # the handle was dragged
+        virtualFirstRow = int(float(args[1]) * shownTaskCount())
+    elif args[0] == "scroll": # an arrow or the trough was clicked
+        step = int(args[1])
+        if args[2] == "pages":
+            step *= visibleRows
+        virtualFirstRow += step
+    renderVirtualRows()
+
+def scrollVirtualWheel(event):
+    if event.num == 4 or event.delta > 0: # Linux reports the wheel as buttons 4 and 5
+        scrollVirtualList("scroll", -3, "units")
+    else:
+        scrollVirtualList("scroll", 3, "units")
+
+def enterVirtualMode():
+    global virtualMode
+    
+    clearTaskRows() # clears one-widget-per-task rows
+    virtualRowPool.clear()
+    virtualMode = True
+    
+    tasksCanvas.yview_moveto(0) # the canvas stays still; the rows themselves change
+    tasksCanvas.configure(yscrollcommand = "")
+    scrollbar.config(command = scrollVirtualList)
+    for widget in (tasksCanvas, tasksFrame): # the wheel also works over empty space in the list
+        widget.bind("<MouseWheel>", scrollVirtualWheel)
+        widget.bind("<Button-4>", scrollVirtualWheel)
+        widget.bind("<Button-5>", scrollVirtualWheel)
+    for columnNumber in (2, 3): # the task and deadline columns split the room evenly, so their text can be cut to a known width
+        tasksFrame.columnconfigure(columnNumber, uniform = "recycledText")
+    resizeVirtualPool()
+
+def leaveVirtualMode():
+    global virtualMode
+    global virtualFirstRow
+    
+    for widget in tasksFrame.winfo_children(): # clears the recycled rows
+        destroyRowWidget(widget)
+    virtualRowPool.clear()
+    virtualMode = False
+    virtualFirstRow = 0
+    
+    tasksCanvas.configure(yscrollcommand = scrollbar.set) # hands scrolling back to the canvas
+    scrollbar.config(command = tasksCanvas.yview)
+    for widget in (tasksCanvas, tasksFrame):
+        widget.unbind("<MouseWheel>")
+        widget.unbind("<Button-4>")
+        widget.unbind("<Button-5>")
+    for columnNumber in (2, 3): # wrapped rows size their columns to their text again
+        tasksFrame.columnconfigure(columnNumber, uniform = "")
+
+def clearTaskRows():
+    global nextGridRow
+    
+    for widget in tasksFrame.winfo_children(): # clears current rows
+        destroyRowWidget(widget)
+    taskRows.clear()
+    rowTasks.clear()
+    hiddenRows.clear()
+    nextGridRow = 1
+
+def takeTaskRows():
+    """Empties the list's bookkeeping, returning its rows bottom to top so they can be given to other tasks."""
+    global nextGridRow
     
-    dataReferences[tasksInList] = createCheck # enables checkbox status
-    taskCompletion.config(text = f"{tasksCompleted}/{tasksInList} Tasks Completed") # updates the tracker
+    spareRows = [taskRows[rowTasks[rowNumber]] for rowNumber in sorted(rowTasks, reverse = True)]
+    taskRows.clear()
+    rowTasks.clear()
+    hiddenRows.clear() # hidden rows are shown again or hidden anew as they are reused
+    nextGridRow = 1
+    return spareRows
+
+def rebuildTaskRows():
+    if shouldUseVirtualRows():
+        if virtualMode:
+            renderVirtualRows()
+        else:
+            enterVirtualMode()
+    else:
+        if virtualMode:
+            leaveVirtualMode()
+            spareRows = []
+        else:
+            spareRows = takeTaskRows() # the rows already built are reused for the new list, top to bottom
+        for record in taskStore:
+            createTaskRow(record, spareRows.pop() if spareRows else None)
+        for row in spareRows: # the new list is shorter, so the rest go
+            for widget in row["widgets"]:
+                destroyRowWidget(widget)
 
-def newTaskWindow():
+def newTaskWindow(editTaskId = None):
+    editRecord = taskStore.get(editTaskId) if editTaskId is not None else None # the task being edited, if any
+    if editTaskId is not None and editRecord is None: # the task was deleted before it could be edited
+        return
+    
     newTaskCreation = tk.Toplevel(taskList) # creates a new window
-    newTaskCreation.title("Add Task") # titles the window
+    newTaskCreation.title("Edit Task" if editRecord else "Add Task") # titles the window
     newTaskCreation.config(bg = "#1A558C") # colors the window - dark blue
     
     creationFrame = tk.Frame( # creates a frame for user interaction
@@ -194,8 +814,8 @@ def newTaskWindow():
     
     textNewTask = tk.Label( # creates a label for the first text entry
         creationLabelFrame,
-        text = "New Task: ",
-        font = ("Arial Rounded MT Bold", 15, "bold"), # changes the font and text size
+        text = "Task: " if editRecord else "New Task: ",
+        font = themeFonts["label"], # changes the font and text size
         fg = "#FFFFFF", # colors the text - white
         bg = "#1A558C" # prevents a gray block in the window
     )
@@ -208,7 +828,7 @@ def newTaskWindow():
     textNewDeadline = tk.Label( # creates a label for the second text entry
         creationLabelFrame,
         text = "Deadline: ",
-        font = ("Arial Rounded MT Bold", 15, "bold"), # changes the font and text size
+        font = themeFonts["label"], # changes the font and text size
         fg = "#FFFFFF", # colors the text - white
         bg = "#1A558C" # prevents a gray block in the window
     )
@@ -221,7 +841,7 @@ def newTaskWindow():
     entryNewTask = tk.Entry( # creates the first entry field 
         creationEntryFrame,
         width = 25,
-        font = ("Arial Rounded MT Bold", 15), # changes the font and text size
+        font = themeFonts["body"], # changes the font and text size
         fg = "#00A2E8" # colors the text - light blue
     )
     entryNewTask.pack( # places the entry field within the frame
@@ -232,7 +852,7 @@ def newTaskWindow():
     entryNewDeadline = tk.Entry( # creates the second entry field
         creationEntryFrame,
         width = 25,
-        font = ("Arial Rounded MT Bold", 15), # changes the font and text size
+        font = themeFonts["body"], # changes the font and text size
         fg = "#00A2E8" # colors the text - light blue
     )
     entryNewDeadline.pack( # places the entry field within the frame
@@ -240,6 +860,10 @@ def newTaskWindow():
         pady = 5
     )
     
+    if editRecord: # starts from the task's current text
+        entryNewTask.insert(0, editRecord.task)
+        entryNewDeadline.insert(0, editRecord.deadline)
+    
     confirmationFrame = tk.Frame( # creates a frame for the button
         newTaskCreation,
         bg = "#1A558C" # colors the frame - dark blue
@@ -251,9 +875,12 @@ def newTaskWindow():
     
     confirmAddition = tk.Button( # creates a button to confirm item geneation
         confirmationFrame,
-        command = lambda: [addNewTask(entryNewTask.get(), entryNewDeadline.get()), newTaskCreation.destroy()], 
-        text = "Add New Task",
-        font = ("Arial Rounded MT Bold", 15), # changes font and text size
+        command = lambda: [
+            editTask(editTaskId, entryNewTask.get(), entryNewDeadline.get()) if editRecord else addNewTask(entryNewTask.get(), entryNewDeadline.get()),
+            newTaskCreation.destroy()
+        ],
+        text = "Save Changes" if editRecord else "Add New Task",
+        font = themeFonts["body"], # changes font and text size
         bg = "#00A2E8", # colors the button
         activebackground = "#FFFFFF",
         fg = "#FFFFFF", # colors the text
@@ -265,21 +892,64 @@ def newTaskWindow():
     taskList.wait_window(newTaskCreation) # fully pauses the main window while this window is open
 
 def tutorialScreen():
+    global helpWindow
+    
+    if helpWindow is not None and helpWindow.winfo_exists(): # shows the window from last time instead of building a new one
+        helpWindow.deiconify()
+        helpWindow.lift()
+        helpWindow.focus_set()
+        return
+    helpWindow = buildHelpWindow()
+
+def cacheHelpImage(imagePath, image):
+    helpImageCache[imagePath] = image
+    helpImageCache.move_to_end(imagePath)
+    while len(helpImageCache) > helpImageCacheSize: # forgets the image shown longest ago
+        helpImageCache.popitem(last = False)
+
+def helpImage(imagePath):
+    image = helpImageCache.get(imagePath)
+    if image is None: # not shown or preloaded yet, so it is decoded now
+        image = tk.PhotoImage(file = imagePath)
+    cacheHelpImage(imagePath, image)
+    return image
+
+def preloadHelpImage(imagePath):
+    if imagePath is None or imagePath in helpImageCache or imagePath in helpImagesLoading:
+        return
+    helpImagesLoading.add(imagePath)
+    
+    def readImage(): # runs on the worker thread; only Tk's own thread may make the PhotoImage
+        with open(imagePath, 'rb') as imageFile:
+            return base64.b64encode(imageFile.read())
+    
+    def decodeImage(imageData):
+        helpImagesLoading.discard(imagePath)
+        try:
+            cacheHelpImage(imagePath, tk.PhotoImage(data = imageData))
+        except tk.TclError: # left for the page itself to report, if it is ever shown
+            pass
+    
+    ioWorker.submit(readImage, decodeImage, lambda error: helpImagesLoading.discard(imagePath))
+    watchBackgroundWork()
+
+def buildHelpWindow():
     tutorialWindow = tk.Toplevel(taskList) # creates a new window
     tutorialWindow.title("Help")
     tutorialWindow.config(bg = "#1A558C") # colors the window - dark blue
+    tutorialWindow.protocol("WM_DELETE_WINDOW", tutorialWindow.withdraw) # hides the window so it can be shown again instantly
     
     pageNumber = 0 # the current page. Python indices begin at 0
     totalPages = 8
     
     tutorialTexts = [ # stores text, organized by page
         "Page 1: Table of Contents\nPage 2: Add Task\nPage 3: Task Completion\nPage 4: Completion Tracker\nPage 5: Deleting Tasks\nPage 6: Saving Data\nPage 7: Loading Data\nPage 8: Help",
-        "To add a new item to list, click the Add Task button. This will take you to a new window, where you can type in the description of the task and its deadline. There is no required format for either. Once done, click \"Add New Task\" to add it to the list in the main window, or cancel by clicking the x button in the top right corner.",
+        "To add a new item to list, click the Add Task button. This will take you to a new window, where you can type in the description of the task and its deadline. There is no required format for either, but deadlines written as dates (like \"10/31/2026\", \"Oct 31\", or \"friday 5pm\") are tracked, and the task turns red once it is overdue, with a reminder popping up to name it. Once done, click \"Add New Task\" to add it to the list in the main window, or cancel by clicking the x button in the top right corner. To change a task later, double-click it.",
         "When you complete a task, you can mark it by clicking the box to the left. This will place a checkmark inside the box. You can remove the checkmark by clicking the box again.",
-        "As you add and complete tasks, you may notice text in the window header changing. This text tracks your progress in the form of a fraction: the number of tasks you have marked as completed over the total number of tasks in the list. These numbers update automatically as you add, complete, and delete tasks.",
-        "If you add a task by accident, or simply no longer need it, you can click the Delete button on the same row as that task. This will remove the task description, deadline, completion status, and the button itself from the list. Note that items that are deleted this way will be lost forever; it is recommended to save program data when tasks are added or completed.",
-        "To save your progress, click the Save button in the main window. This will cause your computer system's file explorer to appear, allowing you to choose the location and name of the file. It is recommended to store it in a location that is easily accessed, with a file name that indicates the purpose of the list.",
-        "The Load button on the main window allows you to restore program data from a previous session, so long as you have previously saved it. When you load data from a file, all existing data in the file is lost, so be careful not to lose anything by mistake! The program comes with a sample \"StarterPack\" save file, so you can test this right away if you haven't already.",
+        "As you add and complete tasks, you may notice text in the window header changing. This text tracks your progress in the form of a fraction: the number of tasks you have marked as completed over the total number of tasks in the list. These numbers update automatically as you add, complete, and delete tasks. To find a task, type part of it into the Search box in the header; only tasks containing every word you type are shown, and the tracker counts how many were found. Clear the box (or press Escape) to see the whole list again.",
+        "If you add a task by accident, or simply no longer need it, you can click the Delete button on the same row as that task. This will remove the task description, deadline, completion status, and the button itself from the list. To change many tasks at once, click a task's description to select it, Ctrl+click to add or remove more, or Shift+click to select everything in between; the buttons under Add Task then complete, uncomplete, or delete every selected task. Delete Completed removes every checked task, and Select Overdue selects every task past its deadline. If you delete something by mistake, click Undo (or press Ctrl+Z) to bring it back; Redo (Ctrl+Y) makes the change again. Undo history is lost when the program closes or another list is shown, so it is still recommended to save program data when tasks are added or completed.",
+        "To save your progress, click the Save button in the main window. This will cause your computer system's file explorer to appear, allowing you to choose the location and name of the file. It is recommended to store it in a location that is easily accessed, with a file name that indicates the purpose of the list. If the Autosave box is checked, every change after that is saved to the file automatically. For very long lists, choose \"Compact task files\" (a name ending in \".tlist\") for a smaller file that loads faster. To open the list in a spreadsheet or calendar program, choose \"CSV files\" or \"iCalendar files\" instead.",
+        "The Load button on the main window allows you to restore program data from a previous session, so long as you have previously saved it. When you load data from a file, all existing data in the list is replaced by the file's, so be careful not to lose anything by mistake! Loading the file the list came from again only changes the tasks that are different. If the Watch File box is checked, changes other programs make to the open file (like the command line) show up in the list within a second. The lists open when you close the program are opened again, just as they were, the next time it starts. The program comes with a sample \"StarterPack\" save file, so you can test this right away if you haven't already. To add tasks from another program without replacing your own, click Import and choose a CSV or iCalendar (.ics) file; CSV files need a column named \"task\" (or \"description\" or \"title\"), and may also have \"deadline\" and \"completed\" columns. To keep several lists open at once, click New List (or press Ctrl+T) above the search box and load or build the new list in its own tab; click a tab (or press Ctrl+Tab) to switch lists, and Close List (Ctrl+W) to close the one shown. To work on one list together with other people on this computer, have one person share its file by running \"python -m tasklist -f FILE serve\", then click Join Shared List in each window; everyone's changes show up in everyone's list as they are made.",
         "You can review this tutorial at any time by pressing the Help button on the main window. A more in-depth guide exists in the User Manual that came with the program."
     ]
     tutorialImagePaths = [ # stores images, organized by page
@@ -308,7 +978,7 @@ def tutorialScreen():
         text = "",
         wraplength = 675,
         justify = tk.CENTER,
-        font = ("Arial Rounded MT Bold", 15),
+        font = themeFonts["body"],
         fg = "#FFFFFF",
         bg = "#1A558C"
     )
@@ -328,7 +998,7 @@ def tutorialScreen():
         text = "",
         wraplength = 675,
         justify = tk.CENTER,
-        font = ("Arial Rounded MT Bold", 15),
+        font = themeFonts["body"],
         fg = "#FFFFFF",
         bg = "#1A558C"
     )
@@ -343,7 +1013,7 @@ def tutorialScreen():
     pageCount = tk.Label(
         pagination,
         text = f"Page {pageNumber + 1} of {totalPages}",
-        font = ("Arial Rounded MT Bold", 15), # changes the font and text size
+        font = themeFonts["body"], # changes the font and text size
         fg = "#FFFFFF", # colors the text - white
         bg = "#00A2E8" # prevents a gray block in the window
     )
@@ -358,7 +1028,7 @@ def tutorialScreen():
         imagePath = tutorialImagePaths[pageNumber] # determines the specific image to be used
         if imagePath: # if there is an image on the current page
             try:
-                currentImage = tk.PhotoImage(file = imagePath)
+                currentImage = helpImage(imagePath) # decoded once, then reused
                 imageDisplay.config(image = currentImage)
                 imageDisplay.image = currentImage
             except tk.TclError as error:
@@ -368,6 +1038,9 @@ def tutorialScreen():
             imageDisplay.config(image = None)
             imageDisplay.image = None
         pageCount.config(text = f"Page {pageNumber + 1} of {totalPages}")
+        for neighbour in (pageNumber - 1, pageNumber + 1): # gets the next flip's image ready
+            if 0 <= neighbour < totalPages:
+                preloadHelpImage(tutorialImagePaths[neighbour])
     
     def flipPageBack():
         nonlocal pageNumber
@@ -385,7 +1058,7 @@ def tutorialScreen():
         pagination,
         command = flipPageBack,
         text = "Back",
-        font = ("Arial Rounded MT Bold", 15), # changes font and text size
+        font = themeFonts["body"], # changes font and text size
         bg = "#00A2E8", # colors the button
         activebackground = "#FFFFFF",
         fg = "#FFFFFF", # colors the text
@@ -400,7 +1073,7 @@ def tutorialScreen():
         pagination,
         command = flipPageNext,
         text = "Next",
-        font = ("Arial Rounded MT Bold", 15), # changes font and text size
+        font = themeFonts["body"], # changes font and text size
         bg = "#00A2E8", # colors the button
         activebackground = "#FFFFFF",
         fg = "#FFFFFF", # colors the text
@@ -412,293 +1085,1632 @@ def tutorialScreen():
     )
     
     updatePage()
+    return tutorialWindow
 
 def loadFromFile():
-    global tasksInList
-    global tasksCompleted
-    global dataReferences
+    from tkinter import filedialog
     
     filePath = filedialog.askopenfilename( # determines the constraints of the file explorer
         defaultextension = ".json",
-        filetypes = [("JSON files (.json)", "*.json"), ("All files", "*.*")],
+        filetypes = [("JSON files (.json)", "*.json"), ("Compact task files (.tlist)", "*.tlist"), ("Task databases (.db)", "*.db"), ("CSV files (.csv)", "*.csv"), ("iCalendar files (.ics)", "*.ics"), ("All files", "*.*")],
         title = "Open"
     )
     
-    if filePath: # will only proceed if the user indicated a file
+    if not filePath: # will only proceed if the user indicated a file
+        return
+    if importState is not None: # the imported tasks are still going into the shown list
+        print("Please wait for the import to finish before loading a file.")
+        return
+    
+    if isDatabasePath(filePath): # databases are read a page at a time, so there is nothing to load up front
         try:
-            with open(filePath, 'r') as loadFile:
-                openedFile = json.load(loadFile)
-            
-            for widget in tasksFrame.winfo_children(): # clears current program status
-                widget.destroy()
-            tasksInList = 0
-            tasksCompleted = 0
-            dataReferences.clear()
-            
-            for rowNumber, taskData in openedFile.items(): # loads status from file into program
-                completedStatus = taskData.get("completed", 0)
-                taskDescription = taskData.get("task", "")
-                taskDeadline = taskData.get("deadline", "")
-                
-                tasksInList += 1 # counts added tasks
-                
-                createCheck = tk.IntVar(value = completedStatus) # loads completion status
-                newListCheck = tk.Checkbutton( # creates checkbox from loaded data
-                    tasksFrame,
-                    variable = createCheck,
-                    command = lambda var=createCheck: updateTaskCompletion(var),
-                    selectcolor = "#1A558C",
-                    bg = "#1A558C",
-                    activebackground = "#1A558C",
-                    fg = "#FFFFFF",
-                    activeforeground = "#FFFFFF"
-                )
-                newListCheck.grid(row = int(rowNumber), column = 1, padx = 5, sticky = "ew") # places checkbox in the main window list
-                dataReferences[int(rowNumber)] = createCheck # automatically checks the box (if needed)
-                if completedStatus == 1:
-                    tasksCompleted += 1
-                newListTask = tk.Label( # generates item task
-                    tasksFrame,
-                    text = taskDescription,
-                    font = ("Arial Rounded MT Bold", 15), # changes the font and text size
-                    fg = "#FFFFFF", # colors the text - white
-                    wraplength = 300, # enables word-wrapping on the text
-                    bg = "#1A558C" # prevents a gray block in the window
-                )
-                newListTask.grid(row = int(rowNumber), column = 2, padx = 5, sticky = "ew")
-                newListDeadline = tk.Label( # generates item task
-                    tasksFrame,
-                    text = taskDeadline,
-                    font = ("Arial Rounded MT Bold", 15), # changes the font and text size
-                    fg = "#FFFFFF", # colors the text - white
-                    wraplength = 300, # enables word-wrapping on the text
-                    bg = "#1A558C" # prevents a gray block in the window
-                )
-                newListDeadline.grid(row = int(rowNumber), column = 3, padx = 5, sticky = "ew")
-                newListDelete = tk.Button( # generates delete button unique to the new item
-                    tasksFrame,
-                    command = lambda: deleteTask(newListDelete), 
-                    text = "Delete",
-                    font = ("Arial Rounded MT Bold", 15),
-                    bg = "#00A2E8",
-                    fg = "#FFFFFF",
-                    activeforeground = "#00A2E8"
-                )
-                newListDelete.grid(row = int(rowNumber), column = 4, padx = 5, sticky = "ew")
-            
-            taskCompletion.config(text = f"{tasksCompleted}/{tasksInList} Tasks Completed") # updates tracker
-            print(f"File \"{filePath}\" loaded successfully.") # console terminal output
-        except FileNotFoundError:
-            print(f"Error: File not found at \"{filePath}\".")
-        except json.JSONDecodeError:
-            print(f"Error: Could not decode JSON from \"{filePath}\". The file might be corrupted.")
+            openDatabase(filePath)
         except Exception as error:
-            print(f"An unexpected error occurred: {error}")
+            failLoad(filePath, error)
+        return
+    runInBackground( # the file is read and decoded on the worker thread, including autosaved changes
+        lambda: readJournaledFile(filePath),
+        lambda records: openLoadedFile(records, filePath),
+        lambda error: failLoad(filePath, error),
+        "Reading"
+    )
 
-### CREATE MAIN WINDOW
+def openLoadedFile(records, filePath):
+    if len(taskStore) == 0 or isinstance(taskStore, SqliteTaskStore): # nothing to compare with, so the tasks are added a batch at a time
+        startIncrementalLoad(records, filePath)
+    else: # only the tasks that differ from the list are changed
+        reconcileWithFile(records, filePath)
+
+def failLoad(filePath, error):
+    if isinstance(error, FileNotFoundError):
+        print(f"Error: File not found at \"{filePath}\".")
+    elif isinstance(error, json.JSONDecodeError):
+        print(f"Error: Could not decode JSON from \"{filePath}\". The file might be corrupted.")
+    elif isinstance(error, ValueError): # a compact file that is cut short or from a newer version
+        print(f"Error: Could not read \"{filePath}\": {error}.")
+    else:
+        print(f"An unexpected error occurred: {error}")
 
-taskList = tk.Tk() # creates the window
-taskList.title("Task List") # titles the window
-taskList.config(bg = "#1A558C") # colors the window - dark blue
-
-### CREATE MAIN WINDOW HEADER
-
-headerFrame = tk.Frame( # creates the frame
-    taskList,
-    bg = "#00A2E8" # colors the frame - light blue
-)
-headerFrame.pack( # places the header in the main window
-    side = "top",
-    fill = "x" # ensures the header stretches with the window
-)
-
-toDoList = tk.Label( # creates text "To-Do List" in the header
-    headerFrame,
-    text = "To-Do List",
-    font = ("Arial Rounded MT Bold", 30, "bold"), # changes the font and text size
-    fg = "#FFFFFF", # colors the text - white
-    bg = "#00A2E8" # prevents a gray block in the window
-)
-toDoList.pack( # places the text within the frame
-    anchor = "center",
-    expand = True,
-    fill = "both",
-    padx = 15,
-    pady = 5
-)
-
-global taskCompletion
-taskCompletion = tk.Label( # creates a label to track user progress
-    headerFrame,
-    text = f"{tasksCompleted}/{tasksInList} Tasks Completed",
-    font = ("Arial Rounded MT Bold", 15), # changes the font and text size
-    fg = "#FFFFFF", # colors the text - white
-    bg = "#00A2E8" # prevents a gray block in the window
-)
-taskCompletion.pack( # places the tracker within the frame
-    side = "bottom",
-    anchor = "center",
-    expand = True,
-    fill = "both",
-    pady = 10
-)
-
-### CREATE MAIN WINDOW BUTTON FRAME
-
-buttonFrame = tk.Frame(taskList) # creates the frame
-buttonFrame.pack( # places the frame in the main window
-    side = "bottom",
-    fill = "x" # ensures the frame stretches with the window
-)
-buttonFrame.config(bg = "#00A2E8") # colors the frame - light blue
-
-newItem = tk.Button( # creates a button to generate new items
-    buttonFrame,
-    command = newTaskWindow,
-    text = "Add Task",
-    font = ("Arial Rounded MT Bold", 15), # changes font and text size
-    bg = "#00A2E8", # colors the button
-    activebackground = "#FFFFFF",
-    fg = "#FFFFFF", # colors the text
-    activeforeground = "#00A2E8"
-)
-newItem.pack( # places the button within the frame
-    side = "top",
-    fill = "x"
-)
-
-helpButton = tk.Button( # creates a button to load data from a file
-    buttonFrame,
-    command = tutorialScreen,
-    text = "Help",
-    font = ("Arial Rounded MT Bold", 15), # changes font and text size
-    bg = "#00A2E8", # colors the button
-    activebackground = "#FFFFFF",
-    fg = "#FFFFFF", # colors the text
-    activeforeground = "#00A2E8"
-)
-helpButton.pack( # places the button within the frame
-    side = "left",
-    fill = "x",
-    expand = True
-)
-
-saveData = tk.Button( # creates a button to save data to a file
-    buttonFrame,
-    command = saveToFile,
-    text = "Save",
-    font = ("Arial Rounded MT Bold", 15), # changes font and text size
-    bg = "#00A2E8", # colors the button
-    activebackground = "#FFFFFF",
-    fg = "#FFFFFF", # colors the text
-    activeforeground = "#00A2E8"
-)
-saveData.pack( # places the button within the frame
-    side = "left",
-    fill = "x",
-    expand = True
-)
-
-loadData = tk.Button( # creates a button to load data from a file
-    buttonFrame,
-    command = loadFromFile,
-    text = "Load",
-    font = ("Arial Rounded MT Bold", 15), # changes font and text size
-    bg = "#00A2E8", # colors the button
-    activebackground = "#FFFFFF",
-    fg = "#FFFFFF", # colors the text
-    activeforeground = "#00A2E8"
-)
-loadData.pack( # places the button within the frame
-    side = "left",
-    fill = "x",
-    expand = True
-)
-
-### CREATE LIST FRAME
-
-listFrame = tk.Frame(taskList) # creates the frame
-listFrame.pack(fill = "both", expand = True) # places the frame in the main window, ensures it stretches with the window
-listFrame.config(bg = "#1A558C") # colors the frame - dark blue
-
-columnFrame = tk.Frame(listFrame) # creates a frame for column headers
-columnFrame.pack( # places the frame in the window
-    side = "top",
-    fill = "x"
-)
-columnFrame.config(bg = "#1A558C") # colors the frame - dark blue
-columnFrame.columnconfigure(1, weight = 0, minsize = 30) # spaces columns
-columnFrame.columnconfigure(2, weight = 1, minsize = 200)
-columnFrame.columnconfigure(3, weight = 1, minsize = 150)
-columnFrame.columnconfigure(4, weight = 0, minsize = 80)
-columnFrame.columnconfigure(5, weight = 0, minsize = 35)
-
-columnTask = tk.Label( # creates column2 header "Task"
-    columnFrame,
-    text = "Task",
-    font = ("Arial Rounded MT Bold", 20, "bold"), # changes the font and text size
-    fg = "#FFFFFF", # colors the text - white
-    bg = "#1A558C" # prevents a gray block in the window
-)
-columnTask.grid( # places the text within the frame
-    row = 0,
-    column = 2,
-    padx = 5
-)
-
-columnDeadline = tk.Label( # creates column3 header "Deadline"
-    columnFrame,
-    text = "Deadline",
-    font = ("Arial Rounded MT Bold", 20, "bold"), # changes the font and text size
-    fg = "#FFFFFF", # colors the text - white
-    bg = "#1A558C" # prevents a gray block in the window
-)
-columnDeadline.grid( # places the text within the frame
-    row = 0,
-    column = 3,
-    padx = 5
-)
-
-tasksCanvas = tk.Canvas(taskList) # creates a canvas for the list
-tasksCanvas.pack( # places canvas in the window
-    side = "left",
-    fill = "both",
-    expand = True
-)
-tasksCanvas.config(bg = "#1A558C", highlightthickness = 0) # colors the canvas - dark blue
-
-scrollbar = tk.Scrollbar( # adds a scrollbar to the task list
-    taskList,
-    orient = "vertical",
-    command=tasksCanvas.yview
-)
-scrollbar.pack( # places the scrollbar in the window
-    side="right",
-    fill="y")
-tasksCanvas.configure(yscrollcommand=scrollbar.set) # connects the scrollbar to the canvas
-tasksCanvas.bind('<Configure>', lambda e: tasksCanvas.configure(scrollregion = tasksCanvas.bbox("all"))) # enables scrolling functionality
-
-tasksFrame = tk.Frame(tasksCanvas) # creates a frame for added items
-tasksFrame.pack(fill = "both", expand = True) # places the frame in the window
-tasksFrame.config(bg="#1A558C") # colors the frame - dark blue
-tasksFrame.columnconfigure(1, weight = 0, minsize = 30) # spaces columns
-tasksFrame.columnconfigure(2, weight = 1, minsize = 200)
-tasksFrame.columnconfigure(3, weight = 1, minsize = 150)
-tasksFrame.columnconfigure(4, weight = 0, minsize = 80)
+### AUTOSAVE
+"""
+While autosave is on, every change is appended to a journal beside the current file
+instead of rewriting the whole file, so each change costs the same however long the list is.
+"""
 
-### ENABLE SCROLLING
+def toggleAutosave():
+    if autosaveEnabled.get() == 1:
+        if currentFilePath is None: # the journal needs a file to sit beside
+            saveToFile()
+        if currentFilePath is None: # the user closed the save window without choosing
+            autosaveEnabled.set(0)
+            return
+        openJournal()
+    else:
+        closeJournal()
+
+def openJournal():
+    global taskJournal
+    
+    closeJournal()
+    if currentFilePath is None:
+        return
+    if isinstance(taskStore, SqliteTaskStore): # databases already save every change as it is made
+        return
+    try:
+        taskJournal = TaskJournal(currentFilePath, taskStore)
+        taskJournal.compact() # captures any changes made before autosave was turned on
+        taskList.after(journalSyncDelay, syncJournal)
+        resetFileWatcher() # stops watching the journal this program now writes to
+        print(f"Autosaving to \"{currentFilePath}\".")
+    except OSError as error:
+        print(f"An unexpected error occurred: {error}")
+        taskJournal = None
+        autosaveEnabled.set(0)
 
-tasksCanvas.create_window((0, 0), window=tasksFrame, anchor="nw")
+def syncJournal():
+    if taskJournal is not None: # stops rescheduling once autosave is off
+        taskJournal.sync() # batches the disk syncs for everything changed in the last second
+        taskList.after(journalSyncDelay, syncJournal)
 
-def updateScrollRegion(event):
-    tasksCanvas.configure(scrollregion=tasksFrame.bbox("all"))
+def closeJournal():
+    global taskJournal
+    
+    if taskJournal is not None:
+        taskJournal.close()
+        taskJournal = None
+        resetFileWatcher()
+
+def closeMainWindow():
+    global importState
+    
+    if importState is not None and importState["job"] is not None:
+        taskList.after_cancel(importState["job"])
+    importState = None # an import in progress stops after the chunk being read
+    ioWorker.shutdown() # lets a save in progress finish first
+    if loadState is not None and not loadState["restoring"]: # a half-loaded file isn't kept; the list from before it is
+        cancelLoad()
+    if taskJournal is not None: # makes sure every change is on disk
+        closeJournal()
+        workspace.active.changed = False # every change is in the file or its journal
+    saveCurrentSession() # before the shared lists are left and the tabs closed
+    undoLog.close() # removes the undo history's temporary file
+    if profiling.isCapturing():
+        toggleCapture()
+    if profiling.enabled: # leaves a summary of the session's command timings in the console
+        for line in profiling.report():
+            print(line)
+    for tab in list(syncClients):
+        leaveSharedList(tab)
+    workspace.close() # closes every tab's database and removes the temporary files of unloaded lists
+    taskList.destroy()
+
+### BACKGROUND FILE WORK
+"""
+File reading, writing, and encoding run on a worker thread.
+The window's thread checks for finished work with after() and does the widget work itself.
+"""
+
+def runInBackground(work, onDone, onError, busyText):
+    ioWorker.submit(work, onDone, onError)
+    busyIndicator.config(text = f"{busyText}...")
+    if not busyIndicator.winfo_ismapped():
+        busyIndicator.pack(side = "right", padx = 10)
+    watchBackgroundWork()
+
+def watchBackgroundWork():
+    global ioPollJob
+    
+    if ioPollJob is None: # one check at a time is enough for any amount of work
+        ioPollJob = taskList.after(ioPollDelay, pollBackgroundWork)
+
+def pollBackgroundWork():
+    global ioPollJob
+    
+    ioWorker.deliver() # runs the finished work's callbacks here, on the window's thread
+    if ioWorker.busy():
+        ioPollJob = taskList.after(ioPollDelay, pollBackgroundWork)
+    else:
+        ioPollJob = None
+        busyIndicator.pack_forget() # hides the busy indicator
+
+### DATABASE LISTS
+"""
+Very large lists can be kept in an SQLite database instead of a JSON file.
+The database becomes the task store itself: rows are read as they scroll into view,
+and every change is written straight away as a single-row update.
+"""
+
+def useTaskStore(store):
+    global taskStore
+    
+    if store is taskStore:
+        return
+    taskStore.unsubscribe(onTasksChanged)
+    deadlineIndex.attach(store) # the indexes follow the list that is shown
+    reminderQueue.attach(store) # only the shown list's tasks are reminded of
+    searchIndex.attach(store)
+    undoLog.attach(store) # undo history belongs to the list it was made in
+    previousStore = taskStore
+    workspace.active.setStore(store) # the shown tab now holds this list
+    if isinstance(previousStore, SqliteTaskStore) and not workspace.holds(previousStore) and (loadState is None or loadState["previousStore"] is not previousStore):
+        previousStore.close() # kept open if another tab holds it, or if a cancelled load might switch back to it
+    taskStore = store
+    taskStore.subscribe(onTasksChanged)
+    scheduleReminder()
+    if searchMatches is not None:
+        refreshSearchResults()
+    rebuildTaskRows()
+    scheduleLayout("tracker")
+
+def openDatabase(filePath):
+    global currentFilePath
+    
+    if loadState is not None:
+        cancelLoad()
+    closeJournal()
+    useTaskStore(SqliteTaskStore(filePath))
+    currentFilePath = filePath
+    workspace.active.markSaved(filePath) # the tab is named after the database
+    drawTabBar()
+    resetFileWatcher()
+    print(f"Database \"{filePath}\" opened with {len(taskStore)} tasks.") # console terminal output
+
+### TABS
+"""
+Each open list has a tab, but only the shown list has widgets.
+Switching tabs hands the rows already built to the other list instead of rebuilding the window,
+and lists that aren't shown are kept as plain data, or unloaded to disk once there are too many.
+"""
+
+def drawTabBar():
+    for button in tabButtons: # a handful of buttons, so they are simply made again
+        button.destroy()
+    tabButtons.clear()
+    for tab in workspace:
+        shown = tab is workspace.active
+        tabButton = tk.Button(
+            tabButtonFrame,
+            command = lambda tab = tab: switchTab(tab),
+            text = tab.name,
+            font = themeFonts["small"], # changes font and text size
+            bg = "#FFFFFF" if shown else "#00A2E8", # the shown tab is white
+            activebackground = "#FFFFFF",
+            fg = "#00A2E8" if shown else "#FFFFFF",
+            activeforeground = "#00A2E8"
+        )
+        tabButton.pack(side = "left") # places the tab within the tab bar
+        tabButtons.append(tabButton)
+
+def newTab(event = None):
+    global tabCount
+    
+    tabCount += 1
+    switchTab(workspace.addTab(f"List {tabCount}"))
+
+def nextTab(event = None):
+    tabs = workspace.tabs
+    switchTab(tabs[(tabs.index(workspace.active) + 1) % len(tabs)])
+
+def captureView():
+    return {
+        "firstRow": virtualFirstRow,
+        "scroll": tasksCanvas.yview()[0],
+        "selection": sorted(selectedIds), # a list, so the view can be saved with the session
+        "autosave": autosaveEnabled.get()
+    }
+
+def switchTab(tab):
+    global currentFilePath
+    global virtualFirstRow
+    global selectionAnchor
+    
+    if tab is workspace.active:
+        return
+    if loadState is not None or importState is not None or ioWorker.busy(): # the file work belongs to the shown list
+        print("Please wait for the file to finish loading, saving, or importing before switching lists.")
+        return
+    
+    leaving = workspace.active
+    leaving.view = captureView() # brought back when the list is shown again
+    if taskJournal is not None:
+        closeJournal()
+        leaving.changed = False # every change is in the file or its journal
+    try:
+        store = workspace.activate(tab) # reads the list back if it was unloaded
+    except (OSError, ValueError) as error:
+        print(f"Error: Could not open \"{tab.name}\": {error}.")
+        if autosaveEnabled.get() == 1:
+            openJournal()
+        return
+    
+    selectedIds.clear() # every list has its own selection
+    selectedIds.update(tab.view.get("selection", ()))
+    selectionAnchor = None
+    virtualFirstRow = tab.view.get("firstRow", 0)
+    currentFilePath = tab.filePath
+    useTaskStore(store) # hands the rows already built to this list's tasks
+    if not virtualMode: # recycled rows were already drawn from virtualFirstRow
+        tasksFrame.update_idletasks() # lays out the rows, so the old scroll position can be found
+        tasksCanvas.configure(scrollregion = tasksFrame.bbox("all"))
+        tasksCanvas.yview_moveto(tab.view.get("scroll", 0.0))
+    autosaveEnabled.set(tab.view.get("autosave", 0))
+    if autosaveEnabled.get() == 1: # carries on autosaving this list's file
+        openJournal()
+    resetFileWatcher() # watches this list's file instead
+    drawTabBar()
+
+def closeTab(event = None):
+    from tkinter import messagebox
+    
+    closing = workspace.active
+    if closing.changed and taskJournal is None and len(closing.store) and not isinstance(closing.store, SqliteTaskStore) and closing not in syncClients: # databases, autosaved lists, and shared lists are already saved
+        if not messagebox.askyesno("Close List", f"\"{closing.name}\" has changes that haven't been saved. Close it anyway?"):
+            return
+    
+    tabs = workspace.tabs
+    index = tabs.index(closing)
+    if len(tabs) == 1: # there is always a list to show
+        newTab()
+    else:
+        switchTab(tabs[index + 1] if index + 1 < len(tabs) else tabs[index - 1])
+    if workspace.active is closing: # the switch had to wait for file work
+        return
+    if closing in syncClients:
+        leaveSharedList(closing)
+    workspace.closeTab(closing)
+    drawTabBar()
+
+### SHARED LISTS
+"""
+A list shared through a sync server ("python -m tasklist -f FILE serve") opens in its own tab.
+Each change made here is sent to the server as the few tasks it touched, and changes from other windows
+arrive the same way, a batch at a time, so they only touch the rows of the tasks they changed.
+"""
+
+def joinSharedList(event = None):
+    from tkinter import simpledialog
+    from tasklist.sync import SyncClient, defaultHost, defaultPort # only loaded by windows that share lists
+    
+    address = simpledialog.askstring(
+        "Join Shared List",
+        "Address of the shared list (host:port, or unix:path):",
+        initialvalue = f"{defaultHost}:{defaultPort}",
+        parent = taskList
+    )
+    if not address: # the user cancelled
+        return
+    try:
+        client = SyncClient(address) # receives the whole list once, then only changes
+    except (OSError, ValueError) as error:
+        print(f"Error: Could not join the shared list at \"{address}\": {error}.")
+        return
+    
+    tab = workspace.addTab(f"Shared ({address})", client.store)
+    tab.pinned = True # stays in memory while hidden, so changes keep arriving
+    syncClients[tab] = client
+    print(f"Joined the shared list at \"{address}\" with {len(client.store)} tasks.") # console terminal output
+    switchTab(tab)
+    drawTabBar()
+    watchSharedLists()
+
+def watchSharedLists():
+    global syncPollJob
+    
+    if syncPollJob is None and syncClients:
+        syncPollJob = taskList.after(syncPollDelay, pollSharedLists)
+
+def pollSharedLists():
+    global syncPollJob
+    
+    syncPollJob = None
+    for tab, client in list(syncClients.items()):
+        shown = tab is workspace.active
+        recording = undoLog.recording
+        if shown:
+            undoLog.recording = False # other windows' changes aren't this window's to undo
+        try:
+            remoteChanges = client.deliver() # applies the changes here, on the window's thread
+        finally:
+            undoLog.recording = recording
+        if shown and remoteChanges: # earlier history may not fit the list anymore
+            undoLog.clear()
+        if not client.connected:
+            print(f"Lost the connection to \"{tab.name}\"; the list is kept as a copy.")
+            leaveSharedList(tab)
+    watchSharedLists()
+
+def leaveSharedList(tab):
+    syncClients.pop(tab).close()
+    tab.pinned = False
+    tab.changed = True # the copy isn't saved anywhere anymore
+
+### INCREMENTAL LOADING
+"""
+Loaded tasks are added to the list in small batches scheduled with after(),
+so the window keeps redrawing and responding while a large file is loaded.
+"""
+
+def startIncrementalLoad(records, filePath, restoring = False):
+    global loadState
+    global loadingTotal
+    
+    if loadState is not None: # only one load runs at a time
+        cancelLoad()
+    closeJournal() # the list being replaced isn't a change to autosave
+    
+    previousStore = taskStore
+    loadState = {
+        "records": records, # the parsed tasks still to be added
+        "position": 0, # how many of them have been added so far
+        "previous": None if isinstance(taskStore, SqliteTaskStore) else taskStore.records(), # restored if the load is cancelled
+        "previousStore": previousStore,
+        "filePath": filePath,
+        "previousPath": currentFilePath,
+        "restoring": restoring, # the list is being reopened from the last session, not loaded from a file
+        "changed": workspace.active.changed, # kept by a restored list, which may have had unsaved changes
+        "job": None # the scheduled next batch
+    }
+    loadingTotal = len(records) # lets the list pick its drawing mode up front
+    if isinstance(taskStore, SqliteTaskStore): # a file is loaded into memory, leaving the database as it was
+        useTaskStore(TaskStore())
+    taskStore.replaceAll([]) # clears current program status
+    undoLog.recording = False # loaded tasks aren't changes to undo
+    loadNextBatch() # the first screenful is added straight away
+
+def loadNextBatch():
+    records = loadState["records"]
+    position = loadState["position"]
+    batchSize = 500 if virtualMode else 25 # recycled rows cost nothing to add, real rows do
+    sliceEnd = time.perf_counter() + loadSliceTime
+    
+    while position < len(records) and time.perf_counter() < sliceEnd:
+        taskStore.extend(records[position:position + batchSize])
+        position += batchSize
+    loadState["position"] = position
+    
+    if position < len(records): # more to go, so the window gets a turn first
+        loadProgress.config(text = f"Loading {position * 100 // len(records)}%")
+        if not loadProgressFrame.winfo_ismapped():
+            loadProgressFrame.pack(side = "right", padx = 10)
+        loadState["job"] = taskList.after(1, loadNextBatch)
+    elif loadState["restoring"]:
+        workspace.active.changed = loadState["changed"] # the list is as it was left, unsaved changes and all
+        finishLoad(loadState["filePath"])
+        finishRestore()
+    else:
+        print(f"File \"{loadState['filePath']}\" loaded successfully.") # console terminal output
+        workspace.active.markSaved(loadState["filePath"]) # the tab is named after the file
+        finishLoad(loadState["filePath"])
+        drawTabBar()
+
+def cancelLoad():
+    global loadingTotal
+    
+    if loadState is None:
+        return
+    
+    if loadState["job"] is not None:
+        taskList.after_cancel(loadState["job"])
+    print(f"Loading \"{loadState['filePath']}\" was cancelled.")
+    if loadState["restoring"]: # another file is being loaded over the restored list
+        discardRestoringSnapshot()
+    loadingTotal = 0 # the list goes back to its old length
+    if loadState["previous"] is None: # the list was a database, which the load never touched
+        useTaskStore(loadState["previousStore"])
+    else:
+        taskStore.replaceAll(loadState["previous"]) # puts back the list from before the load
+    finishLoad(loadState["previousPath"])
+
+def finishLoad(filePath):
+    global loadState
+    global loadingTotal
+    global currentFilePath
+    
+    previousStore = loadState["previousStore"]
+    loadState = None
+    loadingTotal = 0
+    loadProgressFrame.pack_forget() # hides the progress indicator
+    undoLog.clear() # history starts fresh with the loaded list
+    undoLog.recording = True
+    if previousStore is not taskStore and isinstance(previousStore, SqliteTaskStore):
+        previousStore.close() # the database isn't coming back
+    
+    currentFilePath = filePath
+    if autosaveEnabled.get() == 1: # carries on autosaving, now to this file
+        openJournal()
+    resetFileWatcher()
+
+### SESSIONS
+"""
+The open lists are saved when the window closes and reopened when it next starts.
+Only the small session file is read before the window first paints, and it holds the shown list's first page,
+so that page is drawn straight away; the rest of the list is read on the worker thread and loaded in batches.
+Other tabs stay unloaded until they are shown. Lists shared through a sync server are left out, since the server keeps them.
+"""
 
-tasksFrame.bind("<Configure>", updateScrollRegion)
+def restoreSession():
+    global tabCount
+    global loadingTotal
+    global restoringSnapshot
+    
+    if not sessionDirectory:
+        return
+    session = readSession(sessionDirectory)
+    if session is None: # the first run, or sessions were turned off last time
+        return
+    tabs = restoreTabs(session, sessionDirectory)
+    shownIndex = min(session["active"] or 0, len(tabs) - 1) # the shown list may have been a shared one, which isn't restored
+    shown = tabs[shownIndex]
+    workspace.replaceTabs(tabs, shown, taskStore)
+    tabCount = len(tabs) # numbers new lists after the restored ones
+    drawTabBar()
+    autosaveEnabled.set(shown.view.get("autosave", 0)) # carries on autosaving once the list is in
+    
+    filePath = shown.filePath
+    if shown.unloadPath is not None: # the snapshot is still good, so its first page can be drawn before it is read
+        restoringSnapshot = shown.unloadPath
+        shown.unloadPath = None # the tab is shown, and only holds the first page until the snapshot is read
+        changed = shown.changed
+        loadingTotal = session["tabs"][shownIndex]["count"] or 0 # picks the list's drawing mode up front
+        undoLog.recording = False # the first page isn't a change to undo
+        taskStore.extend(tuple(record) for record in session["preview"])
+        shown.changed = changed
+        readRecords = lambda: readBinaryFile(restoringSnapshot)
+    elif filePath is not None and isDatabasePath(filePath): # databases are read a page at a time anyway
+        try:
+            openDatabase(filePath)
+        except Exception as error:
+            failLoad(filePath, error)
+            return
+        finishRestore()
+        return
+    elif filePath is not None: # the file changed since the last session, so it is read again
+        readRecords = lambda: readJournaledFile(filePath)
+    else: # an empty list
+        finishRestore()
+        return
+    
+    runInBackground(
+        readRecords,
+        lambda records: startIncrementalLoad(records, filePath, restoring = True),
+        failRestore,
+        "Restoring"
+    )
+
+def failRestore(error):
+    global loadingTotal
+    
+    failLoad(restoringSnapshot or workspace.active.filePath, error)
+    discardRestoringSnapshot()
+    loadingTotal = 0
+    taskStore.replaceAll([]) # the first page alone isn't the list, so it mustn't be saved over the file
+    workspace.active.changed = False
+    undoLog.recording = True
+
+def finishRestore():
+    global virtualFirstRow
+    
+    view = workspace.active.view
+    if virtualMode:
+        virtualFirstRow = view.get("firstRow", 0)
+        renderVirtualRows()
+    else:
+        tasksFrame.update_idletasks() # lays out the rows, so the old scroll position can be found
+        tasksCanvas.configure(scrollregion = tasksFrame.bbox("all"))
+        tasksCanvas.yview_moveto(view.get("scroll", 0.0))
+    setSelection(taskId for taskId in view.get("selection", ()) if taskStore.get(taskId) is not None)
+    discardRestoringSnapshot()
+    drawTabBar()
+    print(f"Restored the last session in {time.perf_counter() - startTime:.2f} seconds, showing \"{workspace.active.name}\" with {len(taskStore)} tasks.")
+
+def discardRestoringSnapshot():
+    global restoringSnapshot
+    
+    if restoringSnapshot is not None:
+        os.remove(restoringSnapshot)
+        restoringSnapshot = None
+
+def saveCurrentSession():
+    if not sessionDirectory:
+        return
+    shown = workspace.active
+    shown.view = captureView()
+    if restoringSnapshot is not None: # the list hasn't all been read back yet, so the old snapshot still holds it
+        shown.unloadPath = restoringSnapshot
+        if loadState is not None:
+            shown.changed = loadState["changed"] # the batches read back so far aren't changes
+    preview = [] if isinstance(taskStore, SqliteTaskStore) else [(record.taskId, record.completed, record.task, record.deadline) for record in taskStore.page(0, previewLength)]
+    try:
+        saveSession(workspace, preview, skipped = syncClients, directory = sessionDirectory)
+    except OSError as error:
+        print(f"Error: Could not save the session: {error}.")
+
+def noteFirstPaint(event):
+    global firstPaintTime
+    
+    if firstPaintTime is not None:
+        return
+    firstPaintTime = time.perf_counter() - startTime
+    profiling.recordCall("first paint", firstPaintTime) # shown in the profiling report
+    if profiling.enabled:
+        print(f"First paint {firstPaintTime * 1000:.0f} ms after starting.")
+
+### RELOADING AND WATCHING
+"""
+Loading a file over a list that is already shown compares the two instead of starting again:
+tasks are matched by id, and only the rows of tasks that were added, removed, or edited are touched.
+While Watch File is on, the open file is checked every second with a cheap size and time check,
+and changes other programs make to it are brought in the same way.
+"""
+
+def reconcileList(records):
+    """Changes the list to match records, returning (added, removed, updated) counts, or None if it was replaced."""
+    undoLog.recording = False # changes read from a file aren't changes to undo
+    try:
+        counts = taskStore.reconcile(records)
+    finally:
+        undoLog.recording = True
+    if counts != (0, 0, 0): # earlier history may not fit the list anymore
+        undoLog.clear()
+    return counts
+
+def describeChanges(counts):
+    if counts is None:
+        return "the whole list was replaced"
+    added, removed, updated = counts
+    return f"{added} added, {removed} removed, {updated} changed"
+
+def reconcileWithFile(records, filePath):
+    global currentFilePath
+    
+    if loadState is not None:
+        cancelLoad()
+    if currentFilePath is None or os.path.abspath(filePath) != os.path.abspath(currentFilePath):
+        closeJournal() # the other file's tasks aren't changes to autosave into this one
+    counts = reconcileList(records)
+    print(f"File \"{filePath}\" loaded successfully: {describeChanges(counts)}.") # console terminal output
+    
+    currentFilePath = filePath
+    workspace.active.markSaved(filePath) # the tab is named after the file
+    drawTabBar()
+    if autosaveEnabled.get() == 1 and taskJournal is None: # carries on autosaving, now to this file
+        openJournal()
+    resetFileWatcher()
+
+def toggleWatch():
+    global watchJob
+    
+    resetFileWatcher()
+    if watchEnabled.get() == 1:
+        if watchJob is None:
+            watchJob = taskList.after(watchDelay, pollWatchedFile)
+    elif watchJob is not None:
+        taskList.after_cancel(watchJob)
+        watchJob = None
+
+def resetFileWatcher():
+    """Points the watcher at the current file as it is now. Called whenever the file, or this program's own writing to it, changes."""
+    global fileWatcher
+    
+    if watchEnabled.get() == 0 or currentFilePath is None or isinstance(taskStore, SqliteTaskStore): # a database is the list itself
+        fileWatcher = None
+    else:
+        fileWatcher = FileWatcher(currentFilePath, watchJournal = taskJournal is None) # the journal this program is autosaving to isn't watched
+
+def pollWatchedFile():
+    global watchJob
+    
+    watchJob = taskList.after(watchDelay, pollWatchedFile)
+    if fileWatcher is None or loadState is not None or ioWorker.busy(): # checked again next time
+        return
+    if fileWatcher.changed():
+        filePath = currentFilePath
+        runInBackground(
+            lambda: readWatchedFile(filePath),
+            lambda records: applyWatchedChanges(records, filePath),
+            lambda error: failLoad(filePath, error), # a file another program is part way through writing is read again once it is done
+            "Reading"
+        )
+
+def readWatchedFile(filePath):
+    if not os.path.exists(filePath): # a deleted file doesn't empty the list
+        return None
+    return readJournaledFile(filePath)
+
+def applyWatchedChanges(records, filePath):
+    if records is None or filePath != currentFilePath or loadState is not None: # the list moved on while the file was read
+        return
+    counts = reconcileList(records)
+    if counts != (0, 0, 0): # this program's own autosave snapshots change the file without changing the list
+        print(f"\"{filePath}\" was changed by another program: {describeChanges(counts)}.")
+
+### IMPORTING
+"""
+Importing adds another file's tasks to the end of the shown list, keeping the list's own file and tasks.
+The worker thread reads the file a chunk at a time, so a huge CSV or iCalendar file is never held in memory whole,
+and while one chunk goes into the list in batches between redraws, like a load, the next one is being read.
+"""
+
+def importFromFile():
+    global importState
+    from tkinter import filedialog
+    
+    filePath = filedialog.askopenfilename( # determines the constraints of the file explorer
+        filetypes = [("CSV files (.csv)", "*.csv"), ("iCalendar files (.ics)", "*.ics"), ("JSON files (.json)", "*.json"), ("Compact task files (.tlist)", "*.tlist"), ("Task databases (.db)", "*.db"), ("All files", "*.*")],
+        title = "Import"
+    )
+    
+    if not filePath: # will only proceed if the user indicated a file
+        return
+    if importState is not None or loadState is not None or ioWorker.busy(): # the tasks would end up mixed into another list
+        print("Please wait for the file work in progress to finish before importing.")
+        return
+    
+    importState = {
+        "filePath": filePath,
+        "store": taskStore, # the list the tasks go into
+        "stream": None, # the file's records, made and read only on the worker thread
+        "chunks": [], # chunks read and not yet added, oldest first
+        "position": 0, # how much of the oldest chunk has been added
+        "reading": False, # whether the worker is reading the next chunk
+        "ended": False, # whether the whole file has been read
+        "added": [], # the tasks imported so far
+        "job": None # the scheduled next batch
+    }
+    undoLog.recording = False # the batches are recorded as one change once they are all in
+    readImportChunk()
+
+def readImportChunk():
+    state = importState
+    
+    def readChunk(): # runs on the worker thread
+        if state["stream"] is None:
+            state["stream"] = streamRecords(state["filePath"])
+        return list(islice(state["stream"], importChunkSize))
+    
+    state["reading"] = True
+    runInBackground(readChunk, receiveImportChunk, failImport, f"Importing {len(state['added'])} tasks")
+
+def receiveImportChunk(chunk):
+    if importState is None: # the window is closing
+        return
+    importState["reading"] = False
+    if chunk:
+        importState["chunks"].append(chunk)
+    else: # the whole file has been read
+        importState["ended"] = True
+    if importState["job"] is None: # nothing was left to add, so adding starts again
+        addImportBatch()
+
+def failImport(error):
+    if importState is None:
+        return
+    failLoad(importState["filePath"], error)
+    importState["reading"] = False
+    importState["ended"] = True # tasks read before the error are still added
+    if importState["job"] is None:
+        addImportBatch()
+
+def addImportBatch():
+    state = importState
+    state["job"] = None
+    chunks = state["chunks"]
+    batchSize = 500 if virtualMode else 25 # recycled rows cost nothing to add, real rows do
+    sliceEnd = time.perf_counter() + loadSliceTime
+    
+    while chunks and time.perf_counter() < sliceEnd:
+        chunk = chunks[0]
+        position = state["position"]
+        state["added"].extend(state["store"].extend((None, completed, task, deadline) for taskId, completed, task, deadline in chunk[position:position + batchSize])) # imported tasks get new ids
+        state["position"] = position + batchSize
+        if state["position"] >= len(chunk):
+            chunks.pop(0)
+            state["position"] = 0
+    
+    if not state["reading"] and not state["ended"] and len(chunks) < 2: # the next chunk is read while this one is added
+        readImportChunk()
+    if chunks: # more to go, so the window gets a turn first
+        state["job"] = taskList.after(1, addImportBatch)
+    elif state["ended"]:
+        finishImport()
+
+def finishImport():
+    global importState
+    
+    store = importState["store"]
+    added = [record for record in importState["added"] if store.get(record.taskId) is not None] # a shared list's other windows may have deleted some already
+    print(f"Imported {len(importState['added'])} task(s) from \"{importState['filePath']}\".")
+    importState = None
+    undoLog.recording = True
+    if added and store is taskStore:
+        undoLog.record("add", added, None) # Undo takes the whole import back out at once
+
+### REMINDERS
+"""
+One after() timer is armed, for the next pending task to come due, however many tasks have deadlines.
+Changes to the list only re-arm it when a task now comes due sooner; a timer left armed for a task
+that was completed or deleted in the meantime simply finds nothing due and arms itself for the next one.
+When tasks come due their rows turn red and a small notice names them. The notice is a plain window,
+not a dialog, so the list keeps working while it is up.
+"""
+
+def scheduleReminder():
+    global reminderJob
+    global reminderTime
+    
+    now = time.time()
+    nextDue = reminderQueue.nextDue()
+    wakeTime = min(
+        nextDue if nextDue is not None else float("inf"),
+        dayBounds(now)[1], # the tracker's "Due Today" count changes at midnight
+        now + reminderDelayLimit
+    )
+    if wakeTime >= reminderTime: # the armed timer goes off soon enough
+        return
+    if reminderJob is not None:
+        taskList.after_cancel(reminderJob)
+    reminderTime = wakeTime
+    reminderJob = taskList.after(max(0, int((wakeTime - now) * 1000) + 1), fireReminders)
+
+def fireReminders():
+    global reminderJob
+    global reminderTime
+    
+    reminderJob = None
+    reminderTime = float("inf")
+    now = time.time()
+    dueIds = reminderQueue.popDue(now)
+    if dueIds:
+        if virtualMode:
+            renderVirtualRows() # only the visible rows are redrawn
+        else:
+            for taskId in dueIds:
+                recolorTaskRow(taskId, now)
+        showReminder(dueIds)
+    scheduleLayout("tracker") # the overdue and due today counts have moved on
+    scheduleReminder()
+
+def showReminder(taskIds):
+    global reminderWindow
+    global reminderHideJob
+    
+    lines = [f"\u2022 {taskStore.get(taskId).task}" for taskId in taskIds[:reminderListLimit]]
+    if len(taskIds) > reminderListLimit:
+        lines.append(f"...and {len(taskIds) - reminderListLimit} more")
+    heading = "A task is due now:" if len(taskIds) == 1 else f"{len(taskIds)} tasks are due now:"
+    
+    if reminderWindow is None or not reminderWindow.winfo_exists(): # built once, then reused
+        reminderWindow = buildReminderWindow()
+    reminderMessage.config(text = heading + "\n" + "\n".join(lines))
+    reminderWindow.deiconify()
+    reminderWindow.lift()
+    taskList.bell()
+    
+    if reminderHideJob is not None: # a newer reminder stays up for the full time
+        taskList.after_cancel(reminderHideJob)
+    reminderHideJob = taskList.after(reminderShowTime, hideReminder)
+
+def hideReminder():
+    global reminderHideJob
+    
+    if reminderHideJob is not None:
+        taskList.after_cancel(reminderHideJob)
+        reminderHideJob = None
+    if reminderWindow is not None and reminderWindow.winfo_exists():
+        reminderWindow.withdraw()
+
+def buildReminderWindow():
+    global reminderMessage
+    
+    window = tk.Toplevel(taskList)
+    window.title("Reminder")
+    window.config(bg = "#1A558C") # colors the window - dark blue
+    window.attributes("-topmost", True) # shows above other windows without taking the keyboard
+    window.resizable(False, False)
+    window.protocol("WM_DELETE_WINDOW", hideReminder) # hidden, so it can be shown again without rebuilding
+    
+    reminderMessage = tk.Label( # names the tasks that came due
+        window,
+        text = "",
+        justify = tk.LEFT,
+        wraplength = 400,
+        font = themeFonts["body"], # changes font and text size
+        fg = "#FFFFFF", # colors the text - white
+        bg = "#1A558C" # prevents a gray block in the window
+    )
+    reminderMessage.pack( # places the text within the window
+        padx = 15,
+        pady = 10
+    )
+    
+    dismissButton = tk.Button( # creates a button to hide the reminder
+        window,
+        command = hideReminder,
+        text = "Dismiss",
+        font = themeFonts["small"], # changes font and text size
+        bg = "#00A2E8", # colors the button
+        activebackground = "#FFFFFF",
+        fg = "#FFFFFF", # colors the text
+        activeforeground = "#00A2E8"
+    )
+    dismissButton.pack( # places the button within the window
+        pady = (0, 10)
+    )
+    
+    window.withdraw() # shown by showReminder once its text is set
+    return window
+
+### SEARCH
+"""
+Typing in the search box filters the list once typing pauses.
+Matches come from the search index, so no task is read to find them;
+rows that don't match are hidden and shown again, never rebuilt.
+"""
+
+def scheduleSearch(*args):
+    global searchJob
+    
+    if searchJob is not None: # typing again restarts the wait
+        taskList.after_cancel(searchJob)
+    searchJob = taskList.after(searchDelay, applySearch)
+
+def clearSearch(event):
+    searchText.set("") # the search runs again, with nothing to filter by
+
+def refreshSearchResults():
+    global searchMatches
+    global filteredIds
+    
+    searchMatches = searchIndex.search(searchQuery)
+    filteredIds = searchIndex.orderMatches(searchMatches)
+
+def applySearch():
+    global searchJob
+    global searchQuery
+    global virtualFirstRow
+    
+    searchJob = None
+    if searchText.get() == searchQuery:
+        return # nothing has changed since the last search
+    searchQuery = searchText.get()
+    refreshSearchResults()
+    
+    if virtualMode:
+        virtualFirstRow = 0 # new results are shown from the top
+        renderVirtualRows()
+    else:
+        filterTaskRows()
+    scheduleLayout("tracker")
+
+def hideTaskRow(taskId):
+    for widget in taskRows[taskId]["widgets"]:
+        widget.grid_remove() # remembers the widget's place so it can come back
+    hiddenRows.add(taskId)
+
+def showTaskRow(taskId):
+    for widget in taskRows[taskId]["widgets"]:
+        widget.grid()
+    hiddenRows.discard(taskId)
+
+def filterTaskRows():
+    for taskId in taskRows: # only rows whose visibility changed are touched
+        matches = searchMatches is None or taskId in searchMatches
+        if matches and taskId in hiddenRows:
+            showTaskRow(taskId)
+        elif not matches and taskId not in hiddenRows:
+            hideTaskRow(taskId)
+
+### SELECTION AND BULK ACTIONS
+"""
+Tasks are selected by clicking their description or deadline.
+Bulk actions hand the whole selection to the task store at once,
+so the list, indexes, autosave, and tracker each see one change.
+"""
+
+def rowBackground(taskId):
+    return themeColors["selected"] if taskId in selectedIds else themeColors["background"] # selected rows stand out; the rest are dark blue
+
+def recolorRowBackground(taskId):
+    row = taskRows.get(taskId)
+    if row is None: # the task isn't drawn on its own row
+        return
+    background = rowBackground(taskId)
+    row["widgets"][0].config(bg = background, activebackground = background)
+    for widget in row["widgets"][1:3]: # the task and deadline labels
+        widget.config(bg = background)
+
+def redrawSelection(changedIds):
+    if virtualMode:
+        renderVirtualRows() # only the visible rows are redrawn
+    else:
+        for taskId in changedIds: # only rows whose selection changed are touched
+            recolorRowBackground(taskId)
+    scheduleLayout("tracker")
+
+def setSelection(taskIds):
+    global selectionAnchor
+    
+    newSelection = set(taskIds)
+    changedIds = selectedIds ^ newSelection
+    selectedIds.clear()
+    selectedIds.update(newSelection)
+    if selectionAnchor not in selectedIds:
+        selectionAnchor = None
+    redrawSelection(changedIds)
+
+def shownPosition(taskId):
+    if filteredIds is None:
+        return taskStore.positionOf(taskId)
+    return filteredIds.index(taskId) # a search only shows its matches
+
+def selectTask(taskId, extend = False, toggle = False):
+    global selectionAnchor
+    
+    before = set(selectedIds)
+    shownIds = taskStore.orderedIds() if filteredIds is None else filteredIds
+    if extend and selectionAnchor is not None and (filteredIds is None or selectionAnchor in searchMatches): # selects everything shown between the anchor and this task
+        first, last = sorted((shownPosition(selectionAnchor), shownPosition(taskId)))
+        selectedIds.clear()
+        selectedIds.update(shownIds[first:last + 1])
+    elif toggle: # adds or removes just this task
+        selectedIds.symmetric_difference_update((taskId,))
+        selectionAnchor = taskId
+    else: # selects only this task
+        selectedIds.clear()
+        selectedIds.add(taskId)
+        selectionAnchor = taskId
+    redrawSelection(before ^ selectedIds)
+
+def clickTask(taskId, event):
+    selectTask(taskId, extend = bool(event.state & 0x0001), toggle = bool(event.state & 0x0004)) # Shift and Ctrl
+
+def orderedSelection():
+    return sorted(selectedIds, key = taskStore.positionOf) # bulk changes are reported in list order
+
+def completeSelected():
+    taskStore.setCompletedMany(orderedSelection(), 1)
+
+def uncompleteSelected():
+    taskStore.setCompletedMany(orderedSelection(), 0)
+
+def deleteSelected():
+    taskStore.removeMany(orderedSelection()) # the selection empties when the store reports the change
+
+def deleteCompleted():
+    taskStore.removeMany(taskStore.completedIds())
+
+def selectOverdue():
+    setSelection(deadlineIndex.overdue())
+
+### LAYOUT SCHEDULER
+"""
+Redrawing the scroll region, column widths, or tracker is never done straight away.
+Each change only marks what it affects, and everything marked is redrawn together
+once Tk has handled every pending event, so a burst of changes costs one redraw.
+"""
+
+def scheduleLayout(*parts):
+    global layoutJob
+    
+    layoutDirty.update(parts)
+    if layoutJob is None: # one redraw is enough for any number of changes
+        layoutJob = taskList.after_idle(flushLayout)
+
+def flushLayout():
+    global layoutJob
+    
+    layoutJob = None
+    dirty = set(layoutDirty)
+    layoutDirty.clear()
+    
+    if "columns" in dirty: # the list stretches to the canvas's width
+        tasksCanvas.itemconfig(tasksCanvas.find_all()[0], width = canvasWidth)
+        if virtualMode: # a taller window shows more recycled rows
+            resizeVirtualPool()
+    if "scrollRegion" in dirty and not virtualMode: # recycled rows manage the scrollbar themselves
+        tasksCanvas.configure(scrollregion = tasksFrame.bbox("all"))
+    if "tracker" in dirty:
+        updateTracker()
+
+### ENABLE SCROLLING
+
+def updateScrollRegion(event):
+    scheduleLayout("scrollRegion") # every gridded row reports a new size; only the last one matters
 
 def resizeTasksFrame(event):
-    tasksCanvas.itemconfig(tasksCanvas.find_all()[0], width=event.width)
+    global canvasWidth
+    
+    canvasWidth = event.width
+    scheduleLayout("columns")
+
+### PROFILING HOOKS
+"""
+The button commands and the list's resize handlers are replaced by timed wrappers.
+While profiling is off, the wrappers just call straight through.
+The overlay turns profiling on while it is shown.
+"""
+
+newTaskWindow = profiling.instrument(newTaskWindow)
+addNewTask = profiling.instrument(addNewTask)
+deleteTask = profiling.instrument(deleteTask)
+loadFromFile = profiling.instrument(loadFromFile)
+saveToFile = profiling.instrument(saveToFile)
+tutorialScreen = profiling.instrument(tutorialScreen)
+updateScrollRegion = profiling.instrument(updateScrollRegion)
+resizeTasksFrame = profiling.instrument(resizeTasksFrame)
+completeSelected = profiling.instrument(completeSelected)
+uncompleteSelected = profiling.instrument(uncompleteSelected)
+deleteSelected = profiling.instrument(deleteSelected)
+deleteCompleted = profiling.instrument(deleteCompleted)
+selectOverdue = profiling.instrument(selectOverdue)
+undoChange = profiling.instrument(undoChange)
+switchTab = profiling.instrument(switchTab)
+redoChange = profiling.instrument(redoChange)
+
+def countWidgets(widget):
+    return sum(1 + countWidgets(child) for child in widget.winfo_children())
+
+def measureLoopLag():
+    global lagCheckJob
+    global lagCheckDue
+    
+    now = time.perf_counter()
+    profiling.recordLag(now - lagCheckDue) # how much later than asked the check actually ran
+    lagCheckDue = now + lagCheckDelay / 1000
+    lagCheckJob = taskList.after(lagCheckDelay, measureLoopLag)
+
+def updateOverlay():
+    global overlayJob
+    
+    lastCall = profiling.lastCall
+    lastText = f"{lastCall[0]} {lastCall[1] * 1000:.1f} ms" if lastCall else "none yet"
+    performanceOverlay.config(text = (
+        f"Widgets: {countWidgets(taskList)}\n"
+        f"Last command: {lastText}\n"
+        f"Loop lag: {profiling.loopLag * 1000:.0f} ms"
+        + ("\nCapturing profile" if profiling.isCapturing() else "")
+    ))
+    overlayJob = taskList.after(overlayDelay, updateOverlay)
+
+def toggleOverlay(event = None):
+    global overlayVisible
+    global profilingBeforeOverlay
+    global lagCheckDue
+    
+    overlayVisible = not overlayVisible
+    if overlayVisible:
+        profilingBeforeOverlay = profiling.enabled
+        profiling.setEnabled(True) # the overlay needs the timings
+        performanceOverlay.place(relx = 1.0, rely = 0.0, anchor = "ne") # floats over the top right corner
+        performanceOverlay.lift()
+        lagCheckDue = time.perf_counter()
+        measureLoopLag()
+        updateOverlay()
+    else:
+        taskList.after_cancel(overlayJob) # nothing is measured while the overlay is hidden
+        taskList.after_cancel(lagCheckJob)
+        performanceOverlay.place_forget()
+        profiling.setEnabled(profilingBeforeOverlay)
+
+def toggleCapture(event = None):
+    if profiling.isCapturing():
+        print(profiling.stopCapture(profileOutputPath))
+        print(f"Profile saved as \"{profileOutputPath}\".")
+    else:
+        profiling.startCapture()
+        print("Profile capture started. Press Shift+F12 again to stop it.")
 
-tasksCanvas.bind("<Configure>", resizeTasksFrame)
+### THEME
+"""
+Every font is a shared named font, so changing one redraws all the text that uses it in a single step.
+Task rows take the rest of their look from rowStyles instead of spelling out each option per widget.
+"""
+
+def createTheme():
+    for name, (size, weight) in themeFontSizes.items(): # fonts can only be made once the window exists
+        themeFonts[name] = tkfont.Font(family = themeFamily, size = size, weight = weight)
+    
+    rowStyles["check"] = {
+        "selectcolor": themeColors["background"], # colors checkbox - dark blue
+        "fg": themeColors["text"], # colors check mark - white
+        "activeforeground": themeColors["text"]
+    }
+    rowStyles["label"] = {
+        "font": themeFonts["body"], # changes the font and text size
+        "wraplength": 300 # enables word-wrapping on the text
+    }
+    rowStyles["recycledLabel"] = {
+        "font": themeFonts["body"] # recycled rows are a single line, so they don't wrap
+    }
+    rowStyles["delete"] = {
+        "text": "Delete",
+        "font": themeFonts["body"],
+        "bg": themeColors["accent"], # colors the button - light blue
+        "fg": themeColors["text"],
+        "activeforeground": themeColors["accent"]
+    }
+
+def resizeText(step):
+    global textSizeStep
+    global virtualRowHeight
+    
+    textSizeStep = max(-6, min(12, textSizeStep + step))
+    for name, (size, weight) in themeFontSizes.items(): # one change per font resizes every widget using it
+        themeFonts[name].configure(size = size + textSizeStep)
+    if virtualMode and virtualRowPool: # recycled rows are measured again at the new size
+        tasksFrame.update_idletasks()
+        virtualRowHeight = max(widget.winfo_reqheight() for widget in virtualRowPool[0]["widgets"])
+    scheduleLayout("columns", "scrollRegion")
+
+### CREATE MAIN WINDOW
+"""
+The window is only built when the program is run directly,
+so the task model can be imported without a display.
+"""
+
+def buildMainWindow():
+    global taskList # these widgets are used by the functions above
+    global taskCompletion
+    global loadProgressFrame
+    global loadProgress
+    global tasksCanvas
+    global tasksFrame
+    global scrollbar
+    global autosaveEnabled
+    global searchText
+    global performanceOverlay
+    global busyIndicator
+    global tabButtonFrame
+    global watchEnabled
+    
+    taskList = tk.Tk() # creates the window
+    taskList.title("Task List") # titles the window
+    taskList.config(bg = "#1A558C") # colors the window - dark blue
+    taskList.protocol("WM_DELETE_WINDOW", closeMainWindow) # finishes autosaving before closing
+    createTheme()
+    
+    ### CREATE MAIN WINDOW HEADER
+    
+    headerFrame = tk.Frame( # creates the frame
+        taskList,
+        bg = "#00A2E8" # colors the frame - light blue
+    )
+    headerFrame.pack( # places the header in the main window
+        side = "top",
+        fill = "x" # ensures the header stretches with the window
+    )
+    
+    toDoList = tk.Label( # creates text "To-Do List" in the header
+        headerFrame,
+        text = "To-Do List",
+        font = themeFonts["title"], # changes the font and text size
+        fg = "#FFFFFF", # colors the text - white
+        bg = "#00A2E8" # prevents a gray block in the window
+    )
+    toDoList.pack( # places the text within the frame
+        anchor = "center",
+        expand = True,
+        fill = "both",
+        padx = 15,
+        pady = 5
+    )
+    
+    tabBar = tk.Frame( # creates a frame for the tabs of the open lists
+        headerFrame,
+        bg = "#00A2E8" # colors the frame - light blue
+    )
+    tabBar.pack( # places the tab bar at the bottom of the header
+        side = "bottom",
+        fill = "x",
+        padx = 15,
+        pady = (5, 0)
+    )
+    
+    tabButtonFrame = tk.Frame( # holds one button per open list
+        tabBar,
+        bg = "#00A2E8" # colors the frame - light blue
+    )
+    tabButtonFrame.pack(side = "left", fill = "x", expand = True)
+    
+    for tabText, tabCommand in ( # creates buttons to open a new list, join a shared one, and close the shown one
+        ("Close List", closeTab),
+        ("Join Shared List", joinSharedList),
+        ("New List", newTab)
+    ):
+        tabCommandButton = tk.Button(
+            tabBar,
+            command = tabCommand,
+            text = tabText,
+            font = themeFonts["small"], # changes font and text size
+            bg = "#00A2E8", # colors the button
+            activebackground = "#FFFFFF",
+            fg = "#FFFFFF", # colors the text
+            activeforeground = "#00A2E8"
+        )
+        tabCommandButton.pack(side = "right") # places the button within the tab bar
+    
+    searchFrame = tk.Frame( # creates a frame for the search box
+        headerFrame,
+        bg = "#00A2E8" # colors the frame - light blue
+    )
+    searchFrame.pack( # places the frame within the header
+        side = "bottom",
+        fill = "x",
+        padx = 15
+    )
+    
+    searchLabel = tk.Label( # creates text "Search:" beside the search box
+        searchFrame,
+        text = "Search:",
+        font = themeFonts["body"], # changes the font and text size
+        fg = "#FFFFFF", # colors the text - white
+        bg = "#00A2E8" # prevents a gray block in the window
+    )
+    searchLabel.pack(side = "left") # places the text within the frame
+    
+    searchText = tk.StringVar() # holds what has been typed into the search box
+    searchText.trace_add("write", scheduleSearch) # catches typing, pasting, and clearing alike
+    searchEntry = tk.Entry( # creates the search box
+        searchFrame,
+        textvariable = searchText,
+        font = themeFonts["body"] # changes the font and text size
+    )
+    searchEntry.pack( # places the search box within the frame
+        side = "left",
+        fill = "x",
+        expand = True,
+        padx = 5
+    )
+    searchEntry.bind("<Escape>", clearSearch) # Escape shows the whole list again
+    
+    trackerFrame = tk.Frame( # creates a frame for the tracker and load progress
+        headerFrame,
+        bg = "#00A2E8" # colors the frame - light blue
+    )
+    trackerFrame.pack( # places the frame within the header
+        side = "bottom",
+        fill = "x"
+    )
+    
+    taskCompletion = tk.Label( # creates a label to track user progress
+        trackerFrame,
+        text = f"{taskStore.completedCount}/{len(taskStore)} Tasks Completed",
+        font = themeFonts["body"], # changes the font and text size
+        fg = "#FFFFFF", # colors the text - white
+        bg = "#00A2E8" # prevents a gray block in the window
+    )
+    taskCompletion.pack( # places the tracker within the frame
+        side = "left",
+        anchor = "center",
+        expand = True,
+        fill = "both",
+        pady = 10
+    )
+    
+    busyIndicator = tk.Label( # shows that a file is being read or written; only shown while it is
+        trackerFrame,
+        text = "",
+        font = themeFonts["body"], # changes the font and text size
+        fg = "#FFFFFF", # colors the text - white
+        bg = "#00A2E8" # prevents a gray block in the window
+    )
+    
+    loadProgressFrame = tk.Frame( # holds the load progress; only shown while a long load runs
+        trackerFrame,
+        bg = "#00A2E8" # colors the frame - light blue
+    )
+    
+    loadProgress = tk.Label( # creates a label to show how much of the file is loaded
+        loadProgressFrame,
+        text = "",
+        font = themeFonts["body"], # changes the font and text size
+        fg = "#FFFFFF", # colors the text - white
+        bg = "#00A2E8" # prevents a gray block in the window
+    )
+    loadProgress.pack(side = "left") # places the label within the frame
+    
+    cancelLoading = tk.Button( # creates a button to stop a load part way through
+        loadProgressFrame,
+        command = cancelLoad,
+        text = "Cancel",
+        font = themeFonts["small"], # changes font and text size
+        bg = "#00A2E8", # colors the button
+        activebackground = "#FFFFFF",
+        fg = "#FFFFFF", # colors the text
+        activeforeground = "#00A2E8"
+    )
+    cancelLoading.pack(side = "left", padx = 5) # places the button within the frame
+    
+    ### CREATE MAIN WINDOW BUTTON FRAME
+    
+    buttonFrame = tk.Frame(taskList) # creates the frame
+    buttonFrame.pack( # places the frame in the main window
+        side = "bottom",
+        fill = "x" # ensures the frame stretches with the window
+    )
+    buttonFrame.config(bg = "#00A2E8") # colors the frame - light blue
+    
+    newItem = tk.Button( # creates a button to generate new items
+        buttonFrame,
+        command = newTaskWindow,
+        text = "Add Task",
+        font = themeFonts["body"], # changes font and text size
+        bg = "#00A2E8", # colors the button
+        activebackground = "#FFFFFF",
+        fg = "#FFFFFF", # colors the text
+        activeforeground = "#00A2E8"
+    )
+    newItem.pack( # places the button within the frame
+        side = "top",
+        fill = "x"
+    )
+    
+    bulkFrame = tk.Frame( # creates a frame for the bulk action buttons
+        buttonFrame,
+        bg = "#00A2E8" # colors the frame - light blue
+    )
+    bulkFrame.pack( # places the frame within the button frame, under Add Task
+        side = "top",
+        fill = "x"
+    )
+    
+    for bulkText, bulkCommand in ( # creates a button for each bulk action
+        ("Complete Selected", completeSelected),
+        ("Uncomplete Selected", uncompleteSelected),
+        ("Delete Selected", deleteSelected),
+        ("Delete Completed", deleteCompleted),
+        ("Select Overdue", selectOverdue),
+        ("Undo", undoChange),
+        ("Redo", redoChange)
+    ):
+        bulkButton = tk.Button(
+            bulkFrame,
+            command = bulkCommand,
+            text = bulkText,
+            font = themeFonts["small"], # changes font and text size
+            bg = "#00A2E8", # colors the button
+            activebackground = "#FFFFFF",
+            fg = "#FFFFFF", # colors the text
+            activeforeground = "#00A2E8"
+        )
+        bulkButton.pack( # places the button within the frame
+            side = "left",
+            fill = "x",
+            expand = True
+        )
+    
+    helpButton = tk.Button( # creates a button to load data from a file
+        buttonFrame,
+        command = tutorialScreen,
+        text = "Help",
+        font = themeFonts["body"], # changes font and text size
+        bg = "#00A2E8", # colors the button
+        activebackground = "#FFFFFF",
+        fg = "#FFFFFF", # colors the text
+        activeforeground = "#00A2E8"
+    )
+    helpButton.pack( # places the button within the frame
+        side = "left",
+        fill = "x",
+        expand = True
+    )
+    
+    saveData = tk.Button( # creates a button to save data to a file
+        buttonFrame,
+        command = saveToFile,
+        text = "Save",
+        font = themeFonts["body"], # changes font and text size
+        bg = "#00A2E8", # colors the button
+        activebackground = "#FFFFFF",
+        fg = "#FFFFFF", # colors the text
+        activeforeground = "#00A2E8"
+    )
+    saveData.pack( # places the button within the frame
+        side = "left",
+        fill = "x",
+        expand = True
+    )
+    
+    loadData = tk.Button( # creates a button to load data from a file
+        buttonFrame,
+        command = loadFromFile,
+        text = "Load",
+        font = themeFonts["body"], # changes font and text size
+        bg = "#00A2E8", # colors the button
+        activebackground = "#FFFFFF",
+        fg = "#FFFFFF", # colors the text
+        activeforeground = "#00A2E8"
+    )
+    loadData.pack( # places the button within the frame
+        side = "left",
+        fill = "x",
+        expand = True
+    )
+    
+    importData = tk.Button( # creates a button to add the tasks from another file, like a CSV or iCalendar file
+        buttonFrame,
+        command = importFromFile,
+        text = "Import",
+        font = themeFonts["body"], # changes font and text size
+        bg = "#00A2E8", # colors the button
+        activebackground = "#FFFFFF",
+        fg = "#FFFFFF", # colors the text
+        activeforeground = "#00A2E8"
+    )
+    importData.pack( # places the button within the frame
+        side = "left",
+        fill = "x",
+        expand = True
+    )
+    
+    autosaveEnabled = tk.IntVar(value = 0) # autosave starts off
+    autosaveToggle = tk.Checkbutton( # creates a toggle to journal every change to the current file
+        buttonFrame,
+        variable = autosaveEnabled,
+        command = toggleAutosave,
+        text = "Autosave",
+        font = themeFonts["body"], # changes font and text size
+        selectcolor = "#1A558C", # colors the checkbox - dark blue
+        bg = "#00A2E8", # colors the toggle
+        activebackground = "#00A2E8",
+        fg = "#FFFFFF", # colors the text
+        activeforeground = "#FFFFFF"
+    )
+    autosaveToggle.pack( # places the toggle within the frame
+        side = "left",
+        fill = "x",
+        expand = True
+    )
+    
+    watchEnabled = tk.IntVar(value = 0) # watching starts off
+    watchToggle = tk.Checkbutton( # creates a toggle to bring in changes other programs make to the open file
+        buttonFrame,
+        variable = watchEnabled,
+        command = toggleWatch,
+        text = "Watch File",
+        font = themeFonts["body"], # changes font and text size
+        selectcolor = "#1A558C", # colors the checkbox - dark blue
+        bg = "#00A2E8", # colors the toggle
+        activebackground = "#00A2E8",
+        fg = "#FFFFFF", # colors the text
+        activeforeground = "#FFFFFF"
+    )
+    watchToggle.pack( # places the toggle within the frame
+        side = "left",
+        fill = "x",
+        expand = True
+    )
+    
+    ### CREATE LIST FRAME
+    
+    listFrame = tk.Frame(taskList) # creates the frame
+    listFrame.pack(fill = "both", expand = True) # places the frame in the main window, ensures it stretches with the window
+    listFrame.config(bg = "#1A558C") # colors the frame - dark blue
+    
+    columnFrame = tk.Frame(listFrame) # creates a frame for column headers
+    columnFrame.pack( # places the frame in the window
+        side = "top",
+        fill = "x"
+    )
+    columnFrame.config(bg = "#1A558C") # colors the frame - dark blue
+    columnFrame.columnconfigure(1, weight = 0, minsize = 30) # spaces columns
+    columnFrame.columnconfigure(2, weight = 1, minsize = 200)
+    columnFrame.columnconfigure(3, weight = 1, minsize = 150)
+    columnFrame.columnconfigure(4, weight = 0, minsize = 80)
+    columnFrame.columnconfigure(5, weight = 0, minsize = 35)
+    
+    columnTask = tk.Label( # creates column2 header "Task"
+        columnFrame,
+        text = "Task",
+        font = themeFonts["heading"], # changes the font and text size
+        fg = "#FFFFFF", # colors the text - white
+        bg = "#1A558C" # prevents a gray block in the window
+    )
+    columnTask.grid( # places the text within the frame
+        row = 0,
+        column = 2,
+        padx = 5
+    )
+    
+    columnDeadline = tk.Label( # creates column3 header "Deadline"
+        columnFrame,
+        text = "Deadline",
+        font = themeFonts["heading"], # changes the font and text size
+        fg = "#FFFFFF", # colors the text - white
+        bg = "#1A558C" # prevents a gray block in the window
+    )
+    columnDeadline.grid( # places the text within the frame
+        row = 0,
+        column = 3,
+        padx = 5
+    )
+    
+    tasksCanvas = tk.Canvas(taskList) # creates a canvas for the list
+    tasksCanvas.pack( # places canvas in the window
+        side = "left",
+        fill = "both",
+        expand = True
+    )
+    tasksCanvas.config(bg = "#1A558C", highlightthickness = 0) # colors the canvas - dark blue
+    
+    scrollbar = tk.Scrollbar( # adds a scrollbar to the task list
+        taskList,
+        orient = "vertical",
+        command=tasksCanvas.yview
+    )
+    scrollbar.pack( # places the scrollbar in the window
+        side="right",
+        fill="y")
+    tasksCanvas.configure(yscrollcommand=scrollbar.set) # connects the scrollbar to the canvas
+    tasksCanvas.bind('<Configure>', lambda e: tasksCanvas.configure(scrollregion = tasksCanvas.bbox("all"))) # enables scrolling functionality
+    
+    tasksFrame = tk.Frame(tasksCanvas) # creates a frame for added items
+    tasksFrame.pack(fill = "both", expand = True) # places the frame in the window
+    tasksFrame.config(bg="#1A558C") # colors the frame - dark blue
+    tasksFrame.columnconfigure(1, weight = 0, minsize = 30) # spaces columns
+    tasksFrame.columnconfigure(2, weight = 1, minsize = 200)
+    tasksFrame.columnconfigure(3, weight = 1, minsize = 150)
+    tasksFrame.columnconfigure(4, weight = 0, minsize = 80)
+    bindTaskRows() # one set of handlers for every row built from now on
+    
+    ### PLACE LIST IN CANVAS
+    
+    tasksCanvas.create_window((0, 0), window=tasksFrame, anchor="nw")
+    
+    tasksFrame.bind("<Configure>", updateScrollRegion)
+    
+    tasksCanvas.bind("<Configure>", resizeTasksFrame)
+    
+    ### CREATE PERFORMANCE OVERLAY
+    
+    performanceOverlay = tk.Label( # shows live timings; only placed while toggled on
+        taskList,
+        text = "",
+        justify = tk.LEFT,
+        font = ("Courier", 11), # a fixed-width font keeps the numbers from jumping around
+        fg = "#FFFFFF", # colors the text - white
+        bg = "#000000" # stands out against the list
+    )
+    taskList.bind("<Control-z>", undoChange) # undo and redo shortcuts
+    taskList.bind("<Control-y>", redoChange)
+    taskList.bind("<Control-Z>", redoChange) # Ctrl+Shift+Z
+    taskList.bind("<Control-t>", newTab) # tab shortcuts
+    taskList.bind("<Control-w>", closeTab)
+    taskList.bind("<Control-Tab>", nextTab)
+    taskList.bind("<Control-equal>", lambda event: resizeText(1)) # text size shortcuts
+    taskList.bind("<Control-minus>", lambda event: resizeText(-1))
+    taskList.bind("<F12>", toggleOverlay)
+    taskList.bind("<Shift-F12>", toggleCapture)
+    
+    ### CONNECT TASK MODEL
+    
+    taskStore.subscribe(onTasksChanged) # keeps the rows and tracker in step with the task data
+    drawTabBar()
+    tasksCanvas.bind("<Expose>", noteFirstPaint, add = "+") # measures how long the window took to show the list
+    scheduleReminder() # highlights tasks, and reminds of them, as they come due
 
 ### END OF PROGRAM
-taskList.mainloop() # prevents the program from closing prematurely
\ No newline at end of file
+if __name__ == "__main__":
+    buildMainWindow()
+    restoreSession() # before the first paint, so the last session's first page is what is drawn
+    taskList.mainloop() # prevents the program from closing prematurely
@@ -0,0 +1,5 @@
+"""
+Package: benchmarks
+Purpose: Measures how the Task List window scales with the size of the list.
+    Run "python -m benchmarks.run" from the project folder; see benchmarks/run.py for the options.
+"""
@@ -0,0 +1,57 @@
+"""
+Module: benchmarks.generate
+Purpose: Writes synthetic task lists in the same format as StarterPack.json, at any size.
+    The same seed always produces the same file, so results from different versions can be compared.
+
+Usage:
+    python -m benchmarks.generate COUNT OUTPUT [--seed SEED]
+"""
+
+import argparse # used for reading the command line
+import datetime # used for writing date deadlines
+import random # used for making up tasks
+
+from tasklist.core import writeRecordsFile
+
+verbs = ("Buy", "Call", "Email", "Review", "Write", "Plan", "Clean", "Fix", "Pay", "Read", "Finish", "Book")
+nouns = ("groceries", "report", "dentist", "budget", "slides", "garage", "invoice", "essay", "taxes", "flights", "car", "meeting notes")
+extras = ("", "", "", "for Monday", "before the weekend", "with Sam", "again", "(urgent)", "and send it over")
+freeDeadlines = ("", "", "ASAP", "soon", "whenever", "end of semester", "before finals")
+weekdays = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+def makeDeadline(generator, today):
+    kind = generator.random()
+    if kind < 0.35: # free text, which is kept but not tracked
+        return generator.choice(freeDeadlines)
+    day = today + datetime.timedelta(days = generator.randint(-30, 90)) # some already overdue
+    if kind < 0.65:
+        return f"{day.month}/{day.day}/{day.year}"
+    if kind < 0.8:
+        return day.strftime("%b %d")
+    if kind < 0.9:
+        return day.isoformat()
+    return f"{generator.choice(weekdays)} {generator.randint(1, 12)}pm"
+
+def generateRecords(count, seed = 140):
+    """Yields count (taskId, completed, task, deadline) records, the same ones for the same seed."""
+    generator = random.Random(seed)
+    today = datetime.date(2026, 10, 17) # fixed so the file doesn't depend on when it was made
+    for taskId in range(1, count + 1):
+        task = f"{generator.choice(verbs)} {generator.choice(nouns)} {generator.choice(extras)}".strip()
+        completed = 1 if generator.random() < 0.3 else 0
+        yield (taskId, completed, task, makeDeadline(generator, today))
+
+def generateTaskFile(filePath, count, seed = 140):
+    writeRecordsFile(filePath, generateRecords(count, seed))
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = "python -m benchmarks.generate", description = "Write a synthetic task list file.")
+    parser.add_argument("count", type = int, help = "number of tasks")
+    parser.add_argument("output", help = "file to write")
+    parser.add_argument("--seed", type = int, default = 140, help = "random seed (default: 140)")
+    arguments = parser.parse_args(argv)
+    generateTaskFile(arguments.output, arguments.count, arguments.seed)
+    print(f"Wrote {arguments.count} tasks to \"{arguments.output}\".")
+
+if __name__ == "__main__":
+    main()
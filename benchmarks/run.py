@@ -0,0 +1,213 @@
+"""
+Module: benchmarks.run
+Purpose: Times the window's load, add, delete, reconcile, and save at several list sizes, and writes the results as JSON.
+    Each size is run twice: once for timings, and once under tracemalloc for peak memory,
+    so tracing doesn't slow down the timed run. The widget count is taken after each load.
+    Without a display, a virtual X server (Xvfb) is started for the run; the file dialogs are stubbed out,
+    and sessions are turned off so the run doesn't replace the lists the window reopens.
+
+Usage:
+    python -m benchmarks.run [--sizes 1000,10000,100000] [--mode auto|classic|virtual]
+                             [--operations N] [-o RESULTS] [--compare OLD_RESULTS]
+
+Compare two versions by saving each one's results and passing the older file to --compare;
+the ratios printed are new time / old time, so anything well above 1.0 is a regression.
+"""
+
+import argparse # used for reading the command line
+import contextlib # used for keeping the program's messages out of the results
+import json # used for writing the results
+import os # used for finding the display and temporary files
+import platform # used for recording what the results were measured on
+import subprocess # used for starting the virtual X server
+import sys # used for printing errors
+import tempfile # used for the generated files
+import time # used for timing
+import tracemalloc # used for peak memory
+
+from benchmarks.generate import generateTaskFile
+
+defaultSizes = (1000, 10000, 100000)
+
+### VIRTUAL DISPLAY
+
+def startVirtualDisplay():
+    """Starts Xvfb on a free display number and points DISPLAY at it. Returns the server process."""
+    readEnd, writeEnd = os.pipe()
+    try:
+        server = subprocess.Popen( # Xvfb writes the display number it picked to writeEnd once it is ready
+            ["Xvfb", "-displayfd", str(writeEnd), "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+            pass_fds = (writeEnd,),
+            stderr = subprocess.DEVNULL
+        )
+    except FileNotFoundError:
+        os.close(readEnd)
+        os.close(writeEnd)
+        raise SystemExit("Error: no display is available and Xvfb is not installed.")
+    os.close(writeEnd)
+    with os.fdopen(readEnd) as displayPipe:
+        displayNumber = displayPipe.readline().strip()
+    if not displayNumber:
+        server.kill()
+        raise SystemExit("Error: Xvfb did not start.")
+    os.environ["DISPLAY"] = f":{displayNumber}"
+    return server
+
+### WINDOW DRIVING
+
+def countWidgets(widget):
+    return sum(1 + countWidgets(child) for child in widget.winfo_children())
+
+def stubDialogs(paths):
+    """Makes the file dialogs answer with paths["open"] and paths["save"] instead of asking."""
+    from tkinter import filedialog # the window imports it only when a dialog is first opened, so it is patched where it lives
+    
+    filedialog.askopenfilename = lambda **options: paths["open"]
+    filedialog.asksaveasfilename = lambda **options: paths["save"]
+
+def settle(app):
+    app.taskList.update() # draws everything the last operation changed
+    while app.ioWorker.busy() or app.loadState is not None: # waits for background file work, then runs the time-sliced load to the end
+        app.taskList.update()
+
+def emptyList(app):
+    app.taskStore.replaceAll([]) # loading into an empty list is a load; into a full one, it is a reconcile
+    settle(app)
+
+def loadList(app):
+    app.loadFromFile()
+    settle(app)
+
+def addTasks(app, count):
+    for number in range(count):
+        app.addNewTask(f"Benchmark task {number}", "10/31/2026")
+        app.taskList.update_idletasks() # each add is drawn before the next, like typing them in
+    settle(app)
+
+def deleteTasks(app, count):
+    for number in range(count):
+        if not len(app.taskStore):
+            break
+        app.deleteTask(app.taskStore.taskAt(len(app.taskStore) // 2).taskId) # the middle of the list is the worst case for shifting rows
+        app.taskList.update_idletasks()
+    settle(app)
+
+def saveList(app):
+    app.saveToFile()
+    settle(app)
+
+def runSequence(app, size, operations, traced):
+    """Loads, adds, deletes, reloads, and saves once, returning {operation: measurements}.
+    The reload reads the same file into the changed list, so it times matching the list to the file."""
+    steps = (
+        ("load", lambda: loadList(app), size),
+        ("add", lambda: addTasks(app, operations), operations),
+        ("delete", lambda: deleteTasks(app, operations), operations),
+        ("reconcile", lambda: loadList(app), size),
+        ("save", lambda: saveList(app), size)
+    )
+    emptyList(app) # the list from the run before isn't part of the load
+    results = {}
+    for name, step, count in steps:
+        if traced:
+            tracemalloc.start()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(sys.stderr): # the program's messages go to stderr, leaving stdout for the results
+            step()
+        seconds = time.perf_counter() - start
+        if traced:
+            results[name] = {"peakBytes": tracemalloc.get_traced_memory()[1]}
+            tracemalloc.stop()
+        else:
+            results[name] = {
+                "seconds": seconds,
+                "perOperation": seconds / max(1, count),
+                "widgets": countWidgets(app.taskList),
+                "tasks": len(app.taskStore)
+            }
+    return results
+
+def runBenchmarks(sizes, mode, operations, workFolder):
+    import TaskList as app # imported only once a display exists
+    
+    app.listMode = mode
+    app.sessionDirectory = "" # keeps the benchmark lists out of the user's own session
+    app.buildMainWindow()
+    app.taskList.geometry("900x700")
+    paths = {"open": None, "save": os.path.join(workFolder, "saved.json")}
+    stubDialogs(paths)
+    settle(app)
+    
+    results = []
+    for size in sizes:
+        paths["open"] = os.path.join(workFolder, f"tasks{size}.json")
+        generateTaskFile(paths["open"], size)
+        timed = runSequence(app, size, operations, traced = False)
+        traced = runSequence(app, size, operations, traced = True)
+        for name in timed:
+            results.append({"size": size, "mode": mode, "operation": name, **timed[name], **traced[name]})
+        print(f"{size} tasks: " + ", ".join(f"{name} {timed[name]['seconds']:.3f}s" for name in timed), file = sys.stderr)
+    
+    app.closeMainWindow()
+    return results
+
+### RESULTS
+
+def describeVersion():
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], capture_output = True, text = True, check = True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def compareResults(old, new):
+    """Prints new time / old time for every operation measured in both runs."""
+    oldTimes = {(result["size"], result["mode"], result["operation"]): result["seconds"] for result in old["results"]}
+    print(f"Compared with {old['version']}:", file = sys.stderr)
+    for result in new["results"]:
+        key = (result["size"], result["mode"], result["operation"])
+        if key in oldTimes and oldTimes[key] > 0:
+            print(f"    {key[0]:>7} {key[1]:<8} {key[2]:<9} {result['seconds'] / oldTimes[key]:6.2f}x", file = sys.stderr)
+
+def parseSizes(text):
+    return [int(size) for size in text.split(",") if size]
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(prog = "python -m benchmarks.run", description = "Benchmark the Task List window.")
+    parser.add_argument("--sizes", type = parseSizes, default = list(defaultSizes), help = "comma-separated list sizes (default: 1000,10000,100000)")
+    parser.add_argument("--mode", choices = ("auto", "classic", "virtual"), default = "auto", help = "how the list is drawn (default: auto)")
+    parser.add_argument("--operations", type = int, default = 100, help = "tasks added and deleted per size (default: 100)")
+    parser.add_argument("-o", "--output", help = "write the results here instead of to stdout")
+    parser.add_argument("--compare", help = "earlier results to compare against")
+    arguments = parser.parse_args(argv)
+    
+    server = None
+    if not os.environ.get("DISPLAY"):
+        server = startVirtualDisplay()
+    try:
+        with tempfile.TemporaryDirectory() as workFolder:
+            results = runBenchmarks(arguments.sizes, arguments.mode, arguments.operations, workFolder)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    
+    report = {
+        "version": describeVersion(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "operations": arguments.operations,
+        "results": results
+    }
+    if arguments.output:
+        with open(arguments.output, 'w') as outputFile:
+            json.dump(report, outputFile, indent = 4)
+    else:
+        json.dump(report, sys.stdout, indent = 4)
+        print()
+    
+    if arguments.compare:
+        with open(arguments.compare, 'r') as compareFile:
+            compareResults(json.load(compareFile), report)
+
+if __name__ == "__main__":
+    main()
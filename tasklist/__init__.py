@@ -0,0 +1,28 @@
+"""
+Package: tasklist
+Purpose: The importable core of the Task List program.
+    The window (TaskList.py) and the command line (python -m tasklist) both work through it.
+"""
+
+from tasklist.core import Task, TaskStore, recordsFromDict, readTaskFile, streamRecords, writeTaskFile, saveRecords, writeRecordsFile, loadStore, isDatabasePath
+from tasklist.interchange import isInterchangePath
+from tasklist.journal import TaskJournal, hasJournal, readJournaledFile, loadJournaledStore, discardJournal
+
+__all__ = [
+    "Task",
+    "TaskStore",
+    "recordsFromDict",
+    "readTaskFile",
+    "streamRecords",
+    "writeTaskFile",
+    "saveRecords",
+    "writeRecordsFile",
+    "loadStore",
+    "isDatabasePath",
+    "isInterchangePath",
+    "TaskJournal",
+    "hasJournal",
+    "readJournaledFile",
+    "loadJournaledStore",
+    "discardJournal",
+]
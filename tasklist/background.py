@@ -0,0 +1,47 @@
+"""
+Module: tasklist.background
+Purpose: Runs slow work (reading, writing, and encoding files) on a worker thread.
+    Finished work is queued, and its callback runs only when the window's thread collects it with deliver(),
+    so callbacks can safely touch widgets while the work itself never does.
+"""
+
+import queue # used for handing results back to the window's thread
+from concurrent.futures import ThreadPoolExecutor # used for the worker thread
+
+class BackgroundWorker:
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers = 1, thread_name_prefix = "tasklist-io") # one thread, so work finishes in the order it was given
+        self.results = queue.SimpleQueue() # (callback, value) for work that has finished
+        self.pending = 0 # work given out and not yet delivered
+    
+    def submit(self, work, onDone = None, onError = None):
+        """Runs work() on the worker thread; deliver() later calls onDone(result), or onError(error) if it raised."""
+        self.pending += 1
+        
+        def runWork():
+            try:
+                outcome = (onDone, work())
+            except Exception as error: # handed back to the window's thread instead of being lost on this one
+                outcome = (onError, error)
+            self.results.put(outcome)
+        
+        self.executor.submit(runWork)
+    
+    def busy(self):
+        return self.pending > 0
+    
+    def deliver(self):
+        """Calls the callbacks of all finished work. Only call this from the thread that owns the window."""
+        while True:
+            try:
+                callback, value = self.results.get_nowait()
+            except queue.Empty:
+                return
+            self.pending -= 1
+            if callback is not None:
+                callback(value)
+    
+    def shutdown(self):
+        """Waits for all work to finish, then delivers it."""
+        self.executor.shutdown(wait = True)
+        self.deliver()
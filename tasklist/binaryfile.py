@@ -0,0 +1,101 @@
+"""
+Module: tasklist.binaryfile
+Purpose: A compact binary save file format for large lists, read straight from disk through mmap.
+    Files start with the bytes "TLST", so they are recognized whatever they are named;
+    new files are written in this format when their name ends in ".tlist".
+
+Layout (all numbers little-endian):
+    header      "TLST", format version (uint16), flags (uint16), task count (uint64), text size in bytes (uint64)
+    ids         one int64 per task
+    completed   one byte per task
+    lengths     two uint32 per task: the task's description and deadline lengths, in characters
+    text        every description and deadline, one after another, as UTF-8
+Each column is read with a single call, and all the text is decoded at once.
+"""
+
+import mmap # used for reading files without copying them into memory first
+import os # used for replacing save files safely
+import struct # used for the header
+import sys # used for checking the machine's byte order
+from array import array # used for reading and writing whole columns of numbers
+from itertools import accumulate # used for finding where each string starts
+
+binaryMagic = b"TLST" # the first bytes of every binary save file
+binaryVersion = 1
+binaryExtensions = (".tlist",) # files saved in the binary format
+headerFormat = struct.Struct("<4sHHQQ")
+lengthType = "I" if array("I").itemsize == 4 else "L" # whichever array type is 4 bytes on this machine
+swapBytes = sys.byteorder == "big" # arrays use the machine's byte order; files are always little-endian
+
+def isBinaryPath(filePath):
+    return filePath.lower().endswith(binaryExtensions)
+
+def hasBinaryMagic(data):
+    return bytes(data[:len(binaryMagic)]) == binaryMagic
+
+def writeBinaryFile(filePath, records, durable = False):
+    ids = array("q")
+    completedFlags = bytearray()
+    lengths = array(lengthType)
+    strings = []
+    for taskId, completed, task, deadline in records:
+        ids.append(taskId)
+        completedFlags.append(1 if completed else 0)
+        lengths.append(len(task))
+        lengths.append(len(deadline))
+        strings.append(task)
+        strings.append(deadline)
+    text = "".join(strings).encode("utf-8")
+    if swapBytes:
+        ids.byteswap()
+        lengths.byteswap()
+    
+    temporaryPath = filePath + ".tmp" # writes beside the file first so a failed save can't leave it half-written
+    with open(temporaryPath, 'wb') as saveFile:
+        saveFile.write(headerFormat.pack(binaryMagic, binaryVersion, 0, len(ids), len(text)))
+        saveFile.write(ids.tobytes())
+        saveFile.write(completedFlags)
+        saveFile.write(lengths.tobytes())
+        saveFile.write(text)
+        if durable: # makes sure the data is on disk before it replaces the old file
+            saveFile.flush()
+            os.fsync(saveFile.fileno())
+    os.replace(temporaryPath, filePath)
+
+def readBinaryData(data):
+    """Turns the contents of a binary save file (bytes or an mmap) into (taskId, completed, task, deadline) records."""
+    if len(data) < headerFormat.size:
+        raise ValueError("binary task file is too short to have a header")
+    magic, version, flags, count, textSize = headerFormat.unpack_from(data)
+    if magic != binaryMagic:
+        raise ValueError("not a binary task file")
+    if version != binaryVersion:
+        raise ValueError(f"binary task file version {version} is not supported")
+    
+    idsStart = headerFormat.size
+    completedStart = idsStart + 8 * count
+    lengthsStart = completedStart + count
+    textStart = lengthsStart + 8 * count
+    if len(data) < textStart + textSize:
+        raise ValueError("binary task file is cut short")
+    
+    ids = array("q")
+    ids.frombytes(data[idsStart:completedStart])
+    completedFlags = data[completedStart:lengthsStart]
+    lengths = array(lengthType)
+    lengths.frombytes(data[lengthsStart:textStart])
+    if swapBytes:
+        ids.byteswap()
+        lengths.byteswap()
+    text = str(data[textStart:textStart + textSize], "utf-8")
+    
+    offsets = list(accumulate(lengths, initial = 0))
+    strings = [text[start:end] for start, end in zip(offsets, offsets[1:])]
+    return list(zip(ids, completedFlags, strings[0::2], strings[1::2]))
+
+def readBinaryFile(filePath):
+    with open(filePath, 'rb') as loadFile:
+        if os.fstat(loadFile.fileno()).st_size == 0: # empty files can't be mapped
+            return readBinaryData(b"")
+        with mmap.mmap(loadFile.fileno(), 0, access = mmap.ACCESS_READ) as data:
+            return readBinaryData(data)
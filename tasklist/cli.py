@@ -0,0 +1,207 @@
+"""
+Module: tasklist.cli
+Purpose: Command line access to task list files, for scripting and bulk changes.
+    Works on the same JSON files as the window, and never imports tkinter so it starts quickly.
+
+Usage:
+    python -m tasklist [-f FILE] ls [--pending | --done]
+    python -m tasklist [-f FILE] due [-n COUNT]
+    python -m tasklist [-f FILE] add TASK [-d DEADLINE]
+    python -m tasklist [-f FILE] done ID [ID ...] [--undo]
+    python -m tasklist [-f FILE] rm ID [ID ...]
+    python -m tasklist [-f FILE] export [-o OUTPUT]
+    python -m tasklist [-f FILE] import SOURCE
+    python -m tasklist convert SOURCE OUTPUT
+    python -m tasklist [-f FILE] compact
+    python -m tasklist [-f FILE] serve [--host HOST] [--port PORT | --socket PATH]
+
+Files the window is autosaving keep their journal: changes are appended to it instead of rewriting the file.
+FILE may also be an SQLite database (.db, .sqlite, .sqlite3); each change is then a single-row update.
+Exporting to, or importing from, a database file converts between the two formats.
+FILE may also be a compact binary file; new ones are made by exporting to a name ending in ".tlist".
+Exporting to a name ending in ".csv" or ".ics" writes a CSV or iCalendar file, and both can be imported.
+"convert" copies SOURCE to OUTPUT in the format OUTPUT's name asks for, a task at a time,
+    so even very large CSV and iCalendar files are converted without reading them all in.
+"serve" shares FILE with several windows at once (Join Shared List in the window) until stopped with Ctrl+C.
+"""
+
+import argparse # used for reading the command line
+import json # used for exporting
+import os # used for finding the default file
+import sys # used for printing errors
+
+from tasklist.core import isDatabasePath, loadStore, writeTaskFile, saveRecords, streamRecords
+from tasklist.interchange import chunks, isInterchangePath
+from tasklist.binaryfile import isBinaryPath
+from tasklist.deadlines import DeadlineIndex
+from tasklist.journal import TaskJournal, hasJournal, loadJournaledStore, discardJournal
+from tasklist.sync import defaultHost, defaultPort
+
+defaultFile = os.environ.get("TASKLIST_FILE", "tasks.json") # the list used when no file is given
+importChunk = 10000 # tasks read and added at a time when importing
+
+def buildParser():
+    parser = argparse.ArgumentParser(prog = "python -m tasklist", description = "Manage a task list file.")
+    parser.add_argument("-f", "--file", default = defaultFile, help = f"task list file (default: {defaultFile})")
+    commands = parser.add_subparsers(dest = "command", required = True)
+    
+    listCommand = commands.add_parser("ls", help = "list tasks")
+    listFilter = listCommand.add_mutually_exclusive_group()
+    listFilter.add_argument("--pending", action = "store_true", help = "only tasks not yet completed")
+    listFilter.add_argument("--done", action = "store_true", help = "only completed tasks")
+    
+    dueCommand = commands.add_parser("due", help = "list overdue tasks, tasks due today, and the next tasks due")
+    dueCommand.add_argument("-n", "--count", type = int, default = 5, help = "how many upcoming tasks to show (default: 5)")
+    
+    addCommand = commands.add_parser("add", help = "add a task")
+    addCommand.add_argument("task", help = "the task's description")
+    addCommand.add_argument("-d", "--deadline", default = "", help = "the task's deadline")
+    
+    doneCommand = commands.add_parser("done", help = "mark tasks as completed")
+    doneCommand.add_argument("ids", nargs = "+", type = int, help = "task ids, as shown by ls")
+    doneCommand.add_argument("--undo", action = "store_true", help = "mark the tasks as not completed instead")
+    
+    removeCommand = commands.add_parser("rm", help = "delete tasks")
+    removeCommand.add_argument("ids", nargs = "+", type = int, help = "task ids, as shown by ls")
+    
+    exportCommand = commands.add_parser("export", help = "write the list as JSON, or in the format the output file's name asks for")
+    exportCommand.add_argument("-o", "--output", default = "-", help = "output file (default: standard output)")
+    
+    importCommand = commands.add_parser("import", help = "add every task from another list file")
+    importCommand.add_argument("source", help = "a JSON save file, database, \".tlist\", CSV or iCalendar file")
+    
+    convertCommand = commands.add_parser("convert", help = "copy a list file into another format")
+    convertCommand.add_argument("source", help = "the file to read")
+    convertCommand.add_argument("output", help = "the file to write; its name picks the format")
+    
+    commands.add_parser("compact", help = "fold an autosave journal back into the file")
+    
+    serveCommand = commands.add_parser("serve", help = "share the list with several windows through a local sync server")
+    serveCommand.add_argument("--host", default = defaultHost, help = f"address to listen on (default: {defaultHost})")
+    serveCommand.add_argument("--port", type = int, default = defaultPort, help = f"port to listen on (default: {defaultPort})")
+    serveCommand.add_argument("--socket", help = "listen on a Unix socket at this path instead")
+    
+    return parser
+
+def formatTask(record):
+    check = "x" if record.completed else " "
+    line = f"[{check}] {record.taskId:>4}  {record.task}"
+    if record.deadline:
+        line += f"  (due {record.deadline})"
+    return line
+
+def checkIds(store, ids):
+    missing = [str(taskId) for taskId in ids if store.get(taskId) is None]
+    if missing:
+        print(f"Error: no task with id {', '.join(missing)}.", file = sys.stderr)
+        return False
+    return True
+
+def main(argv = None):
+    arguments = buildParser().parse_args(argv)
+    
+    if arguments.command == "serve": # the server keeps the list itself, so it is read there
+        if isDatabasePath(arguments.file):
+            print("Error: databases can't be shared; export the list to a JSON or \".tlist\" file first.", file = sys.stderr)
+            return 1
+        from tasklist.sync import serve
+        try:
+            serve(arguments.file, arguments.host, arguments.port, arguments.socket)
+        except (OSError, ValueError) as error: # includes a port that is already in use
+            print(f"Error: could not share \"{arguments.file}\": {error}", file = sys.stderr)
+            return 1
+        return 0
+    
+    if arguments.command == "convert": # works on the two files alone, without loading a list
+        if os.path.abspath(arguments.source) == os.path.abspath(arguments.output):
+            print("Error: the output file must be different from the source.", file = sys.stderr)
+            return 1
+        try:
+            saveRecords(arguments.output, streamRecords(arguments.source, numbered = True)) # JSON, ".tlist" and database files need an id for every task
+        except (OSError, ValueError) as error:
+            print(f"Error: could not convert \"{arguments.source}\": {error}", file = sys.stderr)
+            return 1
+        return 0
+    
+    journaled = hasJournal(arguments.file) # the window is autosaving this file
+    try:
+        store = loadJournaledStore(arguments.file) if journaled else loadStore(arguments.file)
+    except (OSError, ValueError) as error: # includes files that aren't valid JSON
+        print(f"Error: could not read \"{arguments.file}\": {error}", file = sys.stderr)
+        return 1
+    
+    if arguments.command == "ls":
+        for record in store:
+            if arguments.pending and record.completed:
+                continue
+            if arguments.done and not record.completed:
+                continue
+            print(formatTask(record))
+        print(f"{store.completedCount}/{len(store)} Tasks Completed")
+        return 0
+    
+    if arguments.command == "export" and isDatabasePath(arguments.file) and arguments.output != "-" and not isDatabasePath(arguments.output):
+        if isBinaryPath(arguments.output) or isInterchangePath(arguments.output):
+            saveRecords(arguments.output, streamRecords(arguments.file)) # streams the rows out instead of reading them all first
+        else:
+            from tasklist.sqlitestore import exportJsonFile
+            exportJsonFile(store, arguments.output) # streams the rows out instead of reading them all first
+        return 0
+    
+    if arguments.command == "export":
+        if arguments.output == "-":
+            json.dump(store.toDict(), sys.stdout, indent = 4)
+            print()
+        else:
+            writeTaskFile(arguments.output, store)
+        return 0
+    
+    if arguments.command == "due":
+        deadlines = DeadlineIndex(store)
+        dueToday = deadlines.dueToday()
+        sections = (
+            ("Overdue", deadlines.overdue()),
+            ("Due today", dueToday),
+            ("Coming up", [taskId for taskId in deadlines.nextDue(len(dueToday) + arguments.count) if taskId not in dueToday][:arguments.count])
+        )
+        for title, taskIds in sections:
+            print(f"{title}:")
+            for taskId in taskIds:
+                print(formatTask(store.get(taskId)))
+            if not taskIds:
+                print("    (none)")
+        return 0
+    
+    if arguments.command == "compact":
+        writeTaskFile(arguments.file, store)
+        discardJournal(arguments.file) # the file now has everything the journal held
+        return 0
+    
+    if arguments.command in ("done", "rm") and not checkIds(store, arguments.ids):
+        return 1
+    
+    journal = TaskJournal(arguments.file, store) if journaled else None # appends the change instead of rewriting the file
+    
+    if arguments.command == "add":
+        record = store.add(arguments.task, arguments.deadline)
+        print(formatTask(record))
+    elif arguments.command == "done":
+        for taskId in arguments.ids:
+            print(formatTask(store.setCompleted(taskId, not arguments.undo)))
+    elif arguments.command == "rm":
+        removed = store.removeMany(arguments.ids) # one change, however many ids are given
+        print(f"Deleted {len(removed)} task(s).")
+    elif arguments.command == "import":
+        imported = 0
+        try:
+            for chunk in chunks(streamRecords(arguments.source), importChunk): # only one chunk of the source is read at a time
+                imported += len(store.extend((None, completed, task, deadline) for taskId, completed, task, deadline in chunk)) # imported tasks get new ids
+        except (OSError, ValueError) as error: # tasks already imported are kept
+            print(f"Error: could not read \"{arguments.source}\": {error}", file = sys.stderr)
+        print(f"Imported {imported} task(s).")
+    
+    if journal is not None: # saves the change
+        journal.close()
+    elif not isDatabasePath(arguments.file): # databases save each change as it is made
+        writeTaskFile(arguments.file, store)
+    return 0
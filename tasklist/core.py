@@ -0,0 +1,478 @@
+"""
+Module: tasklist.core
+Purpose: The headless task model shared by the window and the command line.
+    Holds the list's tasks, keeps the completion counters, and reads/writes save files.
+    Nothing here imports tkinter, so it can be scripted, tested, and benchmarked without a display.
+"""
+
+import json # used for file management - writing/reading
+import os # used for replacing save files safely
+
+from tasklist.deadlines import parseDeadline # used for understanding deadlines
+from tasklist.binaryfile import isBinaryPath, hasBinaryMagic, readBinaryFile, writeBinaryFile # used for the compact file format
+from tasklist.interchange import isInterchangePath, readInterchangeFile, writeInterchangeFile # used for CSV and iCalendar files
+
+# DEFINE TASK MODEL
+"""
+The task store owns every task's data. Widgets are only a view of it:
+they are told about changes through listeners and never read back for saving or counting.
+"""
+
+notParsed = object() # marks a deadline that still needs parsing
+
+class Task:
+    __slots__ = ("taskId", "completed", "task", "deadline", "due") # keeps each record compact
+    
+    def __init__(self, taskId, completed, task, deadline, due = notParsed):
+        self.taskId = taskId # stable for the life of the task, unlike its row
+        self.completed = completed
+        self.task = task
+        self.deadline = deadline
+        self.due = parseDeadline(deadline) if due is notParsed else due # the deadline as a timestamp, or None
+    
+    def values(self):
+        return (self.completed, self.task, self.deadline)
+
+class TaskOrder:
+    """
+    Task ids in list order, with any task's position found in O(log n).
+    Removing a task only empties its slot, so nothing after it is shifted or renumbered;
+    a Fenwick tree counts the tasks left in each run of slots, which turns a slot into a position and back.
+    The empty slots are squeezed out in one pass once they make up half the list, or when the plain list is asked for.
+    The tree is only built the first time a position is needed, so loading a list never pays for it.
+    """
+    
+    def __init__(self, taskIds = ()):
+        self.reset(taskIds)
+    
+    def reset(self, taskIds):
+        self.slots = list(taskIds) # task ids in list order; None marks a removed task's slot
+        self.gaps = 0 # how many slots are empty
+        self.slotOf = None # taskId -> slot, built with the tree
+        self.tree = None # the Fenwick tree; tree[i] counts the tasks in the run of slots ending at slot i - 1
+    
+    def __len__(self):
+        return len(self.slots) - self.gaps
+    
+    def ids(self):
+        """Returns the ids in list order, squeezing out any empty slots first."""
+        if self.gaps:
+            self.reset([taskId for taskId in self.slots if taskId is not None])
+        return self.slots
+    
+    def buildIndex(self):
+        if self.slotOf is None: # there are no empty slots until the tree exists
+            self.slotOf = {taskId: slot for slot, taskId in enumerate(self.slots)}
+            self.tree = [0] + [node & -node for node in range(1, len(self.slots) + 1)] # every slot is full, so each node counts its whole run
+    
+    def countBefore(self, slot):
+        """Counts the tasks in the slots before slot."""
+        tree = self.tree
+        count = 0
+        while slot > 0:
+            count += tree[slot]
+            slot -= slot & -slot
+        return count
+    
+    def append(self, taskId):
+        self.slots.append(taskId)
+        if self.tree is not None:
+            node = len(self.slots)
+            self.tree.append(1 + self.countBefore(node - 1) - self.countBefore(node - (node & -node))) # the new task plus the rest of its run
+            self.slotOf[taskId] = node - 1
+    
+    def position(self, taskId):
+        self.buildIndex()
+        return self.countBefore(self.slotOf[taskId])
+    
+    def remove(self, taskId):
+        """Empties taskId's slot and returns the position it had."""
+        position = self.position(taskId)
+        slot = self.slotOf.pop(taskId)
+        self.slots[slot] = None
+        self.gaps += 1
+        tree = self.tree
+        node = slot + 1
+        while node < len(tree):
+            tree[node] -= 1
+            node += node & -node
+        if self.gaps > 64 and 2 * self.gaps > len(self.slots): # mostly empty, so squeezed out at once
+            self.ids()
+        return position
+    
+    def at(self, position):
+        """Returns the id at position, found by walking down the tree instead of counting slots."""
+        if not 0 <= position < len(self):
+            raise IndexError(position)
+        if not self.gaps:
+            return self.slots[position]
+        tree = self.tree
+        node = 0
+        remaining = position + 1 # tasks still to pass, counting the one wanted
+        step = 1 << (len(tree) - 1).bit_length() - 1
+        while step:
+            following = node + step
+            if following < len(tree) and tree[following] < remaining:
+                node = following
+                remaining -= tree[following]
+            step >>= 1
+        return self.slots[node] # node is the last slot before the task, counted from 1
+    
+    def between(self, start, end):
+        """Returns the ids from position start up to end, leaving any empty slots where they are."""
+        start = max(0, start)
+        end = min(len(self), end)
+        if not self.gaps:
+            return self.slots[start:end]
+        return [self.at(position) for position in range(start, end)] # a page is only a screenful, so each is found on its own
+
+class TaskStore:
+    def __init__(self):
+        self.tasks = {} # taskId -> Task, kept in list order
+        self.completedCount = 0 # counts the tasks completed
+        self.nextId = 1 # the id given to the next new task
+        self.listeners = [] # functions told about every change
+        self.order = TaskOrder() # taskIds in list order, with positions found without rebuilding it
+    
+    def __len__(self):
+        return len(self.tasks) # counts the items in the list
+    
+    def __iter__(self):
+        return iter(list(self.tasks.values()))
+    
+    def get(self, taskId):
+        return self.tasks.get(taskId)
+    
+    def orderedIds(self):
+        return self.order.ids()
+    
+    def positionOf(self, taskId):
+        return self.order.position(taskId)
+    
+    def taskAt(self, index):
+        return self.tasks[self.order.at(index)]
+    
+    def page(self, start, count):
+        """Returns up to count tasks in list order, starting from position start."""
+        return [self.tasks[taskId] for taskId in self.order.between(start, start + count)] # deleting a task doesn't make the next page rebuild the order
+    
+    def records(self):
+        """Copies the list as plain (taskId, completed, task, deadline) tuples, safe to hand to another thread."""
+        return [(record.taskId, record.completed, record.task, record.deadline) for record in self.tasks.values()]
+    
+    def pendingDeadlines(self):
+        """Returns (due, taskId) for every pending task with a parsed deadline, soonest first."""
+        return sorted((record.due, record.taskId) for record in self.tasks.values() if record.due is not None and not record.completed)
+    
+    def pendingIds(self):
+        return [taskId for taskId, record in self.tasks.items() if not record.completed]
+    
+    def completedIds(self):
+        return [taskId for taskId, record in self.tasks.items() if record.completed]
+    
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+    
+    def unsubscribe(self, listener):
+        self.listeners.remove(listener)
+    
+    def notify(self, action, tasks, previous = None):
+        """
+        Tells listeners about a change: "add", "remove", "update" or "reset".
+        For "update", previous holds each task's values() from before the change.
+        For "remove", it holds each task's position in the list before it was removed,
+        and for "add" it holds the positions of tasks put back where they were (None when they were added at the end).
+        """
+        for listener in self.listeners:
+            listener(action, tasks, previous)
+    
+    def freshId(self, taken = ()):
+        """Returns the first id from nextId on that no task (and nothing in taken) has.
+        Tasks put back or sent by another copy of the list can have ids above ones still to be given out."""
+        while self.nextId in self.tasks or self.nextId in taken:
+            self.nextId += 1
+        return self.nextId
+    
+    def insert(self, completed, task, deadline, taskId = None):
+        if taskId is None or taskId in self.tasks: # new tasks (and clashing ids) get a fresh id
+            taskId = self.freshId()
+        self.nextId = max(self.nextId, taskId + 1)
+        
+        record = Task(taskId, 1 if completed else 0, task, deadline)
+        self.tasks[taskId] = record
+        self.completedCount += record.completed
+        self.order.append(taskId)
+        return record
+    
+    def add(self, task, deadline, completed = 0, taskId = None):
+        record = self.insert(completed, task, deadline, taskId)
+        self.notify("add", [record])
+        return record
+    
+    def extend(self, records):
+        """Adds a batch of (taskId, completed, task, deadline) records and reports them as one change."""
+        added = [self.insert(completed, task, deadline, taskId) for taskId, completed, task, deadline in records]
+        if added:
+            self.notify("add", added)
+        return added
+    
+    def remove(self, taskId):
+        position = self.order.remove(taskId) # lets the removal be undone in place
+        record = self.tasks.pop(taskId)
+        self.completedCount -= record.completed
+        self.notify("remove", [record], [position])
+        return record
+    
+    def setCompleted(self, taskId, completed):
+        record = self.tasks[taskId]
+        completed = 1 if completed else 0
+        if record.completed == completed:
+            return record
+        previous = record.values()
+        self.completedCount += completed - record.completed
+        record.completed = completed
+        self.notify("update", [record], [previous])
+        return record
+    
+    def removeMany(self, taskIds):
+        """Removes every listed task in one pass and reports them as one change."""
+        taskIds = list(dict.fromkeys(taskIds)) # repeated ids are only removed once
+        positions = [self.positionOf(taskId) for taskId in taskIds] # where each task was before any of them went
+        removed = [self.tasks.pop(taskId) for taskId in taskIds]
+        if len(removed) * 16 > len(self.order): # a large share of the list, so the order is rebuilt in one pass
+            self.order.reset(self.tasks)
+        else:
+            for taskId in taskIds:
+                self.order.remove(taskId)
+        if removed:
+            self.completedCount -= sum(record.completed for record in removed)
+            self.notify("remove", removed, positions)
+        return removed
+    
+    def restore(self, records, positions):
+        """Puts removed (taskId, completed, task, deadline) records back at the positions they were removed from, as one change."""
+        order = self.orderedIds()
+        merged = [] # the new list order
+        copied = 0 # how much of the old order is in merged so far
+        restored = []
+        restoredIds = set()
+        for position, (taskId, completed, task, deadline) in sorted(zip(positions, records), key = lambda item: item[0]):
+            take = max(0, position - len(merged)) # the tasks that were above this one
+            merged.extend(order[copied:copied + take])
+            copied = min(len(order), copied + take)
+            if taskId is None or taskId in self.tasks or taskId in restoredIds: # the id was given to another task in the meantime
+                taskId = self.freshId(restoredIds)
+            restoredIds.add(taskId)
+            self.nextId = max(self.nextId, taskId + 1)
+            record = Task(taskId, 1 if completed else 0, task, deadline)
+            restored.append(record)
+            merged.append(taskId)
+        merged.extend(order[copied:])
+        
+        if restored:
+            restoredById = {record.taskId: record for record in restored}
+            self.tasks = {taskId: self.tasks.get(taskId) or restoredById[taskId] for taskId in merged} # rebuilt once, in the new order
+            self.completedCount += sum(record.completed for record in restored)
+            self.order.reset(merged)
+            self.notify("add", restored, [self.positionOf(record.taskId) for record in restored])
+        return restored
+    
+    def setCompletedMany(self, taskIds, completed):
+        """Marks every listed task complete (or not) in one pass and reports the ones that changed as one change."""
+        completed = 1 if completed else 0
+        changed = [record for record in map(self.tasks.__getitem__, dict.fromkeys(taskIds)) if record.completed != completed]
+        previous = [record.values() for record in changed]
+        for record in changed:
+            record.completed = completed
+        self.completedCount += len(changed) if completed else -len(changed)
+        if changed:
+            self.notify("update", changed, previous)
+        return changed
+    
+    def setValues(self, values):
+        """Sets tasks' completion, description, and deadline from (taskId, completed, task, deadline) tuples, as one change."""
+        changed = []
+        previous = []
+        for taskId, completed, task, deadline in values:
+            record = self.tasks[taskId]
+            completed = 1 if completed else 0
+            if (completed, task, deadline) == record.values():
+                continue
+            previous.append(record.values())
+            self.completedCount += completed - record.completed
+            if deadline != record.deadline:
+                record.due = parseDeadline(deadline)
+            record.completed = completed
+            record.task = task
+            record.deadline = deadline
+            changed.append(record)
+        if changed:
+            self.notify("update", changed, previous)
+        return changed
+    
+    def edit(self, taskId, task, deadline):
+        record = self.tasks[taskId]
+        self.setValues([(taskId, record.completed, task, deadline)])
+        return record
+    
+    def clear(self):
+        self.tasks = {}
+        self.completedCount = 0
+        self.nextId = 1
+        self.order.reset(())
+    
+    def replaceAll(self, records):
+        """Swaps in a whole new list of (taskId, completed, task, deadline) records at once."""
+        self.clear()
+        for taskId, completed, task, deadline in records:
+            self.insert(completed, task, deadline, taskId)
+        self.notify("reset", [])
+    
+    def reconcile(self, records):
+        """Changes the list to match (taskId, completed, task, deadline) records, such as a file read again.
+        Tasks are matched by id, so only the tasks that were added, removed, or edited are reported,
+        in at most one change of each kind. Returns (added, removed, updated) counts,
+        or None if the list had to be replaced as a whole (tasks without ids, or tasks moved around)."""
+        records = list(records)
+        wanted = {record[0]: record for record in records}
+        if None in wanted or len(wanted) != len(records): # tasks can only be matched by a unique id
+            self.replaceAll(records)
+            return None
+        
+        kept = [taskId for taskId in self.orderedIds() if taskId in wanted]
+        if kept != [record[0] for record in records if self.get(record[0]) is not None]: # the tasks that stayed were reordered
+            self.replaceAll(records)
+            return None
+        removedIds = [taskId for taskId in self.orderedIds() if taskId not in wanted]
+        changes = [wanted[taskId] for taskId in kept if self.get(taskId).values() != (1 if wanted[taskId][1] else 0,) + wanted[taskId][2:]]
+        additions = [(position, record) for position, record in enumerate(records) if self.get(record[0]) is None]
+        
+        if removedIds:
+            self.removeMany(removedIds)
+        if changes:
+            self.setValues(changes)
+        if additions and additions[0][0] == len(kept): # every new task comes after the ones that stayed
+            self.extend(record for position, record in additions)
+        elif additions: # new tasks in between old ones go straight to their places
+            self.restore([record for position, record in additions], [position for position, record in additions])
+        return (len(additions), len(removedIds), len(changes))
+    
+    def toDict(self):
+        return dictFromRecords(self.records())
+
+def dictFromRecords(records):
+    return { # the save file format, keyed by task id
+        str(taskId): {
+            "completed": completed,
+            "task": task,
+            "deadline": deadline
+        }
+        for taskId, completed, task, deadline in records
+    }
+
+def recordsFromDict(openedFile):
+    if not isinstance(openedFile, dict): # valid JSON, but not a save file, like a list
+        raise ValueError(f"the file holds a JSON {type(openedFile).__name__}, not tasks keyed by id")
+    for key, taskData in openedFile.items(): # reads the save file format
+        if not isinstance(taskData, dict):
+            raise ValueError(f"task {key!r} is not a JSON object")
+        try:
+            taskId = int(key)
+        except ValueError:
+            taskId = None # unusual keys still load, under a new id
+        yield (
+            taskId,
+            taskData.get("completed", 0),
+            taskData.get("task", ""),
+            taskData.get("deadline", "")
+        )
+
+def readTaskFile(filePath):
+    if isInterchangePath(filePath): # CSV and iCalendar files are recognized by their names
+        return assignIds(readInterchangeFile(filePath))
+    with open(filePath, 'rb') as loadFile:
+        start = loadFile.read(4)
+        if hasBinaryMagic(start): # binary files are recognized by their first bytes, not their name
+            binary = True
+        else:
+            openedFile = json.loads(start + loadFile.read())
+            binary = False
+    if binary:
+        return readBinaryFile(filePath)
+    return list(recordsFromDict(openedFile))
+
+def assignIds(records):
+    """Gives records without an id (like rows from another program's CSV file) ids after the highest one used."""
+    records = list(records)
+    nextId = max((record[0] for record in records if record[0] is not None), default = 0) + 1
+    return list(numberRecords(records, nextId))
+
+def numberRecords(records, nextId):
+    """Yields records, giving those without an id the ids from nextId on."""
+    for taskId, completed, task, deadline in records:
+        if taskId is None:
+            taskId = nextId
+            nextId += 1
+        yield (taskId, completed, task, deadline)
+
+def streamNumberedInterchange(filePath):
+    """Yields a CSV or iCalendar file's records with ids, like assignIds, without holding the file in memory:
+    the file is read once for its highest id, then again for the records."""
+    highestId = max((record[0] for record in readInterchangeFile(filePath) if record[0] is not None), default = 0)
+    yield from numberRecords(readInterchangeFile(filePath), highestId + 1)
+
+def streamRecords(filePath, numbered = False):
+    """Yields a file's records one at a time. CSV, iCalendar and database files are read as they go; other formats are read whole first.
+    Records from CSV and iCalendar files may have no id; with numbered, they are given ids, as loading them would,
+    so the records can be saved in a format keyed by id."""
+    if isInterchangePath(filePath):
+        return streamNumberedInterchange(filePath) if numbered else readInterchangeFile(filePath)
+    if isDatabasePath(filePath):
+        from tasklist.sqlitestore import streamDatabaseRecords
+        return streamDatabaseRecords(filePath)
+    records = readTaskFile(filePath)
+    return iter(assignIds(records) if numbered else records) # unusual keys in JSON files have no id either
+
+def writeTaskFile(filePath, store):
+    saveRecords(filePath, store.records())
+
+def saveRecords(filePath, records):
+    """Saves (taskId, completed, task, deadline) records in the format filePath's extension asks for. Safe to call from any thread."""
+    if isDatabasePath(filePath): # saving into a database copies the list into it
+        from tasklist.sqlitestore import SqliteTaskStore
+        database = SqliteTaskStore(filePath)
+        database.replaceAll(records)
+        database.close()
+    else:
+        writeRecordsFile(filePath, records)
+
+def writeRecordsFile(filePath, records, durable = False):
+    if isBinaryPath(filePath): # ".tlist" files are saved in the compact format
+        writeBinaryFile(filePath, records, durable)
+        return
+    if isInterchangePath(filePath): # ".csv" and ".ics" files are written a task at a time
+        writeInterchangeFile(filePath, records, durable)
+        return
+    
+    temporaryPath = filePath + ".tmp" # writes beside the file first so a failed save can't leave it half-written
+    with open(temporaryPath, 'w') as saveFile:
+        json.dump(dictFromRecords(records), saveFile, indent = 4)
+        if durable: # makes sure the data is on disk before it replaces the old file
+            saveFile.flush()
+            os.fsync(saveFile.fileno())
+    os.replace(temporaryPath, filePath)
+
+databaseExtensions = (".db", ".sqlite", ".sqlite3") # files opened with the SQLite backend
+
+def isDatabasePath(filePath):
+    return filePath.lower().endswith(databaseExtensions)
+
+def loadStore(filePath):
+    if isDatabasePath(filePath): # databases are read a page at a time instead of all at once
+        from tasklist.sqlitestore import SqliteTaskStore
+        return SqliteTaskStore(filePath)
+    
+    store = TaskStore()
+    if os.path.exists(filePath): # a missing file is just an empty list
+        store.replaceAll(readTaskFile(filePath))
+    return store
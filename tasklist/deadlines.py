@@ -0,0 +1,183 @@
+"""
+Module: tasklist.deadlines
+Purpose: Understands the free-text deadlines users type, so tasks can be ordered and filtered by date.
+    Each deadline is parsed once, when its task is added or loaded, into a timestamp (seconds since the epoch).
+    Deadlines without a time of day count as due at the end of that day.
+    Text that isn't a recognizable date is kept as-is and simply has no timestamp.
+
+    The DeadlineIndex keeps pending tasks sorted by that timestamp,
+    so "overdue", "due today" and "next N due" are answered with a binary search instead of a scan.
+"""
+
+import bisect # used for the sorted deadline index
+import time # used for the current time
+from datetime import date, datetime, timedelta # used for parsing dates
+from functools import lru_cache # used for remembering parsed deadlines
+
+dateFormats = ( # full dates, tried in order
+    "%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y", "%m-%d-%Y", "%Y/%m/%d",
+    "%B %d, %Y", "%B %d %Y", "%b %d, %Y", "%b %d %Y",
+    "%d %B %Y", "%d %b %Y", "%A, %B %d, %Y",
+)
+shortDateFormats = ( # dates without a year, which mean this year
+    "%m/%d", "%B %d", "%b %d", "%d %B", "%d %b",
+)
+timeFormats = ("%H:%M", "%I:%M %p", "%I:%M%p", "%I %p", "%I%p") # optional time of day after the date
+weekdays = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+def parseDeadline(text):
+    """Returns the deadline's timestamp, or None if the text isn't a recognizable date."""
+    if not text:
+        return None
+    return parseDeadlineOn(" ".join(text.lower().replace(",", ", ").split()), date.today().toordinal())
+
+@lru_cache(maxsize = 4096) # the same few deadlines are typed over and over, so most lookups are free
+def parseDeadlineOn(text, todayOrdinal):
+    today = date.fromordinal(todayOrdinal)
+    
+    for dateText, timeText in splitTime(text):
+        day = parseDay(dateText, today)
+        if day is None:
+            continue
+        if timeText is None:
+            moment = datetime.combine(day, datetime.max.time()) # a plain date is due by the end of that day
+        else:
+            moment = datetime.combine(day, timeText)
+        return moment.timestamp()
+    return None
+
+def splitTime(text):
+    """Yields the ways text can be read as a date followed by an optional time of day."""
+    yield text, None
+    if " at " in text: # "friday at 5 pm"
+        dateText, _, timeText = text.rpartition(" at ")
+        timeOfDay = parseTime(timeText)
+        if timeOfDay is not None:
+            yield dateText, timeOfDay
+    words = text.split(" ")
+    for size in (1, 2): # "5/1 17:00" or "5/1 5 pm"
+        if len(words) > size:
+            timeOfDay = parseTime(" ".join(words[-size:]))
+            if timeOfDay is not None:
+                yield " ".join(words[:-size]), timeOfDay
+
+def parseTime(text):
+    for timeFormat in timeFormats:
+        try:
+            return datetime.strptime(text.upper(), timeFormat).time()
+        except ValueError:
+            continue
+    return None
+
+def parseDay(text, today):
+    text = text.strip().rstrip(",")
+    if text in ("today", "tonight"):
+        return today
+    if text == "tomorrow":
+        return today + timedelta(days = 1)
+    if text.startswith("next ") and text[5:] in weekdays: # "next friday" is never today
+        return today + timedelta(days = (weekdays.index(text[5:]) - today.weekday() - 1) % 7 + 1)
+    if text in weekdays: # "friday" is the coming friday, or today if it is friday
+        return today + timedelta(days = (weekdays.index(text) - today.weekday()) % 7)
+    
+    for dateFormat in dateFormats:
+        try:
+            return datetime.strptime(text, dateFormat).date()
+        except ValueError:
+            continue
+    for dateFormat in shortDateFormats:
+        try:
+            return datetime.strptime(f"{text} {today.year}", f"{dateFormat} %Y").date() # gives the date this year
+        except ValueError:
+            continue
+    return None
+
+def dayBounds(now = None):
+    """The timestamps of the start and end of the day containing now."""
+    now = time.time() if now is None else now
+    startOfDay = datetime.combine(datetime.fromtimestamp(now).date(), datetime.min.time())
+    return startOfDay.timestamp(), (startOfDay + timedelta(days = 1)).timestamp()
+
+class DeadlineIndex:
+    """Pending tasks that have a parsed deadline, sorted by when they are due."""
+    
+    def __init__(self, store = None):
+        self.store = None
+        self.entries = [] # (due, taskId) pairs, soonest first
+        self.dueById = {} # taskId -> due, for tasks in the index
+        if store is not None:
+            self.attach(store)
+    
+    def attach(self, store):
+        if self.store is not None:
+            self.store.unsubscribe(self.update)
+        self.store = store
+        store.subscribe(self.update)
+        self.rebuild()
+    
+    def rebuild(self):
+        self.entries = self.store.pendingDeadlines()
+        self.dueById = {taskId: due for due, taskId in self.entries}
+    
+    def update(self, action, tasks, previous):
+        if action == "reset":
+            self.rebuild()
+            return
+        
+        if action != "add": # removed and changed tasks leave the index; changed ones come back below if still pending
+            for record in tasks:
+                self.discard(record.taskId)
+        if action == "remove":
+            return
+        
+        pending = [(record.due, record.taskId) for record in tasks if record.due is not None and not record.completed]
+        if len(pending) > 64: # big batches are cheaper to merge in with one sort
+            self.entries.extend(pending)
+            self.entries.sort()
+        else:
+            for entry in pending:
+                bisect.insort(self.entries, entry)
+        for due, taskId in pending:
+            self.dueById[taskId] = due
+    
+    def discard(self, taskId):
+        due = self.dueById.pop(taskId, None)
+        if due is not None:
+            del self.entries[bisect.bisect_left(self.entries, (due, taskId))]
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def isOverdue(self, taskId, now = None):
+        due = self.dueById.get(taskId)
+        return due is not None and due < (time.time() if now is None else now)
+    
+    def countOverdue(self, now = None):
+        return bisect.bisect_left(self.entries, (time.time() if now is None else now,))
+    
+    def overdue(self, now = None):
+        """Ids of pending tasks whose deadline has passed, most overdue first."""
+        return [taskId for due, taskId in self.entries[:self.countOverdue(now)]]
+    
+    def dueBetween(self, start, end):
+        """Ids of pending tasks due at or after start and before end, soonest first."""
+        first = bisect.bisect_left(self.entries, (start,))
+        last = bisect.bisect_left(self.entries, (end,))
+        return [taskId for due, taskId in self.entries[first:last]]
+    
+    def countDueBetween(self, start, end):
+        return bisect.bisect_left(self.entries, (end,)) - bisect.bisect_left(self.entries, (start,))
+    
+    def dueToday(self, now = None):
+        """Ids of pending tasks due later today (not already overdue)."""
+        now = time.time() if now is None else now
+        return self.dueBetween(now, dayBounds(now)[1])
+    
+    def countDueToday(self, now = None):
+        now = time.time() if now is None else now
+        return self.countDueBetween(now, dayBounds(now)[1])
+    
+    def nextDue(self, count, now = None):
+        """Ids of the next count pending tasks that are not yet overdue, soonest first."""
+        first = self.countOverdue(now)
+        return [taskId for due, taskId in self.entries[first:first + count]]
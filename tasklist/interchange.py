@@ -0,0 +1,241 @@
+"""
+Module: tasklist.interchange
+Purpose: Reading and writing lists as CSV and iCalendar files, for moving tasks to and from other programs.
+    Every reader is a generator that yields one (taskId, completed, task, deadline) record at a time,
+    and every writer takes any iterable of records and writes each one as it arrives,
+    so a file of any size is converted or imported in constant memory.
+
+CSV files have a header row; the columns are recognized by name ("task", "deadline", "completed", and "id",
+    or common alternatives like "description", "due", and "done"). Files without a recognized header
+    are read as task, deadline, completed. Exported files always have the columns id, completed, task, deadline.
+iCalendar files hold one VTODO per task: the description is the SUMMARY, completion is the STATUS,
+    and deadlines that are dates become the DUE date. The deadline's exact text is kept in X-TASKLIST-DEADLINE,
+    so lists survive the trip; files from other programs are read from their DUE dates.
+"""
+
+import csv # used for CSV files
+import os # used for replacing files safely
+from datetime import datetime, timezone # used for iCalendar dates
+from itertools import islice # used for cutting record streams into chunks
+
+from tasklist.deadlines import parseDeadline
+
+interchangeExtensions = (".csv", ".ics")
+csvHeader = ("id", "completed", "task", "deadline")
+csvColumnNames = { # header names, lowercased -> the record field they hold
+    "id": "id", "taskid": "id", "uid": "id",
+    "completed": "completed", "done": "completed", "complete": "completed", "status": "completed",
+    "task": "task", "description": "task", "title": "task", "summary": "task", "name": "task",
+    "deadline": "deadline", "due": "deadline", "due date": "deadline", "duedate": "deadline",
+}
+completedWords = {"1", "true", "yes", "y", "x", "done", "completed", "complete"}
+icsLineLimit = 75 # octets per line before an iCalendar line is folded
+
+def isInterchangePath(filePath):
+    return filePath.lower().endswith(interchangeExtensions)
+
+def chunks(records, size):
+    """Yields lists of up to size records, reading only one list's worth at a time."""
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+def readInterchangeFile(filePath):
+    if filePath.lower().endswith(".ics"):
+        return readIcsFile(filePath)
+    return readCsvFile(filePath)
+
+def writeInterchangeFile(filePath, records, durable = False):
+    """Writes records as CSV or iCalendar, going by filePath's extension. Returns how many were written."""
+    writeRows = writeIcsRows if filePath.lower().endswith(".ics") else writeCsvRows
+    temporaryPath = filePath + ".tmp" # writes beside the file first so a failed save can't leave it half-written
+    try:
+        with open(temporaryPath, 'w', newline = "", encoding = "utf-8") as saveFile:
+            count = writeRows(saveFile, records)
+            if durable: # makes sure the data is on disk before it replaces the old file
+                saveFile.flush()
+                os.fsync(saveFile.fileno())
+    except BaseException: # the records come from a stream that can fail partway, like a file being converted
+        os.remove(temporaryPath)
+        raise
+    os.replace(temporaryPath, filePath)
+    return count
+
+### CSV
+
+def readCsvFile(filePath):
+    with open(filePath, 'r', newline = "", encoding = "utf-8-sig") as csvFile: # utf-8-sig skips the marker spreadsheet programs add
+        rows = csv.reader(csvFile)
+        first = next(rows, None)
+        if first is None:
+            return
+        fields = [csvColumnNames.get(name.strip().lower()) for name in first]
+        if "task" not in fields: # no header, so the first row is a task too
+            fields = ["task", "deadline", "completed"]
+            yield csvRecord(first, fields)
+        try:
+            for row in rows:
+                if any(row): # skips blank lines
+                    yield csvRecord(row, fields)
+        except csv.Error as error: # reported like any other unreadable file
+            raise ValueError(f"line {rows.line_num}: {error}") from error
+
+def csvRecord(row, fields):
+    values = {}
+    for field, value in zip(fields, row):
+        if field is not None and field not in values: # the first column with a name wins
+            values[field] = value.strip()
+    try:
+        taskId = int(values.get("id", ""))
+    except ValueError:
+        taskId = None # the task gets a new id when it is added
+    completed = 1 if values.get("completed", "").lower() in completedWords else 0
+    return (taskId, completed, values.get("task", ""), values.get("deadline", ""))
+
+def writeCsvRows(csvFile, records):
+    writer = csv.writer(csvFile)
+    writer.writerow(csvHeader)
+    count = 0
+    for taskId, completed, task, deadline in records:
+        writer.writerow(("" if taskId is None else taskId, 1 if completed else 0, task, deadline))
+        count += 1
+    return count
+
+### ICALENDAR
+
+def escapeText(text):
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+def unescapeText(text):
+    result = []
+    characters = iter(text)
+    for character in characters:
+        if character == "\\":
+            following = next(characters, "")
+            result.append("\n" if following in ("n", "N") else following)
+        else:
+            result.append(character)
+    return "".join(result)
+
+def foldLine(line):
+    """Splits a line longer than 75 octets into continuation lines, without splitting a character."""
+    if len(line.encode("utf-8")) <= icsLineLimit:
+        return line + "\r\n"
+    pieces = []
+    piece = []
+    size = 0
+    limit = icsLineLimit
+    for character in line:
+        width = len(character.encode("utf-8"))
+        if size + width > limit:
+            pieces.append("".join(piece))
+            piece = []
+            size = 0
+            limit = icsLineLimit - 1 # continuation lines start with a space
+        piece.append(character)
+        size += width
+    pieces.append("".join(piece))
+    return "\r\n ".join(pieces) + "\r\n"
+
+def formatDue(deadline):
+    """Returns the DUE line for a deadline that is a date, or None."""
+    due = parseDeadline(deadline)
+    if due is None:
+        return None
+    moment = datetime.fromtimestamp(due)
+    if (moment.hour, moment.minute, moment.second) == (23, 59, 59): # a plain date, due by the end of the day
+        return f"DUE;VALUE=DATE:{moment:%Y%m%d}"
+    return f"DUE:{moment:%Y%m%dT%H%M%S}" # local time, as the deadline was typed
+
+def parseDue(value):
+    """Turns a DUE value into deadline text the program understands, like "10/31/2026" or "10/31/2026 17:00"."""
+    try:
+        if "T" not in value:
+            return datetime.strptime(value[:8], "%Y%m%d").strftime("%m/%d/%Y")
+        moment = datetime.strptime(value[:15], "%Y%m%dT%H%M%S")
+    except ValueError:
+        return value # kept as text rather than lost
+    if value.endswith("Z"): # UTC, shown in local time
+        moment = moment.replace(tzinfo = timezone.utc).astimezone().replace(tzinfo = None)
+    return moment.strftime("%m/%d/%Y %H:%M")
+
+def writeIcsRows(icsFile, records):
+    import uuid # used for naming tasks that have no id; only loaded when a calendar is written
+    
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    fileKey = uuid.uuid4().hex # names tasks without an id, with the row number after it
+    icsFile.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Task List//EN\r\n")
+    count = 0
+    for taskId, completed, task, deadline in records:
+        lines = [
+            "BEGIN:VTODO",
+            f"UID:{taskId}@tasklist" if taskId is not None else f"UID:{fileKey}-{count}",
+            f"DTSTAMP:{stamp}",
+            "SUMMARY:" + escapeText(task),
+            "STATUS:COMPLETED" if completed else "STATUS:NEEDS-ACTION"
+        ]
+        if deadline:
+            dueLine = formatDue(deadline)
+            if dueLine is not None:
+                lines.append(dueLine)
+            lines.append("X-TASKLIST-DEADLINE:" + escapeText(deadline)) # the exact text, dates or not
+        lines.append("END:VTODO")
+        icsFile.write("".join(foldLine(line) for line in lines))
+        count += 1
+    icsFile.write("END:VCALENDAR\r\n")
+    return count
+
+def unfoldedLines(icsFile):
+    """Yields logical lines, joining folded continuation lines back together."""
+    current = None
+    for line in icsFile:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current is not None:
+        yield current
+
+def splitProperty(line):
+    """Splits "NAME;PARAM=x:value" into ("NAME", "PARAM=x", "value"); colons inside quoted parameters don't count."""
+    quoted = False
+    for index, character in enumerate(line):
+        if character == '"':
+            quoted = not quoted
+        elif character == ":" and not quoted:
+            name, _, parameters = line[:index].partition(";")
+            return name.upper(), parameters, line[index + 1:]
+    return line.upper(), "", ""
+
+def readIcsFile(filePath):
+    with open(filePath, 'r', newline = "", encoding = "utf-8-sig") as icsFile:
+        todo = None # the properties of the VTODO being read
+        for line in unfoldedLines(icsFile):
+            name, parameters, value = splitProperty(line)
+            if name == "BEGIN" and value.upper() == "VTODO":
+                todo = {}
+            elif todo is not None:
+                if name == "END" and value.upper() == "VTODO":
+                    yield icsRecord(todo)
+                    todo = None
+                else:
+                    todo.setdefault(name, value) # the first of a repeated property wins
+
+def icsRecord(todo):
+    uid = todo.get("UID", "")
+    idText, _, domain = uid.partition("@")
+    taskId = int(idText) if domain == "tasklist" and idText.isdigit() else None # only ids this program wrote are kept
+    completed = 1 if todo.get("STATUS", "").upper() == "COMPLETED" or "COMPLETED" in todo else 0
+    if "X-TASKLIST-DEADLINE" in todo:
+        deadline = unescapeText(todo["X-TASKLIST-DEADLINE"])
+    elif "DUE" in todo:
+        deadline = parseDue(todo["DUE"])
+    else:
+        deadline = ""
+    return (taskId, completed, unescapeText(todo.get("SUMMARY", "")), deadline)
@@ -0,0 +1,174 @@
+"""
+Module: tasklist.journal
+Purpose: Append-only journal persistence for task list files.
+    Every add, completion change, and delete is appended to "<file>.journal" as one small JSON line,
+    so saving a change costs the same no matter how long the list is.
+    Once the journal grows past a size limit, it is folded into a fresh copy of the save file
+    on a background thread, and a new journal is started.
+    Replacing the whole list writes its snapshot straight away instead, since none of the journal applies to it.
+
+Files, for a list saved as "tasks.json":
+    tasks.json                  the last full snapshot, in the normal save file format
+    tasks.json.journal          changes made since that snapshot
+    tasks.json.journal.old      changes being folded into a new snapshot (only while compacting)
+
+Opening a list replays the snapshot, then the ".old" journal, then the current journal.
+Every journal line sets a task to a known state, so replaying a line twice is harmless;
+that is what makes it safe to crash at any point during compaction.
+"""
+
+import json # used for writing/reading journal lines
+import os # used for syncing and replacing files
+import threading # used for compacting in the background
+
+from tasklist.core import TaskStore, readTaskFile, writeRecordsFile
+
+def journalPaths(snapshotPath):
+    return (snapshotPath + ".journal.old", snapshotPath + ".journal") # in replay order
+
+def hasJournal(snapshotPath):
+    return any(os.path.exists(path) for path in journalPaths(snapshotPath))
+
+def replayJournalFile(journalPath, tasks):
+    try:
+        journalFile = open(journalPath, 'r', encoding = "utf-8")
+    except FileNotFoundError:
+        return
+    
+    with journalFile:
+        for line in journalFile:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError: # a line cut short by a crash; everything before it still counts
+                break
+            
+            taskId = entry["id"]
+            if entry["op"] == "rm":
+                tasks.pop(taskId, None)
+            elif entry["op"] == "set" and taskId not in tasks: # a change to a task deleted later in an older journal
+                continue
+            else: # "add" and "set" both carry the task's full state
+                tasks[taskId] = (entry["completed"], entry["task"], entry["deadline"])
+
+def readJournaledFile(snapshotPath):
+    """Reads a list as (taskId, completed, task, deadline) records: the snapshot plus any journaled changes."""
+    tasks = {} # taskId -> (completed, task, deadline), in list order
+    if os.path.exists(snapshotPath):
+        for taskId, completed, task, deadline in readTaskFile(snapshotPath):
+            tasks[taskId] = (completed, task, deadline)
+    
+    for journalPath in journalPaths(snapshotPath):
+        replayJournalFile(journalPath, tasks)
+    
+    return [(taskId,) + values for taskId, values in tasks.items()]
+
+def discardJournal(snapshotPath):
+    """Deletes a file's journals, for when a full save has just replaced everything they recorded."""
+    for journalPath in journalPaths(snapshotPath):
+        if os.path.exists(journalPath):
+            os.remove(journalPath)
+
+def loadJournaledStore(snapshotPath):
+    store = TaskStore()
+    store.replaceAll(readJournaledFile(snapshotPath))
+    return store
+
+class TaskJournal:
+    def __init__(self, snapshotPath, store, syncEvery = 64, compactSize = 1024 * 1024):
+        self.snapshotPath = snapshotPath
+        self.oldJournalPath, self.journalPath = journalPaths(snapshotPath)
+        self.store = store
+        self.syncEvery = syncEvery # lines written before the journal is forced to disk
+        self.compactSize = compactSize # journal size in bytes that triggers compaction
+        self.unsynced = 0 # lines written since the last sync
+        self.compactor = None # the background compaction, while one runs
+        self.journalFile = open(self.journalPath, 'a', encoding = "utf-8")
+        store.subscribe(self.record)
+    
+    def record(self, action, tasks, previous):
+        if action == "reset": # the whole list was replaced, so the old journals no longer apply
+            self.snapshot()
+            return
+        
+        lines = []
+        for record in tasks:
+            if action == "remove":
+                entry = {"op": "rm", "id": record.taskId}
+            else:
+                entry = {
+                    "op": "add" if action == "add" else "set",
+                    "id": record.taskId,
+                    "completed": record.completed,
+                    "task": record.task,
+                    "deadline": record.deadline
+                }
+            lines.append(json.dumps(entry) + "\n")
+        self.journalFile.write("".join(lines))
+        
+        self.unsynced += len(lines)
+        if self.unsynced >= self.syncEvery:
+            self.sync()
+        if action == "add" and previous is not None: # tasks put back in the middle of the list; only a new snapshot keeps their places
+            self.compact(wait = True) # even when the journal is also over its size, as a compaction skipped for a running one would lose them
+        elif self.journalFile.tell() >= self.compactSize:
+            self.compact()
+    
+    def sync(self):
+        """Forces written lines to disk. Cheap to call often; does nothing when there is nothing new."""
+        if self.unsynced:
+            self.journalFile.flush()
+            os.fsync(self.journalFile.fileno())
+            self.unsynced = 0
+    
+    def compact(self, wait = False):
+        """Starts folding the journal into a fresh snapshot. The list is copied here; the writing happens in the background.
+        If a compaction is already running, this one is skipped, or with wait, started once that one is done."""
+        if self.compactor is not None and self.compactor.is_alive():
+            if not wait: # the next size check will try again
+                return
+            self.compactor.join()
+        
+        records = self.store.records()
+        self.journalFile.flush() # closes out the journal on disk before it is set aside
+        os.fsync(self.journalFile.fileno())
+        self.journalFile.close()
+        self.unsynced = 0
+        
+        if os.path.exists(self.oldJournalPath): # an earlier compaction didn't finish, so both journals are kept until a snapshot has them
+            with open(self.oldJournalPath, 'a', encoding = "utf-8") as oldJournal, open(self.journalPath, 'r', encoding = "utf-8") as journal:
+                oldJournal.write(journal.read())
+            os.remove(self.journalPath)
+        else:
+            os.replace(self.journalPath, self.oldJournalPath)
+        self.journalFile = open(self.journalPath, 'a', encoding = "utf-8")
+        
+        self.compactor = threading.Thread(target = self.writeSnapshot, args = (records,), name = "journal-compaction")
+        self.compactor.start()
+    
+    def snapshot(self):
+        """Writes the list as the snapshot straight away and starts an empty journal, for when none of the journaled changes apply anymore.
+        Unlike compact, this never leaves a journal from before a replaced list to be replayed over the new one."""
+        if self.compactor is not None:
+            self.compactor.join() # a compaction still writing the older list mustn't replace this one
+        self.journalFile.close()
+        self.unsynced = 0
+        discardJournal(self.snapshotPath) # first, so a crash part way leaves an older saved list, never a mix of the two
+        try:
+            writeRecordsFile(self.snapshotPath, self.store.records(), durable = True)
+        except OSError as error:
+            print(f"An unexpected error occurred while saving \"{self.snapshotPath}\": {error}")
+        self.journalFile = open(self.journalPath, 'a', encoding = "utf-8")
+    
+    def writeSnapshot(self, records):
+        try:
+            writeRecordsFile(self.snapshotPath, records, durable = True)
+            os.remove(self.oldJournalPath) # the snapshot now has everything it held
+        except OSError as error:
+            print(f"An unexpected error occurred while compacting \"{self.snapshotPath}\": {error}")
+    
+    def close(self):
+        self.store.unsubscribe(self.record)
+        self.sync()
+        self.journalFile.close()
+        if self.compactor is not None:
+            self.compactor.join() # lets a running compaction finish its snapshot
@@ -0,0 +1,108 @@
+"""
+Module: tasklist.profiling
+Purpose: Optional timing of the window's commands, for finding out which one makes the program stutter.
+    Wrapped functions count their calls and time them, but only while profiling is enabled;
+    when it is off, a wrapped call costs one extra function call and a flag check.
+    A cProfile capture can also be started and stopped at any time for a full breakdown.
+    Profiling starts enabled if the TASKLIST_PROFILE environment variable is set to 1.
+"""
+
+import functools # used for keeping wrapped functions' names
+import os # used for reading the environment
+import time # used for timing calls
+
+enabled = os.environ.get("TASKLIST_PROFILE") == "1" # off unless asked for
+callStats = {} # name -> CallStats for every wrapped function that has been called while enabled
+lastCall = None # (name, seconds) of the most recent timed call
+loopLag = 0.0 # seconds the event loop was late by, as last measured by the window
+capture = None # the running cProfile capture, if any
+
+class CallStats:
+    __slots__ = ("count", "total", "worst", "last")
+    
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.worst = 0.0
+        self.last = 0.0
+    
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.worst = max(self.worst, seconds)
+        self.last = seconds
+
+def setEnabled(flag):
+    global enabled
+    enabled = bool(flag)
+
+def recordCall(name, seconds):
+    global lastCall
+    stats = callStats.get(name)
+    if stats is None:
+        stats = callStats[name] = CallStats()
+    stats.add(seconds)
+    lastCall = (name, seconds)
+
+def recordLag(seconds):
+    global loopLag
+    loopLag = max(0.0, seconds)
+
+def instrument(function, name = None):
+    """Wraps function so its calls are counted and timed while profiling is enabled."""
+    name = name or function.__name__
+    
+    @functools.wraps(function)
+    def timedFunction(*args, **kwargs):
+        if not enabled: # the only cost when profiling is off
+            return function(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            recordCall(name, time.perf_counter() - start)
+    
+    return timedFunction
+
+def resetStats():
+    global lastCall
+    callStats.clear()
+    lastCall = None
+
+def report():
+    """Returns one line per timed function, slowest total first."""
+    lines = []
+    for name, stats in sorted(callStats.items(), key = lambda item: item[1].total, reverse = True):
+        lines.append(
+            f"{name}: {stats.count} calls, {stats.total * 1000:.1f} ms total, "
+            f"{stats.total * 1000 / stats.count:.2f} ms average, {stats.worst * 1000:.2f} ms worst"
+        )
+    return lines
+
+### CPROFILE CAPTURES
+
+def isCapturing():
+    return capture is not None
+
+def startCapture():
+    global capture
+    if capture is None:
+        import cProfile # only loaded once a capture is started, since most runs never start one
+        capture = cProfile.Profile()
+        capture.enable()
+
+def stopCapture(outputPath = None, limit = 20):
+    """Stops the capture, saves it to outputPath (readable with pstats or snakeviz) if given, and returns a summary."""
+    global capture
+    if capture is None:
+        return ""
+    capture.disable()
+    finished = capture
+    capture = None
+    if outputPath:
+        finished.dump_stats(outputPath)
+    import io
+    import pstats
+    summary = io.StringIO()
+    pstats.Stats(finished, stream = summary).sort_stats("cumulative").print_stats(limit)
+    return summary.getvalue()
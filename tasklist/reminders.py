@@ -0,0 +1,78 @@
+"""
+Module: tasklist.reminders
+Purpose: Knows which pending task comes due next, so the window only needs one timer for every reminder.
+    Upcoming deadlines are kept in a min-heap. Adding a task pushes its deadline in O(log n);
+    completing, editing, or deleting one only forgets it in a dictionary, and its old heap entry
+    is skipped once it reaches the top, so no change ever searches or re-sorts the heap.
+    Only deadlines still to come are kept: tasks that were already overdue when they were added or loaded aren't reminded of.
+"""
+
+import heapq # used for the min-heap of deadlines
+import time # used for the current time
+
+class ReminderQueue:
+    def __init__(self, store = None):
+        self.store = None
+        self.heap = [] # (due, taskId) entries, soonest on top; some may be stale
+        self.dueById = {} # taskId -> due, for the tasks still to be reminded of
+        self.lastFired = time.time() # deadlines up to this moment have already been reminded of, or came before the list
+        if store is not None:
+            self.attach(store)
+    
+    def attach(self, store):
+        if self.store is not None:
+            self.store.unsubscribe(self.update)
+        self.store = store
+        store.subscribe(self.update)
+        self.lastFired = time.time() # a different list starts without reminders for what is already overdue
+        self.rebuild()
+    
+    def rebuild(self):
+        self.heap = [(due, taskId) for due, taskId in self.store.pendingDeadlines() if due > self.lastFired] # already sorted, so already a heap
+        self.dueById = {taskId: due for due, taskId in self.heap}
+    
+    def update(self, action, tasks, previous):
+        if action == "reset":
+            self.rebuild()
+            return
+        
+        if action != "add": # removed and changed tasks are forgotten; changed ones come back below if still pending
+            for record in tasks:
+                self.dueById.pop(record.taskId, None) # the heap entry goes stale and is dropped when it reaches the top
+        if action == "remove":
+            return
+        
+        for record in tasks:
+            if record.due is not None and not record.completed and record.due > self.lastFired:
+                self.dueById[record.taskId] = record.due
+                heapq.heappush(self.heap, (record.due, record.taskId))
+        if len(self.heap) > 2 * len(self.dueById) + 64: # mostly stale entries, so the heap is built again from the live ones
+            self.heap = [(due, taskId) for taskId, due in self.dueById.items()]
+            heapq.heapify(self.heap)
+    
+    def __len__(self):
+        return len(self.dueById)
+    
+    def isCurrent(self, entry):
+        due, taskId = entry
+        return self.dueById.get(taskId) == due
+    
+    def nextDue(self):
+        """Returns when the next reminder is due, or None if no pending task has a deadline still to come."""
+        heap = self.heap
+        while heap and not self.isCurrent(heap[0]): # stale entries are only ever dropped from the top
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+    
+    def popDue(self, now = None):
+        """Returns the ids of the tasks that have come due by now, soonest first, and forgets them."""
+        now = time.time() if now is None else now
+        heap = self.heap
+        dueIds = []
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if self.isCurrent(entry):
+                del self.dueById[entry[1]]
+                dueIds.append(entry[1])
+        self.lastFired = max(self.lastFired, now)
+        return dueIds
@@ -0,0 +1,128 @@
+"""
+Module: tasklist.search
+Purpose: Full-text search over task descriptions and deadlines.
+    An inverted index maps every word to the ids of the tasks that contain it,
+    and is kept up to date as tasks are added, changed, and deleted.
+    Each query word matches any indexed word it is the start of, so results update while a word is still being typed.
+"""
+
+import bisect # used for finding every indexed word with a given start
+import re # used for splitting text into words
+
+wordPattern = re.compile(r"\w+") # letters, digits, and underscores
+
+def tokenize(text):
+    return wordPattern.findall(text.lower())
+
+def taskWords(record):
+    return frozenset(tokenize(record.task) + tokenize(record.deadline))
+
+class SearchIndex:
+    def __init__(self, store = None):
+        self.store = None
+        self.postings = {} # word -> set of taskIds containing it
+        self.wordsById = {} # taskId -> the words indexed for it
+        self.vocabulary = [] # every indexed word, sorted, for prefix lookups
+        self.built = False # large lists are indexed on the first search rather than when they are opened
+        if store is not None:
+            self.attach(store)
+    
+    def attach(self, store):
+        if self.store is not None:
+            self.store.unsubscribe(self.update)
+        self.store = store
+        store.subscribe(self.update)
+        self.clear()
+        self.built = len(store) == 0 # an empty list is already fully indexed
+    
+    def clear(self):
+        self.postings = {}
+        self.wordsById = {}
+        self.vocabulary = []
+    
+    def build(self):
+        self.clear()
+        for record in self.store:
+            self.add(record, sortVocabulary = False)
+        self.vocabulary = sorted(self.postings)
+        self.built = True
+    
+    def update(self, action, tasks, previous):
+        if action == "reset":
+            self.clear()
+            self.built = len(self.store) == 0
+            return
+        if not self.built: # nothing to keep up to date until the first search
+            return
+        
+        if action == "update": # completing a task doesn't change its words
+            tasks = [record for record, values in zip(tasks, previous) if values[1:] != (record.task, record.deadline)]
+        sortVocabulary = len(tasks) <= 64 # big batches are merged into the vocabulary with one sort at the end
+        for record in tasks:
+            if action != "add":
+                self.discard(record.taskId, sortVocabulary)
+            if action != "remove":
+                self.add(record, sortVocabulary)
+        if not sortVocabulary:
+            self.vocabulary = sorted(self.postings)
+    
+    def add(self, record, sortVocabulary = True):
+        words = taskWords(record)
+        self.wordsById[record.taskId] = words
+        for word in words:
+            taskIds = self.postings.get(word)
+            if taskIds is None: # a word no task has used before
+                taskIds = self.postings[word] = set()
+                if sortVocabulary:
+                    bisect.insort(self.vocabulary, word)
+            taskIds.add(record.taskId)
+    
+    def discard(self, taskId, sortVocabulary = True):
+        for word in self.wordsById.pop(taskId, ()):
+            taskIds = self.postings[word]
+            taskIds.discard(taskId)
+            if not taskIds: # no task uses the word any more
+                del self.postings[word]
+                if sortVocabulary:
+                    del self.vocabulary[bisect.bisect_left(self.vocabulary, word)]
+    
+    def prefixMatches(self, prefix):
+        first = bisect.bisect_left(self.vocabulary, prefix)
+        last = bisect.bisect_left(self.vocabulary, prefix + "\uffff") # just past every word starting with prefix
+        words = self.vocabulary[first:last]
+        if len(words) == 1:
+            return self.postings[words[0]]
+        matches = set()
+        for word in words:
+            matches |= self.postings[word]
+        return matches
+    
+    def search(self, query):
+        """Returns the set of taskIds whose description or deadline has every word of the query (as whole words or word starts)."""
+        if not self.built:
+            self.build()
+        
+        words = set(tokenize(query))
+        if not words:
+            return None # no words means no filter
+        
+        wordMatches = sorted((self.prefixMatches(word) for word in words), key = len) # intersecting from the rarest word keeps every step small
+        matches = set(wordMatches[0])
+        for taskIds in wordMatches[1:]:
+            if not matches:
+                break
+            matches.intersection_update(taskIds)
+        return matches
+    
+    def searchOrdered(self, query):
+        """Like search, but returns the matching ids in list order (or None for an empty query)."""
+        return self.orderMatches(self.search(query))
+    
+    def orderMatches(self, matches):
+        """Puts a set of taskIds from search into list order."""
+        if matches is None:
+            return None
+        if len(matches) * 8 < len(self.store): # few matches are cheaper to sort than to pick out of the whole list
+            position = self.store.positionOf
+            return sorted(matches, key = position)
+        return [taskId for taskId in self.store.orderedIds() if taskId in matches]
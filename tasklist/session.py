@@ -0,0 +1,110 @@
+"""
+Module: tasklist.session
+Purpose: Remembering the open lists between runs, so the window reopens where it was left.
+    Closing the window saves every list held in memory as a compact snapshot file, next to a small session file
+    naming the tabs, the one shown, and the first page of the shown list's tasks.
+    Opening reads only the session file before the window first paints, so that page appears straight away,
+    and the snapshots are read afterwards, on the worker thread or when their tabs are first shown.
+    A snapshot of a saved file is only used while the file is unchanged since the snapshot was taken.
+    The session is kept in ~/.tasklist, or the TASKLIST_SESSION_DIR environment variable's directory; set it to "" to turn sessions off.
+"""
+
+import json # used for the session file
+import os # used for replacing the session file safely
+import shutil # used for moving unloaded lists' temporary files into the session
+import tempfile # used for naming snapshot files
+
+from tasklist.binaryfile import writeBinaryFile
+from tasklist.sqlitestore import SqliteTaskStore
+from tasklist.watch import FileWatcher
+from tasklist.workspace import ListTab
+
+defaultSessionDirectory = os.environ.get("TASKLIST_SESSION_DIR", os.path.join(os.path.expanduser("~"), ".tasklist"))
+sessionFileName = "session.json"
+sessionVersion = 1
+previewLength = 100 # tasks of the shown list kept in the session file itself, enough to fill the first screen
+
+def fileSignature(filePath):
+    """Returns the sizes and modification times of a file and its autosave journals, as saved in the session file."""
+    if filePath is None:
+        return None
+    return [list(stamp) if stamp is not None else None for stamp in FileWatcher(filePath).read()]
+
+def newSnapshotPath(directory):
+    handle, snapshotPath = tempfile.mkstemp(prefix = "tab-", suffix = ".tlist", dir = directory)
+    os.close(handle)
+    return snapshotPath
+
+def saveSession(workspace, preview = (), skipped = (), directory = defaultSessionDirectory):
+    """Saves every tab except those in skipped (like shared lists, which their server keeps).
+    preview holds the first (taskId, completed, task, deadline) records of the shown list.
+    Unloaded tabs' temporary files are moved into the session, so closing the workspace afterwards leaves them be."""
+    os.makedirs(directory, exist_ok = True)
+    entries = []
+    active = None
+    for tab in workspace:
+        if tab in skipped:
+            continue
+        if tab is workspace.active:
+            active = len(entries)
+        snapshotPath = None
+        if tab.unloadPath is not None: # already written out when the tab was unloaded, or still being read back
+            snapshotPath = newSnapshotPath(directory)
+            shutil.move(tab.unloadPath, snapshotPath)
+            tab.unloadPath = None
+        elif tab.store is not None and not isinstance(tab.store, SqliteTaskStore): # databases are the list itself
+            snapshotPath = newSnapshotPath(directory)
+            writeBinaryFile(snapshotPath, tab.store.records())
+        entries.append({
+            "name": tab.name,
+            "filePath": tab.filePath,
+            "changed": tab.changed,
+            "snapshot": os.path.basename(snapshotPath) if snapshotPath is not None else None,
+            "signature": fileSignature(tab.filePath), # the file as the snapshot saw it
+            "count": len(tab.store) if tab.store is not None else None,
+            "view": tab.view
+        })
+    
+    session = {
+        "version": sessionVersion,
+        "active": active,
+        "tabs": entries,
+        "preview": [list(record) for record in preview]
+    }
+    sessionPath = os.path.join(directory, sessionFileName)
+    temporaryPath = sessionPath + ".tmp" # writes beside the file first so a failed save can't leave it half-written
+    with open(temporaryPath, 'w') as sessionFile:
+        json.dump(session, sessionFile)
+    os.replace(temporaryPath, sessionPath)
+    
+    kept = {entry["snapshot"] for entry in entries}
+    for name in os.listdir(directory): # snapshots from earlier sessions
+        if name.startswith("tab-") and name.endswith(".tlist") and name not in kept:
+            os.remove(os.path.join(directory, name))
+    return sessionPath
+
+def readSession(directory = defaultSessionDirectory):
+    """Returns the saved session, or None if there isn't one that can be read."""
+    try:
+        with open(os.path.join(directory, sessionFileName), 'r') as sessionFile:
+            session = json.load(sessionFile)
+    except (OSError, ValueError): # no session yet, or one cut short
+        return None
+    if not isinstance(session, dict) or session.get("version") != sessionVersion or not session.get("tabs"):
+        return None
+    return session
+
+def restoreTabs(session, directory = defaultSessionDirectory):
+    """Makes an unloaded tab for every list in session. A snapshot that is still good becomes its tab's unloadPath,
+    so it is read back when the tab is shown; the others are read from their files instead."""
+    tabs = []
+    for entry in session["tabs"]:
+        tab = ListTab(entry["name"], None, entry["filePath"])
+        tab.changed = entry["changed"]
+        tab.view = entry["view"]
+        if entry["snapshot"] is not None:
+            snapshotPath = os.path.join(directory, entry["snapshot"])
+            if os.path.exists(snapshotPath) and (tab.changed or tab.filePath is None or fileSignature(tab.filePath) == entry["signature"]): # the file hasn't moved on without it
+                tab.unloadPath = snapshotPath
+        tabs.append(tab)
+    return tabs
@@ -0,0 +1,378 @@
+"""
+Module: tasklist.sqlitestore
+Purpose: An SQLite storage backend for very large task lists, using the standard sqlite3 module.
+    Tasks stay in the database instead of being parsed into memory all at once:
+    only their ids are kept in memory (to know each task's position), and rows are read a page at a time.
+    Every single-task change is one INSERT, UPDATE or DELETE statement.
+    It works as a drop-in TaskStore, so the window, the command line, and the journal all use it the same way.
+"""
+
+import bisect # used for finding a task's position by id
+import json # used for importing/exporting the JSON save format
+import os # used for replacing exported files safely
+import sqlite3 # used for the database
+from array import array # used for holding every task id compactly
+
+from tasklist.core import Task, TaskStore, readTaskFile
+from tasklist.deadlines import parseDeadline
+
+schema = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    completed INTEGER NOT NULL DEFAULT 0,
+    task TEXT NOT NULL DEFAULT '',
+    deadline TEXT NOT NULL DEFAULT '',
+    due REAL
+);
+CREATE INDEX IF NOT EXISTS tasksByCompleted ON tasks (completed);
+"""
+dueSchema = """
+CREATE INDEX IF NOT EXISTS tasksByDue ON tasks (completed, due);
+DROP INDEX IF EXISTS tasksByDeadline;
+"""
+
+class SqliteTaskStore(TaskStore):
+    def __init__(self, databasePath, cacheSize = 4096):
+        super().__init__() # keeps the listeners; the tasks themselves live in the database
+        self.databasePath = databasePath
+        self.connection = sqlite3.connect(databasePath)
+        self.connection.execute("PRAGMA journal_mode = WAL") # lets single-row changes commit quickly
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(schema)
+        columns = [row[1] for row in self.connection.execute("PRAGMA table_info(tasks)")]
+        if "due" not in columns: # databases made before deadlines were parsed
+            self.addDueColumn()
+        self.connection.executescript(dueSchema)
+        self.cacheSize = cacheSize # how many recently read tasks are kept as objects
+        self.cache = {} # taskId -> Task, for recently read rows
+        self.loadIndex()
+    
+    def addDueColumn(self):
+        with self.connection:
+            self.connection.execute("ALTER TABLE tasks ADD COLUMN due REAL")
+            self.connection.executemany( # parses each deadline once, now, instead of every time it is read
+                "UPDATE tasks SET due = ? WHERE id = ?",
+                ((parseDeadline(deadline), taskId) for taskId, deadline in self.connection.execute("SELECT id, deadline FROM tasks").fetchall())
+            )
+    
+    def loadIndex(self):
+        self.ids = array('q', (row[0] for row in self.connection.execute("SELECT id FROM tasks ORDER BY id"))) # every id, in list order
+        self.completedCount = self.connection.execute("SELECT COUNT(*) FROM tasks WHERE completed = 1").fetchone()[0]
+        self.nextId = (self.ids[-1] + 1) if self.ids else 1
+        self.cache.clear()
+    
+    def cached(self, row):
+        record = self.cache.get(row[0])
+        if record is None:
+            if len(self.cache) >= self.cacheSize: # forgets old pages rather than growing without limit
+                self.cache.clear()
+            record = Task(*row)
+            self.cache[row[0]] = record
+        return record
+    
+    def __len__(self):
+        return len(self.ids)
+    
+    def __iter__(self):
+        lastId = None
+        while True: # reads the list a page at a time, so iterating never holds it all
+            if lastId is None:
+                rows = self.connection.execute("SELECT id, completed, task, deadline, due FROM tasks ORDER BY id LIMIT 1000").fetchall()
+            else:
+                rows = self.connection.execute("SELECT id, completed, task, deadline, due FROM tasks WHERE id > ? ORDER BY id LIMIT 1000", (lastId,)).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield Task(*row)
+            lastId = rows[-1][0]
+    
+    def get(self, taskId):
+        record = self.cache.get(taskId)
+        if record is None:
+            row = self.connection.execute("SELECT id, completed, task, deadline, due FROM tasks WHERE id = ?", (taskId,)).fetchone()
+            record = self.cached(row) if row else None
+        return record
+    
+    def orderedIds(self):
+        return self.ids
+    
+    def taskAt(self, index):
+        return self.get(self.ids[index])
+    
+    def page(self, start, count):
+        if start >= len(self.ids) or count <= 0:
+            return []
+        rows = self.connection.execute( # uses the id index, so any page costs the same
+            "SELECT id, completed, task, deadline, due FROM tasks WHERE id >= ? ORDER BY id LIMIT ?",
+            (self.ids[max(0, start)], count)
+        ).fetchall()
+        return [self.cached(row) for row in rows]
+    
+    def records(self):
+        return self.connection.execute("SELECT id, completed, task, deadline FROM tasks ORDER BY id").fetchall()
+    
+    def pendingDeadlines(self):
+        return self.connection.execute("SELECT due, id FROM tasks WHERE completed = 0 AND due IS NOT NULL ORDER BY due, id").fetchall()
+    
+    def pendingIds(self):
+        return [row[0] for row in self.connection.execute("SELECT id FROM tasks WHERE completed = 0 ORDER BY id")]
+    
+    def completedIds(self):
+        return [row[0] for row in self.connection.execute("SELECT id FROM tasks WHERE completed = 1 ORDER BY id")]
+    
+    def allocate(self, completed, task, deadline, taskId = None):
+        """Gives a new task its id and place in the index; the caller writes the row."""
+        if taskId is None or self.position(taskId) is not None: # new tasks (and clashing ids) get a fresh id
+            taskId = self.nextId
+        self.nextId = max(self.nextId, taskId + 1)
+        
+        row = (taskId, 1 if completed else 0, task, deadline, parseDeadline(deadline))
+        if not self.ids or taskId > self.ids[-1]:
+            self.ids.append(taskId)
+        else:
+            self.ids.insert(bisect.bisect_left(self.ids, taskId), taskId)
+        self.completedCount += row[1]
+        return row
+    
+    def insert(self, completed, task, deadline, taskId = None):
+        row = self.allocate(completed, task, deadline, taskId)
+        self.connection.execute("INSERT INTO tasks (id, completed, task, deadline, due) VALUES (?, ?, ?, ?, ?)", row)
+        return self.cached(row)
+    
+    def position(self, taskId):
+        index = bisect.bisect_left(self.ids, taskId)
+        if index < len(self.ids) and self.ids[index] == taskId:
+            return index
+        return None
+    
+    def positionOf(self, taskId):
+        return bisect.bisect_left(self.ids, taskId) # the ids are kept sorted, so this is a binary search
+    
+    def add(self, task, deadline, completed = 0, taskId = None):
+        with self.connection: # commits the one INSERT
+            record = self.insert(completed, task, deadline, taskId)
+        self.notify("add", [record])
+        return record
+    
+    def extend(self, records):
+        rows = [self.allocate(completed, task, deadline, taskId) for taskId, completed, task, deadline in records]
+        with self.connection: # one statement and one transaction for the whole batch
+            self.connection.executemany("INSERT INTO tasks (id, completed, task, deadline, due) VALUES (?, ?, ?, ?, ?)", rows)
+        added = [Task(*row) for row in rows]
+        if added:
+            self.notify("add", added)
+        return added
+    
+    def remove(self, taskId):
+        record = self.get(taskId)
+        if record is None:
+            raise KeyError(taskId)
+        with self.connection:
+            self.connection.execute("DELETE FROM tasks WHERE id = ?", (taskId,))
+        position = self.position(taskId)
+        del self.ids[position]
+        self.cache.pop(taskId, None)
+        self.completedCount -= record.completed
+        self.notify("remove", [record], [position])
+        return record
+    
+    def setCompleted(self, taskId, completed):
+        record = self.get(taskId)
+        if record is None:
+            raise KeyError(taskId)
+        completed = 1 if completed else 0
+        if record.completed == completed:
+            return record
+        previous = record.values()
+        with self.connection:
+            self.connection.execute("UPDATE tasks SET completed = ? WHERE id = ?", (completed, taskId))
+        self.completedCount += completed - record.completed
+        record.completed = completed
+        self.notify("update", [record], [previous])
+        return record
+    
+    def getMany(self, taskIds):
+        """Reads the listed tasks, a few hundred ids per query. Raises KeyError if any is missing."""
+        taskIds = list(dict.fromkeys(taskIds)) # repeated ids are only read once
+        found = {taskId: self.cache[taskId] for taskId in taskIds if taskId in self.cache}
+        missing = [taskId for taskId in taskIds if taskId not in found]
+        for start in range(0, len(missing), 500): # stays well under SQLite's limit on query parameters
+            chunk = missing[start:start + 500]
+            rows = self.connection.execute(
+                f"SELECT id, completed, task, deadline, due FROM tasks WHERE id IN ({', '.join('?' * len(chunk))})",
+                chunk
+            ).fetchall()
+            for row in rows:
+                found[row[0]] = self.cached(row)
+        records = [found.get(taskId) for taskId in taskIds]
+        if None in records:
+            raise KeyError(taskIds[records.index(None)])
+        return records
+    
+    def removeMany(self, taskIds):
+        removed = self.getMany(taskIds)
+        if not removed:
+            return removed
+        positions = [self.position(record.taskId) for record in removed]
+        with self.connection: # one statement and one transaction for the whole batch
+            self.connection.executemany("DELETE FROM tasks WHERE id = ?", [(record.taskId,) for record in removed])
+        if len(removed) > 64: # rebuilding the index is cheaper than many deletes from the middle of it
+            removedIds = {record.taskId for record in removed}
+            self.ids = array('q', (taskId for taskId in self.ids if taskId not in removedIds))
+        else:
+            for record in removed:
+                del self.ids[self.position(record.taskId)]
+        for record in removed:
+            self.cache.pop(record.taskId, None)
+            self.completedCount -= record.completed
+        self.notify("remove", removed, positions)
+        return removed
+    
+    def restore(self, records, positions):
+        """Puts removed records back; the list is in id order, so they return to their old places on their own."""
+        rows = [self.allocate(completed, task, deadline, taskId) for taskId, completed, task, deadline in records]
+        with self.connection:
+            self.connection.executemany("INSERT INTO tasks (id, completed, task, deadline, due) VALUES (?, ?, ?, ?, ?)", rows)
+        restored = [self.cached(row) for row in rows]
+        if restored:
+            self.notify("add", restored, [self.position(record.taskId) for record in restored])
+        return restored
+    
+    def setValues(self, values):
+        values = list(values)
+        records = self.getMany(taskId for taskId, completed, task, deadline in values)
+        changed = []
+        previous = []
+        rows = []
+        for record, (taskId, completed, task, deadline) in zip(records, values):
+            completed = 1 if completed else 0
+            if (completed, task, deadline) == record.values():
+                continue
+            previous.append(record.values())
+            self.completedCount += completed - record.completed
+            if deadline != record.deadline:
+                record.due = parseDeadline(deadline)
+            record.completed = completed
+            record.task = task
+            record.deadline = deadline
+            changed.append(record)
+            rows.append((completed, task, deadline, record.due, taskId))
+        if changed:
+            with self.connection: # one transaction for the whole batch
+                self.connection.executemany("UPDATE tasks SET completed = ?, task = ?, deadline = ?, due = ? WHERE id = ?", rows)
+            self.notify("update", changed, previous)
+        return changed
+    
+    def edit(self, taskId, task, deadline):
+        record = self.get(taskId)
+        if record is None:
+            raise KeyError(taskId)
+        self.setValues([(taskId, record.completed, task, deadline)])
+        return record
+    
+    def setCompletedMany(self, taskIds, completed):
+        completed = 1 if completed else 0
+        changed = [record for record in self.getMany(taskIds) if record.completed != completed]
+        if not changed:
+            return changed
+        previous = [record.values() for record in changed]
+        with self.connection:
+            self.connection.executemany("UPDATE tasks SET completed = ? WHERE id = ?", [(completed, record.taskId) for record in changed])
+        for record in changed:
+            record.completed = completed
+        self.completedCount += len(changed) if completed else -len(changed)
+        self.notify("update", changed, previous)
+        return changed
+    
+    def reconcile(self, records):
+        """Like TaskStore.reconcile, but the list is read in one query to compare against, instead of one query per task."""
+        records = list(records)
+        wanted = {record[0]: record for record in records}
+        if None in wanted or len(wanted) != len(records): # tasks can only be matched by a unique id
+            self.replaceAll(records)
+            return None
+        
+        current = {row[0]: row[1:] for row in self.records()} # taskId -> (completed, task, deadline), in id order
+        kept = [taskId for taskId in current if taskId in wanted]
+        if kept != [record[0] for record in records if record[0] in current]: # the tasks that stayed were reordered
+            self.replaceAll(records)
+            return None
+        removedIds = [taskId for taskId in current if taskId not in wanted]
+        changes = [wanted[taskId] for taskId in kept if current[taskId] != (1 if wanted[taskId][1] else 0,) + tuple(wanted[taskId][2:])]
+        additions = [record for record in records if record[0] not in current]
+        
+        if removedIds:
+            self.removeMany(removedIds)
+        if changes:
+            self.setValues(changes)
+        addedIds = [record[0] for record in additions]
+        if additions and (not kept or addedIds[0] > kept[-1]) and addedIds == sorted(addedIds): # every new task comes after the ones that stayed
+            self.extend(additions)
+        elif additions: # the list is in id order, so new tasks go to their places on their own
+            self.restore(additions, [])
+        return (len(additions), len(removedIds), len(changes))
+    
+    def clear(self):
+        self.connection.execute("DELETE FROM tasks")
+        self.ids = array('q')
+        self.cache.clear()
+        self.completedCount = 0
+        self.nextId = 1
+    
+    def replaceAll(self, records):
+        with self.connection: # the old list is only gone once the new one is in
+            self.clear()
+            self.connection.executemany(
+                "INSERT INTO tasks (id, completed, task, deadline, due) VALUES (?, ?, ?, ?, ?)",
+                numberRecords(records)
+            )
+        self.loadIndex()
+        self.notify("reset", [])
+    
+    def close(self):
+        self.connection.close()
+
+def numberRecords(records):
+    nextId = 1
+    seen = set()
+    for taskId, completed, task, deadline in records: # gives records without a usable id the next free one
+        if taskId is None or taskId in seen:
+            taskId = nextId
+        seen.add(taskId)
+        nextId = max(nextId, taskId + 1)
+        yield (taskId, 1 if completed else 0, task, deadline, parseDeadline(deadline))
+
+def readDatabaseRecords(databasePath):
+    """Reads every task in a database through a connection of its own, so it can run on any thread."""
+    connection = sqlite3.connect(databasePath)
+    try: # reads one consistent snapshot, even while another connection keeps writing
+        return connection.execute("SELECT id, completed, task, deadline FROM tasks ORDER BY id").fetchall()
+    finally:
+        connection.close()
+
+def streamDatabaseRecords(databasePath):
+    """Yields every task in a database one at a time, through a connection of its own."""
+    connection = sqlite3.connect(databasePath)
+    try:
+        yield from connection.execute("SELECT id, completed, task, deadline FROM tasks ORDER BY id") # a single query sees one snapshot
+    finally:
+        connection.close()
+
+def importJsonFile(databasePath, jsonPath):
+    """Replaces a database's tasks with the tasks in a JSON save file."""
+    store = SqliteTaskStore(databasePath)
+    store.replaceAll(readTaskFile(jsonPath))
+    return store
+
+def exportJsonFile(store, jsonPath):
+    """Writes a database's tasks in the JSON save file format, one task at a time."""
+    temporaryPath = jsonPath + ".tmp"
+    with open(temporaryPath, 'w') as saveFile:
+        saveFile.write("{")
+        separator = "\n"
+        for record in store: # streams the rows instead of building the whole document
+            entry = json.dumps({"completed": record.completed, "task": record.task, "deadline": record.deadline}, indent = 4)
+            saveFile.write(f"{separator}    {json.dumps(str(record.taskId))}: {entry.replace(chr(10), chr(10) + '    ')}")
+            separator = ",\n"
+        saveFile.write("\n}" if separator != "\n" else "}")
+    os.replace(temporaryPath, jsonPath)
@@ -0,0 +1,491 @@
+"""
+Module: tasklist.sync
+Purpose: Sharing one list between several copies of the program on the same computer.
+    A small server ("python -m tasklist -f FILE serve") holds the list and autosaves it to FILE through a journal.
+    Clients send only the tasks they changed, one message per change to their store. The server applies
+    changes in the order they arrive, numbers each batch with a version, and sends it on to every client,
+    including the one it came from, so every copy ends up the same; when two clients change one task at once,
+    the change the server got last wins. New tasks take ids from a block the server gives each client,
+    so two clients never hand out the same id.
+
+Protocol: one JSON object per line, over a localhost TCP socket or a Unix socket.
+    client -> server    {"type": "ops", "ops": [...]}
+                        {"type": "block"}  (asks for more ids)
+                        {"type": "tasks"}  (asks for the whole list, when a client had to guess where tasks go)
+    server -> client    {"type": "welcome", "client": n, "version": v, "tasks": [records], "block": [start, size]}
+                        {"type": "changes", "version": v, "origin": n, "ops": [...]}
+                        {"type": "block", "block": [start, size]}
+                        {"type": "tasks", "version": v, "tasks": [records]}
+    ops                 {"op": "add", "id", "completed", "task", "deadline"}, with "at" for tasks put back in place
+                            (the server always sends "at", and "after" and "before", the ids of the tasks on either side or null),
+                            and "replaces" when the server had to give the task a different id
+                        {"op": "set", "id", "completed", "task", "deadline"}
+                        {"op": "rm", "id"}
+                        {"op": "reset", "tasks": [records]}
+"""
+
+import bisect # used for finding the tasks that are already in the server's order
+import json # used for the messages
+import queue # used for handing received changes to the window's thread
+import socket # used for connecting to the server
+import threading # used for receiving changes without blocking the window
+
+from tasklist.core import TaskStore
+from tasklist.journal import TaskJournal, readJournaledFile
+
+defaultHost = "127.0.0.1"
+defaultPort = 7070
+blockSize = 1 << 20 # task ids given to a client at a time; a new block is asked for once half are used
+lineLimit = 64 * 1024 * 1024 # longest message accepted, in bytes (a whole list is sent as one line)
+sendBufferLimit = 16 * 1024 * 1024 # bytes waiting to be sent before a client that stopped reading is dropped
+
+def encode(message):
+    return (json.dumps(message, separators = (",", ":")) + "\n").encode("utf-8")
+
+def taskOp(kind, record):
+    return {"op": kind, "id": record.taskId, "completed": record.completed, "task": record.task, "deadline": record.deadline}
+
+def opsFromChange(store, action, tasks, previous):
+    """Turns a store change into the ops that make the same change on another copy of the list."""
+    if action == "remove":
+        return [{"op": "rm", "id": record.taskId} for record in tasks]
+    if action == "update":
+        return [taskOp("set", record) for record in tasks]
+    if action == "reset":
+        return [{"op": "reset", "tasks": store.records()}]
+    ops = [taskOp("add", record) for record in tasks]
+    if previous is not None: # tasks put back in the middle of the list
+        for op, position in zip(ops, previous):
+            op["at"] = position
+    return ops
+
+def opRuns(ops):
+    """Splits ops into runs of the same kind, so each run is applied as one change."""
+    start = 0
+    while start < len(ops):
+        end = start
+        while end < len(ops) and ops[end]["op"] == ops[start]["op"]:
+            end += 1
+        yield ops[start]["op"], ops[start:end]
+        start = end
+
+def opRecord(op, taskId = None):
+    return (op["id"] if taskId is None else taskId, op["completed"], op["task"], op["deadline"])
+
+def checkRecord(taskId, completed, task, deadline):
+    if not isinstance(taskId, int) or not isinstance(completed, int) or not isinstance(task, str) or not isinstance(deadline, str):
+        raise ValueError(f"a task with the wrong types of values: {[taskId, completed, task, deadline]}")
+
+def checkOps(ops):
+    """Raises ValueError if any op is broken, so a message is applied as a whole or not at all."""
+    if not isinstance(ops, list) or not all(isinstance(op, dict) for op in ops):
+        raise ValueError("ops must be a list of objects")
+    for op in ops:
+        kind = op.get("op")
+        if not isinstance(kind, str):
+            raise ValueError(f"an op without a kind: {op}")
+        if kind in ("add", "set"):
+            checkRecord(*opRecord(op))
+            if "at" in op and (not isinstance(op["at"], int) or op["at"] < 0):
+                raise ValueError(f"a task put back at {op['at']!r}")
+        elif kind == "rm":
+            if not isinstance(op.get("id"), int):
+                raise ValueError(f"a task removed by the id {op.get('id')!r}")
+        elif kind == "reset":
+            if not isinstance(op.get("tasks"), list) or not all(isinstance(record, list) and len(record) == 4 for record in op["tasks"]):
+                raise ValueError("a reset without a list of tasks")
+            for record in op["tasks"]:
+                checkRecord(*record)
+
+def longestRising(values):
+    """Returns the indexes of a longest run of values (not necessarily next to each other) that only go up."""
+    tails = [] # tails[k]: the smallest value that ends a rising run of k + 1 values so far
+    tailIndexes = []
+    previous = [None] * len(values) # the index before each one in its best run
+    for index, value in enumerate(values):
+        length = bisect.bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tailIndexes.append(index)
+        else:
+            tails[length] = value
+            tailIndexes[length] = index
+        previous[index] = tailIndexes[length - 1] if length else None
+    run = []
+    index = tailIndexes[-1] if tailIndexes else None
+    while index is not None:
+        run.append(index)
+        index = previous[index]
+    return run[::-1]
+
+def parseAddress(address):
+    """Returns (family, address) for "host:port", a bare port, or "unix:PATH"."""
+    if address.startswith("unix:"):
+        return (socket.AF_UNIX, address[len("unix:"):])
+    host, separator, port = address.rpartition(":")
+    if not separator:
+        host = defaultHost
+    return (socket.AF_INET, (host or defaultHost, int(port))) # a port that isn't a number raises ValueError
+
+### SERVER
+
+class SyncServer:
+    def __init__(self, filePath):
+        self.filePath = filePath
+        self.store = TaskStore()
+        self.store.replaceAll(readJournaledFile(filePath))
+        self.journal = None # saves every change, once serving
+        self.version = 0 # counts the batches of changes applied
+        self.clients = {} # client number -> StreamWriter
+        self.nextClient = 1
+        self.nextBlock = self.store.nextId # the first id not yet given to a client
+    
+    def allocateBlock(self):
+        start = max(self.nextBlock, self.store.nextId)
+        self.nextBlock = start + blockSize
+        return [start, blockSize]
+    
+    def allocateId(self):
+        taskId = max(self.nextBlock, self.store.nextId)
+        self.nextBlock = taskId + 1
+        return taskId
+    
+    def apply(self, ops):
+        """Applies a client's ops and returns the ops that actually changed the list, with the ids the tasks ended up with.
+        Raises ValueError, changing nothing, if any of them is broken."""
+        checkOps(ops)
+        applied = []
+        for kind, run in opRuns(ops):
+            applied.extend(self.applyRun(kind, run))
+        return applied
+    
+    def applyRun(self, kind, run):
+        store = self.store
+        if kind == "add":
+            records = []
+            replaced = {}
+            for op in run:
+                taskId = op["id"]
+                if store.get(taskId) is not None: # only happens if a client used up its ids before a new block arrived
+                    taskId = self.allocateId()
+                    replaced[taskId] = op["id"]
+                records.append(opRecord(op, taskId))
+            placed = all("at" in op for op in run)
+            added = store.restore(records, [op["at"] for op in run]) if placed else store.extend(records)
+            results = []
+            for record in added:
+                result = taskOp("add", record)
+                result["at"] = store.positionOf(record.taskId)
+                result["after"] = store.taskAt(result["at"] - 1).taskId if result["at"] else None # lets every client put the task in the same place
+                result["before"] = store.taskAt(result["at"] + 1).taskId if result["at"] + 1 < len(store) else None
+                if record.taskId in replaced:
+                    result["replaces"] = replaced[record.taskId]
+                results.append(result)
+            return results
+        if kind == "set": # changes to tasks someone else has deleted are dropped
+            changed = store.setValues([opRecord(op) for op in run if store.get(op["id"]) is not None])
+            return [taskOp("set", record) for record in changed]
+        if kind == "rm":
+            removed = store.removeMany([op["id"] for op in run if store.get(op["id"]) is not None])
+            return [{"op": "rm", "id": record.taskId} for record in removed]
+        if kind == "reset":
+            store.replaceAll([tuple(record) for record in run[-1]["tasks"]])
+            return [{"op": "reset", "tasks": store.records()}]
+        return [] # ops from newer versions of the program are ignored
+    
+    def broadcast(self, message):
+        data = encode(message) # encoded once for every client
+        for clientNumber, writer in list(self.clients.items()):
+            if writer.transport.get_write_buffer_size() > sendBufferLimit: # a client that stopped reading can't hold the others up
+                del self.clients[clientNumber]
+                writer.close()
+                continue
+            writer.write(data)
+    
+    async def handleClient(self, reader, writer):
+        clientNumber = self.nextClient
+        self.nextClient += 1
+        writer.write(encode({
+            "type": "welcome",
+            "client": clientNumber,
+            "version": self.version,
+            "tasks": self.store.records(),
+            "block": self.allocateBlock()
+        }))
+        self.clients[clientNumber] = writer
+        try:
+            while True:
+                line = await reader.readline()
+                if not line: # the client closed the connection
+                    break
+                try:
+                    message = json.loads(line)
+                    if message["type"] == "block":
+                        writer.write(encode({"type": "block", "block": self.allocateBlock()}))
+                    elif message["type"] == "tasks":
+                        writer.write(encode({"type": "tasks", "version": self.version, "tasks": self.store.records()}))
+                    elif message["type"] == "ops":
+                        applied = self.apply(message["ops"])
+                        if applied:
+                            self.version += 1
+                            self.broadcast({"type": "changes", "version": self.version, "origin": clientNumber, "ops": applied})
+                except (ValueError, KeyError, TypeError) as error: # a broken message is skipped, not fatal
+                    print(f"Ignored a message from client {clientNumber}: {error}")
+                await writer.drain()
+        except (ConnectionError, ValueError): # includes lines over the length limit
+            pass
+        finally:
+            self.clients.pop(clientNumber, None)
+            writer.close()
+    
+    async def serve(self, host = defaultHost, port = defaultPort, socketPath = None):
+        import asyncio # only the server needs it, so windows and the command line start without loading it
+        
+        self.journal = TaskJournal(self.filePath, self.store) # every change is appended to the file's journal
+        if socketPath is not None:
+            server = await asyncio.start_unix_server(self.handleClient, socketPath, limit = lineLimit)
+            print(f"Sharing \"{self.filePath}\" on unix:{socketPath}.")
+        else:
+            server = await asyncio.start_server(self.handleClient, host, port, limit = lineLimit)
+            print(f"Sharing \"{self.filePath}\" on {host}:{port}.")
+        async with server:
+            while True:
+                await asyncio.sleep(1)
+                self.journal.sync() # batches the disk syncs for everything changed in the last second
+    
+    def close(self):
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+
+def serve(filePath, host = defaultHost, port = defaultPort, socketPath = None):
+    """Shares filePath until interrupted (Ctrl+C)."""
+    import asyncio
+    
+    server = SyncServer(filePath)
+    try:
+        asyncio.run(server.serve(host, port, socketPath))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+### CLIENT
+
+class SyncClient:
+    def __init__(self, address, timeout = 5):
+        family, target = parseAddress(address)
+        self.socket = socket.socket(family, socket.SOCK_STREAM)
+        self.socket.settimeout(timeout) # only while joining; after that the receiving thread waits as long as it takes
+        self.socket.connect(target)
+        self.reader = self.socket.makefile("rb")
+        line = self.reader.readline()
+        if not line:
+            self.socket.close()
+            raise ConnectionError("the server closed the connection")
+        self.socket.settimeout(None)
+        welcome = json.loads(line)
+        
+        self.clientNumber = welcome["client"]
+        self.version = welcome["version"] # the last batch of changes applied
+        self.store = TaskStore()
+        self.store.replaceAll([tuple(record) for record in welcome["tasks"]])
+        self.useBlock(welcome["block"])
+        self.unconfirmed = set() # ids of tasks added here that the server hasn't sent back yet
+        self.clashed = set() # ids of tasks added here that another client's task turned out to have
+        self.unsure = False # whether tasks from the server had to go where this copy guessed
+        self.checkRequested = False # whether the whole list has been asked for
+        self.changedSinceCheck = False # whether changes were sent after asking, which the list won't have
+        self.applying = False # whether the changes being made came from the server
+        self.connected = True
+        self.incoming = queue.SimpleQueue() # messages received and not yet applied; None once the connection closes
+        self.store.subscribe(self.sendChange)
+        self.receiver = threading.Thread(target = self.receive, name = "tasklist-sync", daemon = True)
+        self.receiver.start()
+    
+    def useBlock(self, block):
+        start, size = block
+        self.store.nextId = start # new tasks are numbered from the block
+        self.blockStart = start
+        self.blockEnd = start + size
+        self.lastNextId = start # where numbering carries on from if something moves nextId out of the block
+        self.blockRequested = False
+    
+    def keepInBlock(self):
+        """Moves the store's nextId back into this client's block if a local change took it out,
+        like undoing the delete of another client's task, which numbers new tasks after the restored id."""
+        store = self.store
+        if not self.blockStart <= store.nextId <= self.blockEnd:
+            store.nextId = self.lastNextId
+        self.lastNextId = store.nextId
+    
+    def send(self, message):
+        try:
+            self.socket.sendall(encode(message))
+        except OSError:
+            self.incoming.put(None)
+    
+    def sendChange(self, action, tasks, previous):
+        if self.applying or not self.connected: # changes from the server aren't sent back to it
+            return
+        self.keepInBlock()
+        if action == "add":
+            self.unconfirmed.update(record.taskId for record in tasks)
+        self.changedSinceCheck = True
+        self.send({"type": "ops", "ops": opsFromChange(self.store, action, tasks, previous)})
+        if not self.blockRequested and self.store.nextId >= self.blockEnd - blockSize // 2:
+            self.blockRequested = True
+            self.send({"type": "block"})
+    
+    def receive(self):
+        """Runs on its own thread, queueing every message the server sends."""
+        try:
+            for line in self.reader:
+                self.incoming.put(json.loads(line))
+        except (OSError, ValueError):
+            pass
+        self.incoming.put(None)
+    
+    def deliver(self):
+        """Applies received changes to the store. Only call this from the thread that owns the store.
+        Returns how many batches of changes came from other clients."""
+        remoteChanges = 0
+        while True:
+            try:
+                message = self.incoming.get_nowait()
+            except queue.Empty:
+                if self.unsure and not self.checkRequested and self.connected:
+                    self.checkRequested = True
+                    self.changedSinceCheck = False
+                    self.send({"type": "tasks"})
+                return remoteChanges
+            if message is None:
+                self.connected = False
+            elif message["type"] == "block":
+                self.useBlock(message["block"])
+            elif message["type"] == "tasks":
+                self.checkRequested = False
+                if not self.changedSinceCheck: # otherwise it's asked for again once this client's changes are in
+                    self.catchUp([tuple(record) for record in message["tasks"]])
+            elif message["type"] == "changes":
+                own = message["origin"] == self.clientNumber
+                self.version = message["version"]
+                self.applyChanges(message["ops"], own)
+                if not own:
+                    remoteChanges += 1
+    
+    def applyChanges(self, ops, own):
+        store = self.store
+        nextId = store.nextId # other clients' ids mustn't move this client out of its block
+        self.applying = True
+        try:
+            for kind, run in opRuns(ops):
+                if kind == "add":
+                    self.applyAdds(run, own)
+                elif kind == "set":
+                    store.setValues([opRecord(op) for op in run if store.get(op["id"]) is not None])
+                elif kind == "rm":
+                    store.removeMany([op["id"] for op in run if store.get(op["id"]) is not None])
+                elif kind == "reset" and not own:
+                    store.replaceAll([tuple(record) for record in run[-1]["tasks"]])
+        finally:
+            self.applying = False
+            store.nextId = nextId
+    
+    def applyAdds(self, run, own):
+        store = self.store
+        if own: # this client's tasks coming back; usually they are here already
+            for op in run:
+                requested = op.get("replaces", op["id"])
+                self.unconfirmed.discard(requested)
+                if "replaces" in op and requested not in self.clashed and store.get(requested) is not None:
+                    store.removeMany([requested]) # comes back below under its new id
+                self.clashed.discard(requested)
+        else:
+            clashes = [op["id"] for op in run if op["id"] in self.unconfirmed]
+            if clashes: # another client got there first; this client's tasks come back under new ids
+                store.removeMany([taskId for taskId in clashes if store.get(taskId) is not None]) # some may be deleted here again already
+                self.unconfirmed.difference_update(clashes)
+                self.clashed.update(clashes)
+        store.setValues([opRecord(op) for op in run if store.get(op["id"]) is not None])
+        fresh = [op for op in run if store.get(op["id"]) is None]
+        last = store.taskAt(len(store) - 1).taskId if len(store) else None
+        if [op["after"] for op in fresh] == [last] + [op["id"] for op in fresh[:-1]] and len(fresh) == len(run): # the usual case: new tasks at the end
+            store.extend(opRecord(op) for op in fresh)
+            return
+        following = [] # new tasks that follow one another, put in together
+        for op in sorted(run, key = lambda op: op["at"]): # the tasks the others follow are placed first
+            new = store.get(op["id"]) is None
+            if following and not (new and op["after"] == following[-1]["id"]):
+                self.place(following)
+                following = []
+            if new:
+                following.append(op)
+            elif not self.follows(op): # this client's own task, added here before others' that the server got first
+                store.removeMany([op["id"]])
+                self.place([op])
+        if following:
+            self.place(following)
+    
+    def follows(self, op):
+        """Whether a task is between the ones the server has on either side of it (or can't be told, as they are gone here)."""
+        store = self.store
+        position = store.positionOf(op["id"])
+        if op["after"] is None:
+            return position == 0
+        if store.get(op["after"]) is not None:
+            return position > 0 and store.taskAt(position - 1).taskId == op["after"]
+        if op["before"] is None:
+            return position == len(store) - 1
+        if store.get(op["before"]) is not None:
+            return position + 1 < len(store) and store.taskAt(position + 1).taskId == op["before"]
+        self.unsure = True
+        return True
+    
+    def place(self, ops):
+        """Puts tasks the server sent in a row straight after the task the server has before them,
+        or straight before the one it has after them if this client has deleted the first.
+        The server's "at" is only a last resort; positions in this copy move with its own unsent changes."""
+        store = self.store
+        first, last = ops[0], ops[-1]
+        if first["after"] is None:
+            start = 0
+        elif store.get(first["after"]) is not None:
+            start = store.positionOf(first["after"]) + 1
+        elif last["before"] is None:
+            start = len(store)
+        elif store.get(last["before"]) is not None:
+            start = store.positionOf(last["before"])
+        else:
+            start = min(first["at"], len(store))
+            self.unsure = True
+        store.restore([opRecord(op) for op in ops], range(start, start + len(ops)))
+    
+    def catchUp(self, records):
+        """Makes this copy match the server's list, moving only the tasks that are out of its order.
+        Only called when every change sent from here is in the list, so nothing made here is lost."""
+        store = self.store
+        wanted = {record[0]: position for position, record in enumerate(records)}
+        nextId = store.nextId
+        self.applying = True
+        try:
+            store.removeMany([taskId for taskId in store.orderedIds() if taskId not in wanted])
+            store.setValues([record for record in records if store.get(record[0]) is not None])
+            order = list(store.orderedIds())
+            kept = {order[index] for index in longestRising([wanted[taskId] for taskId in order])}
+            store.removeMany([taskId for taskId in order if taskId not in kept])
+            moved = [position for position, record in enumerate(records) if record[0] not in kept]
+            store.restore([records[position] for position in moved], moved)
+        finally:
+            self.applying = False
+            store.nextId = nextId
+        self.unsure = False
+    
+    def close(self):
+        self.store.unsubscribe(self.sendChange)
+        self.connected = False
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.socket.close()
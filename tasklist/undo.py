@@ -0,0 +1,148 @@
+"""
+Module: tasklist.undo
+Purpose: Undo and redo for a task store, kept as a log of small changes rather than copies of the whole list.
+    Each entry is one change the store reported (tasks added, tasks removed with their data and places,
+    or tasks' old and new values), so undoing a bulk action puts everything back as one change.
+    The log holds a bounded number of entries and task rows in memory. Older entries are either forgotten
+    or, when a spill file is given, moved to disk and read back once undo reaches them.
+"""
+
+import json # used for spilling old entries to disk
+import os # used for removing the spill file
+from collections import deque # used for dropping the oldest entries cheaply
+
+class UndoLog:
+    def __init__(self, store = None, entryLimit = 200, rowLimit = 50000, spillPath = None):
+        self.store = None
+        self.entryLimit = entryLimit # most entries kept in memory
+        self.rowLimit = rowLimit # most task rows kept in memory across all entries
+        self.spillPath = spillPath # file older entries are moved to, or None to forget them
+        self.spillFile = None
+        self.spillOffsets = [] # where each spilled entry starts in the spill file, oldest first
+        self.undoEntries = deque() # oldest first
+        self.redoEntries = []
+        self.heldRows = 0 # task rows held by the entries in memory
+        self.captured = None # the change an undo or redo made, while one is running
+        self.recording = True # turned off while changes shouldn't be undoable, like tasks being loaded
+        if store is not None:
+            self.attach(store)
+    
+    def attach(self, store):
+        if self.store is not None:
+            self.store.unsubscribe(self.record)
+        self.store = store
+        store.subscribe(self.record)
+        self.clear()
+    
+    def clear(self):
+        self.undoEntries.clear()
+        self.redoEntries = []
+        self.heldRows = 0
+        self.closeSpill()
+    
+    def canUndo(self):
+        return bool(self.undoEntries) or bool(self.spillOffsets)
+    
+    def canRedo(self):
+        return bool(self.redoEntries)
+    
+    ### RECORDING
+    
+    def record(self, action, tasks, previous):
+        if action == "reset": # a different list; the old history no longer applies
+            self.clear()
+            return
+        if not self.recording:
+            return
+        entry = makeEntry(action, tasks, previous)
+        if self.captured is not None: # the change is an undo or redo being applied, not a new edit
+            self.captured.append(entry)
+            return
+        self.redoEntries = [] # a new change starts a new future
+        self.push(entry)
+    
+    def push(self, entry):
+        self.undoEntries.append(entry)
+        self.heldRows += len(entry[1])
+        while len(self.undoEntries) > 1 and (len(self.undoEntries) > self.entryLimit or self.heldRows > self.rowLimit):
+            oldest = self.undoEntries.popleft() # the newest entry is always kept, however big
+            self.heldRows -= len(oldest[1])
+            if self.spillPath is not None:
+                self.spill(oldest)
+    
+    def pop(self):
+        if self.undoEntries:
+            entry = self.undoEntries.pop()
+            self.heldRows -= len(entry[1])
+            return entry
+        if self.spillOffsets: # everything in memory has been undone, so the newest spilled entry is next
+            return self.unspill()
+        return None
+    
+    ### UNDO AND REDO
+    
+    def undo(self):
+        """Reverses the latest change as one store change. Returns False if there was nothing to undo."""
+        entry = self.pop()
+        if entry is None:
+            return False
+        self.redoEntries.extend(self.apply(entry))
+        return True
+    
+    def redo(self):
+        """Makes the latest undone change again. Returns False if there was nothing to redo."""
+        if not self.redoEntries:
+            return False
+        for entry in self.apply(self.redoEntries.pop()):
+            self.push(entry)
+        return True
+    
+    def apply(self, entry):
+        """Applies the reverse of entry, returning the entries for the changes that made (which reverse it back)."""
+        kind, rows, extra = entry
+        self.captured = []
+        try:
+            if kind == "add":
+                self.store.removeMany([row[0] for row in rows])
+            elif kind == "remove":
+                self.store.restore(rows, extra)
+            else: # "update": puts back the old values
+                self.store.setValues([(row[0],) + values for row, values in zip(rows, extra)])
+            return self.captured
+        finally:
+            self.captured = None
+    
+    ### SPILLING TO DISK
+    
+    def spill(self, entry):
+        if self.spillFile is None:
+            self.spillFile = open(self.spillPath, 'w+b')
+        self.spillFile.seek(0, os.SEEK_END)
+        self.spillOffsets.append(self.spillFile.tell())
+        self.spillFile.write(json.dumps(entry).encode("utf-8") + b"\n")
+    
+    def unspill(self):
+        offset = self.spillOffsets.pop()
+        self.spillFile.seek(offset)
+        kind, rows, extra = json.loads(self.spillFile.read())
+        self.spillFile.truncate(offset) # the spill file works as a stack
+        return (kind, [tuple(row) for row in rows], [tuple(item) for item in extra] if kind == "update" else extra)
+    
+    def closeSpill(self):
+        self.spillOffsets = []
+        if self.spillFile is not None:
+            self.spillFile.close()
+            self.spillFile = None
+            os.remove(self.spillPath)
+    
+    def close(self):
+        if self.store is not None:
+            self.store.unsubscribe(self.record)
+            self.store = None
+        self.clear()
+
+def makeEntry(action, tasks, previous):
+    """Turns a store change into (kind, rows, extra): rows are (taskId, completed, task, deadline) tuples,
+    and extra is the removal positions for "remove", the old values for "update", or the positions (or None) for "add"."""
+    rows = [(record.taskId, record.completed, record.task, record.deadline) for record in tasks]
+    return (action, rows, list(previous) if previous is not None else None)
@@ -0,0 +1,39 @@
+"""
+Module: tasklist.watch
+Purpose: Noticing when a list's file is changed by another program, such as the command line or another window.
+    A check costs one os.stat per file (the save file and its autosave journals), comparing sizes and modification times,
+    so it can run every second; the file itself is only read once a check finds a difference.
+"""
+
+import os # used for reading file sizes and modification times
+
+from tasklist.journal import journalPaths
+
+class FileWatcher:
+    def __init__(self, filePath, watchJournal = True):
+        self.filePath = filePath
+        self.paths = (filePath,) + (journalPaths(filePath) if watchJournal else ()) # a program autosaving the list leaves its own journal out
+        self.signature = self.read()
+    
+    def read(self):
+        signature = []
+        for path in self.paths:
+            try:
+                info = os.stat(path)
+            except OSError: # a missing file (like a journal that has been folded in) is a state too
+                signature.append(None)
+            else:
+                signature.append((info.st_mtime_ns, info.st_size))
+        return tuple(signature)
+    
+    def changed(self):
+        """Returns True, once, if the files have changed since they were last checked."""
+        signature = self.read()
+        if signature == self.signature:
+            return False
+        self.signature = signature
+        return True
+    
+    def remember(self):
+        """Takes the files as they are now as already seen, for after this program has written them itself."""
+        self.signature = self.read()
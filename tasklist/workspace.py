@@ -0,0 +1,154 @@
+"""
+Module: tasklist.workspace
+Purpose: Several task lists open at once, with one of them shown.
+    Lists that aren't shown are kept as plain task stores, with no widgets at all.
+    When those lists hold too many tasks between them, the ones shown least recently are unloaded:
+    a list with no unsaved changes is dropped and read from its file again when it is next shown,
+    a list with changes is first written to a compact temporary file, and a database is just closed.
+"""
+
+import os # used for removing temporary files
+import tempfile # used for holding unloaded lists with unsaved changes
+
+from tasklist.binaryfile import writeBinaryFile, readBinaryFile
+from tasklist.core import TaskStore, isDatabasePath
+from tasklist.journal import readJournaledFile
+from tasklist.sqlitestore import SqliteTaskStore
+
+class ListTab:
+    def __init__(self, name, store = None, filePath = None):
+        self.name = name
+        self.filePath = filePath # the file the list was loaded from or saved to, if any
+        self.store = None # the list's tasks, or None while it is unloaded
+        self.changed = False # whether the list has changes its file doesn't
+        self.unloadPath = None # the temporary file holding the list while it is unloaded with changes
+        self.lastShown = 0 # when the list was last shown, counted in tab switches
+        self.view = {} # whatever the window wants back when the list is shown again, like the scroll position
+        self.pinned = False # kept in memory even when not shown, like a shared list that changes keep arriving for
+        if store is not None:
+            self.setStore(store)
+    
+    def setStore(self, store):
+        if self.store is not None:
+            self.store.unsubscribe(self.noteChange)
+        self.store = store
+        if store is not None:
+            store.subscribe(self.noteChange)
+    
+    def noteChange(self, action, tasks, previous):
+        self.changed = True
+    
+    def nameAfter(self, filePath):
+        self.filePath = filePath
+        self.name = os.path.basename(filePath)
+    
+    def markSaved(self, filePath):
+        """Records that the list now matches filePath, and names the tab after it."""
+        self.nameAfter(filePath)
+        self.changed = False
+    
+    def isLoaded(self):
+        return self.store is not None
+
+class Workspace:
+    def __init__(self, inactiveTaskLimit = 200000, inactiveListLimit = 8):
+        self.tabs = [] # in the order they are shown
+        self.active = None # the tab being shown
+        self.inactiveTaskLimit = inactiveTaskLimit # most tasks kept in memory by lists that aren't shown
+        self.inactiveListLimit = inactiveListLimit # most lists kept in memory that aren't shown
+        self.switches = 0
+    
+    def __len__(self):
+        return len(self.tabs)
+    
+    def __iter__(self):
+        return iter(list(self.tabs))
+    
+    def addTab(self, name, store = None, filePath = None):
+        """Adds a tab after the others, holding store (an empty list if None). The shown tab doesn't change."""
+        tab = ListTab(name, store if store is not None else TaskStore(), filePath)
+        self.tabs.append(tab)
+        return tab
+    
+    def closeTab(self, tab):
+        """Removes tab, freeing its list and any unsaved changes. The shown tab can't be closed; show another one first."""
+        if tab is self.active:
+            raise ValueError("the shown list can't be closed")
+        self.tabs.remove(tab)
+        self.unload(tab, keep = False)
+    
+    def replaceTabs(self, tabs, active, store):
+        """Swaps every tab for tabs, like the ones of a saved session, and shows active holding store. The old tabs are closed."""
+        for tab in self.tabs:
+            self.unload(tab, keep = False)
+        active.setStore(store)
+        self.tabs = list(tabs)
+        self.active = None
+        self.activate(active)
+    
+    def holds(self, store):
+        return any(tab.store is store for tab in self.tabs)
+    
+    def activate(self, tab):
+        """Makes tab the shown one, loading its list back if it was unloaded, and returns its store."""
+        if tab.store is None:
+            self.reload(tab) # raises OSError or ValueError if the list can't be read back; the shown tab stays the same
+        self.switches += 1
+        tab.lastShown = self.switches
+        self.active = tab
+        self.trim()
+        return tab.store
+    
+    ### UNLOADING
+    
+    def trim(self):
+        """Unloads the lists shown least recently until the rest fit within the limits."""
+        loaded = sorted((tab for tab in self.tabs if tab is not self.active and tab.store is not None and not tab.pinned), key = lambda tab: tab.lastShown)
+        heldTasks = sum(len(tab.store) for tab in loaded if not isinstance(tab.store, SqliteTaskStore)) # databases keep their tasks on disk
+        while loaded and (len(loaded) > self.inactiveListLimit or heldTasks > self.inactiveTaskLimit):
+            tab = loaded.pop(0) # oldest first
+            if not isinstance(tab.store, SqliteTaskStore):
+                heldTasks -= len(tab.store)
+            self.unload(tab)
+    
+    def unload(self, tab, keep = True):
+        """Drops tab's list from memory. With keep, a list with unsaved changes is written to a temporary file first."""
+        store = tab.store
+        if store is None:
+            if not keep:
+                self.discardUnloaded(tab)
+            return
+        tab.setStore(None)
+        if isinstance(store, SqliteTaskStore): # every change is already in the database
+            store.close()
+        elif keep and (tab.changed or tab.filePath is None):
+            handle, tab.unloadPath = tempfile.mkstemp(prefix = "tasklist-tab-", suffix = ".tlist")
+            os.close(handle)
+            writeBinaryFile(tab.unloadPath, store.records())
+    
+    def reload(self, tab):
+        if tab.unloadPath is not None:
+            records = readBinaryFile(tab.unloadPath) # still has unsaved changes, so tab.changed stays as it was
+            self.discardUnloaded(tab)
+        elif tab.filePath is not None and isDatabasePath(tab.filePath):
+            tab.setStore(SqliteTaskStore(tab.filePath))
+            return
+        elif tab.filePath is not None:
+            records = readJournaledFile(tab.filePath) # includes anything autosaved while the list was shown
+        else:
+            records = []
+        store = TaskStore()
+        store.replaceAll(records)
+        tab.setStore(store) # subscribed afterwards, so reading the list back isn't counted as a change
+    
+    def discardUnloaded(self, tab):
+        if tab.unloadPath is not None:
+            os.remove(tab.unloadPath)
+            tab.unloadPath = None
+    
+    def close(self):
+        """Frees every list, including the temporary files of unloaded ones."""
+        for tab in self.tabs:
+            self.unload(tab, keep = False)
+        self.tabs = []
+        self.active = None
@@ -0,0 +1,80 @@
+"""
+Module: tests.test_binaryfile
+Purpose: Checks the ".tlist" save file format: that lists read back exactly as they were written,
+    and that broken or newer files are refused with ValueError instead of being misread.
+"""
+
+import pytest
+
+from tasklist.binaryfile import binaryVersion, headerFormat, readBinaryData, readBinaryFile, writeBinaryFile
+from tasklist.core import readTaskFile
+
+records = [
+    (1, 0, "Buy groceries", "10/31/2026"),
+    (2, 1, "", ""),
+    (7, 0, "Ünïcödé, 日本語 and 🎉 in one task", "tomorrow 9am"),
+    (2 ** 40, 1, "A very large id", ""),
+    (8, 0, "Line\nbreaks\tand tabs", "")
+]
+
+def writtenFile(folder, name = "tasks.tlist"):
+    filePath = str(folder / name)
+    writeBinaryFile(filePath, records)
+    return filePath
+
+def testRoundTrip(tmp_path):
+    assert readBinaryFile(writtenFile(tmp_path)) == records
+
+def testRoundTripOfAnEmptyList(tmp_path):
+    filePath = str(tmp_path / "empty.tlist")
+    writeBinaryFile(filePath, [])
+    assert readBinaryFile(filePath) == []
+
+def testMappedFileReadsLikeBytes(tmp_path):
+    filePath = writtenFile(tmp_path)
+    with open(filePath, 'rb') as loadFile:
+        data = loadFile.read()
+    assert readBinaryFile(filePath) == readBinaryData(data) # readBinaryFile goes through mmap
+
+def testRecognizedByItsFirstBytes(tmp_path):
+    filePath = writtenFile(tmp_path, "tasks.json") # named like a JSON file
+    assert readTaskFile(filePath) == records
+
+def testTruncatedHeader(tmp_path):
+    filePath = writtenFile(tmp_path)
+    with open(filePath, 'rb') as loadFile:
+        data = loadFile.read()
+    with open(filePath, 'wb') as saveFile:
+        saveFile.write(data[:headerFormat.size - 3])
+    with pytest.raises(ValueError, match = "too short"):
+        readBinaryFile(filePath)
+
+def testEmptyFile(tmp_path):
+    filePath = str(tmp_path / "empty.tlist")
+    open(filePath, 'wb').close()
+    with pytest.raises(ValueError):
+        readBinaryFile(filePath)
+
+def testTruncatedBody(tmp_path):
+    filePath = writtenFile(tmp_path)
+    with open(filePath, 'rb') as loadFile:
+        data = loadFile.read()
+    with open(filePath, 'wb') as saveFile:
+        saveFile.write(data[:-5]) # the end of the text is missing
+    with pytest.raises(ValueError, match = "cut short"):
+        readBinaryFile(filePath)
+
+def testNewerVersion(tmp_path):
+    filePath = writtenFile(tmp_path)
+    with open(filePath, 'rb') as loadFile:
+        data = bytearray(loadFile.read())
+    magic, version, flags, count, textSize = headerFormat.unpack_from(data)
+    headerFormat.pack_into(data, 0, magic, binaryVersion + 1, flags, count, textSize)
+    with open(filePath, 'wb') as saveFile:
+        saveFile.write(data)
+    with pytest.raises(ValueError, match = "not supported"):
+        readBinaryFile(filePath)
+
+def testNotABinaryFile():
+    with pytest.raises(ValueError, match = "not a binary task file"):
+        readBinaryData(b"JSON" + bytes(headerFormat.size))
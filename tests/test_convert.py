@@ -0,0 +1,47 @@
+"""
+Module: tests.test_convert
+Purpose: Checks that "convert" keeps every task of a CSV file without ids, in the formats keyed by task id.
+"""
+
+import json # used for reading the converted JSON file
+
+from tasklist.binaryfile import readBinaryFile
+from tasklist.cli import main
+
+csvRows = "task,deadline,completed\nBuy groceries,10/31/2026,0\nCall dentist,,1\nWrite report,soon,0\n"
+expected = [
+    (1, 0, "Buy groceries", "10/31/2026"),
+    (2, 1, "Call dentist", ""),
+    (3, 0, "Write report", "soon")
+]
+
+def writeCsv(folder):
+    sourcePath = folder / "tasks.csv"
+    sourcePath.write_text(csvRows, encoding = "utf-8")
+    return str(sourcePath)
+
+def testConvertCsvToJson(tmp_path):
+    outputPath = tmp_path / "tasks.json"
+    assert main(["convert", writeCsv(tmp_path), str(outputPath)]) == 0
+    saved = json.loads(outputPath.read_text())
+    assert [(int(key), value["completed"], value["task"], value["deadline"]) for key, value in saved.items()] == expected
+
+def testConvertCsvToBinary(tmp_path):
+    outputPath = tmp_path / "tasks.tlist"
+    assert main(["convert", writeCsv(tmp_path), str(outputPath)]) == 0
+    assert [tuple(record) for record in readBinaryFile(str(outputPath))] == expected
+
+def testConvertKeepsIdsFromTheFile(tmp_path):
+    sourcePath = tmp_path / "tasks.csv"
+    sourcePath.write_text("id,task\n,First\n7,Second\n,Third\n", encoding = "utf-8")
+    outputPath = tmp_path / "tasks.json"
+    assert main(["convert", str(sourcePath), str(outputPath)]) == 0
+    saved = json.loads(outputPath.read_text())
+    assert {key: value["task"] for key, value in saved.items()} == {"8": "First", "7": "Second", "9": "Third"}
+
+def testJsonThatIsNotAnObjectIsAnError(tmp_path, capsys):
+    for number, text in enumerate(["[]", '{"1": "Not a task"}']):
+        sourcePath = tmp_path / f"tasks{number}.json"
+        sourcePath.write_text(text, encoding = "utf-8")
+        assert main(["convert", str(sourcePath), str(tmp_path / "tasks.csv")]) == 1 # reported, not a traceback
+        assert "could not convert" in capsys.readouterr().err
@@ -0,0 +1,84 @@
+"""
+Module: tests.test_journal
+Purpose: Checks that a journaled list reads back as it was left: through replay, through compactions that run
+    while changes keep coming, and after the whole list is replaced, in each save file format.
+"""
+
+import os # used for checking which journal files are left
+
+import pytest
+
+from tasklist.core import TaskStore
+from tasklist.journal import TaskJournal, journalPaths, readJournaledFile
+
+extensions = [".json", ".tlist", ".csv"]
+
+def makeChanges(store, count):
+    """Adds, edits, completes and deletes tasks, and puts some deleted ones back in place."""
+    for number in range(count):
+        record = store.add(f"Task {number}", "10/31/2026" if number % 3 else "")
+        if number % 4 == 1:
+            store.setCompleted(record.taskId, 1)
+        if number % 5 == 2:
+            store.setValues([(record.taskId, record.completed, f"Edited {number}", "")])
+        if number % 7 == 3:
+            store.remove(store.taskAt(len(store) // 2).taskId)
+        if number % 11 == 5:
+            removed = store.removeMany([store.taskAt(0).taskId])
+            store.restore([(task.taskId, task.completed, task.task, task.deadline) for task in removed], [0]) # an undo
+
+@pytest.mark.parametrize("extension", extensions)
+def testReplayKeepsEveryChange(tmp_path, extension):
+    snapshotPath = str(tmp_path / ("tasks" + extension))
+    store = TaskStore()
+    journal = TaskJournal(snapshotPath, store)
+    makeChanges(store, 40)
+    journal.close()
+    assert readJournaledFile(snapshotPath) == store.records()
+
+@pytest.mark.parametrize("extension", extensions)
+def testCompactionWhileChangesKeepComing(tmp_path, extension):
+    snapshotPath = str(tmp_path / ("tasks" + extension))
+    store = TaskStore()
+    journal = TaskJournal(snapshotPath, store, syncEvery = 8, compactSize = 512) # compacts every few changes
+    makeChanges(store, 300)
+    journal.close()
+    assert readJournaledFile(snapshotPath) == store.records()
+    assert not os.path.exists(journalPaths(snapshotPath)[0]) # every compaction finished
+
+@pytest.mark.parametrize("extension", extensions)
+def testSnapshotOnReset(tmp_path, extension):
+    snapshotPath = str(tmp_path / ("tasks" + extension))
+    store = TaskStore()
+    journal = TaskJournal(snapshotPath, store, compactSize = 512)
+    makeChanges(store, 30)
+    store.replaceAll([(5, 0, "Replaced", ""), (9, 1, "Lists", "11/01/2026")]) # may land while a compaction is running
+    assert all(os.path.getsize(path) == 0 for path in journalPaths(snapshotPath) if os.path.exists(path)) # nothing from before the reset is replayed
+    assert readJournaledFile(snapshotPath) == store.records() # the snapshot alone has the new list
+    store.add("After", "")
+    journal.close()
+    assert readJournaledFile(snapshotPath) == store.records()
+
+def testReplayingALineTwiceIsHarmless(tmp_path):
+    snapshotPath = str(tmp_path / "tasks.json")
+    store = TaskStore()
+    journal = TaskJournal(snapshotPath, store)
+    makeChanges(store, 20)
+    journal.close()
+    oldJournalPath, journalPath = journalPaths(snapshotPath)
+    with open(journalPath, encoding = "utf-8") as journalFile, open(oldJournalPath, 'w', encoding = "utf-8") as oldJournal:
+        oldJournal.write(journalFile.read()) # as if a crash came before the compaction could remove it
+    assert readJournaledFile(snapshotPath) == store.records()
+
+def testReplayStopsAtALineCutShort(tmp_path):
+    snapshotPath = str(tmp_path / "tasks.json")
+    store = TaskStore()
+    journal = TaskJournal(snapshotPath, store)
+    store.add("Saved", "")
+    journal.close()
+    with open(journalPaths(snapshotPath)[1], 'a', encoding = "utf-8") as journalFile:
+        journalFile.write('{"op": "add", "id": 7, "comp') # the write a crash interrupted
+    assert [record[2] for record in readJournaledFile(snapshotPath)] == ["Saved"]
+
+def testMissingFileIsAnEmptyList(tmp_path):
+    assert readJournaledFile(str(tmp_path / "missing.json")) == []
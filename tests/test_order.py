@@ -0,0 +1,121 @@
+"""
+Module: tests.test_order
+Purpose: Checks that the list order, and every task's position, stays right through random adds, removes and
+    restores, by making the same changes to a plain Python list.
+"""
+
+import random # used for the randomized changes
+
+import pytest
+
+from tasklist.core import TaskOrder, TaskStore
+
+@pytest.mark.parametrize("seed", range(5))
+def testTaskOrderMatchesAPlainList(seed):
+    generator = random.Random(seed)
+    expected = list(range(generator.randrange(200)))
+    order = TaskOrder(expected)
+    nextId = len(expected)
+    for step in range(600):
+        kind = generator.random()
+        if kind < 0.3 or not expected:
+            order.append(nextId)
+            expected.append(nextId)
+            nextId += 1
+        elif kind < 0.6:
+            taskId = generator.choice(expected)
+            assert order.remove(taskId) == expected.index(taskId) # the position it had
+            expected.remove(taskId)
+        elif kind < 0.75:
+            taskId = generator.choice(expected)
+            assert order.position(taskId) == expected.index(taskId)
+        elif kind < 0.9:
+            position = generator.randrange(len(expected))
+            assert order.at(position) == expected[position]
+        elif kind < 0.97:
+            start = generator.randrange(-5, len(expected) + 5)
+            assert order.between(start, start + 20) == expected[max(0, start):start + 20]
+        else:
+            assert order.ids() == expected # squeezes out the empty slots
+        assert len(order) == len(expected)
+    assert order.ids() == expected
+
+def testTaskOrderOutOfRange():
+    order = TaskOrder([1, 2, 3])
+    order.remove(2)
+    with pytest.raises(IndexError):
+        order.at(2)
+    with pytest.raises(IndexError):
+        order.at(-1)
+
+def testTaskOrderSqueezesAMostlyEmptyList():
+    order = TaskOrder(range(1000))
+    for taskId in range(0, 1000, 3):
+        order.remove(taskId)
+    for taskId in range(1, 1000, 3):
+        order.remove(taskId)
+    assert order.gaps < 500 # squeezed out once they made up half the slots
+    assert order.ids() == list(range(2, 1000, 3))
+
+@pytest.mark.parametrize("seed", range(5))
+def testStoreMatchesAPlainList(seed):
+    generator = random.Random(seed)
+    store = TaskStore()
+    expected = [store.add(f"Task {number}", "").taskId for number in range(generator.randrange(300))]
+    for step in range(400):
+        kind = generator.random()
+        if kind < 0.3 or not expected:
+            expected.append(store.add(f"Task {step}", "").taskId)
+        elif kind < 0.55:
+            taskId = generator.choice(expected)
+            changes = []
+            listener = lambda action, tasks, previous: changes.append(previous)
+            store.subscribe(listener)
+            store.remove(taskId)
+            store.unsubscribe(listener)
+            assert changes == [[expected.index(taskId)]]
+            expected.remove(taskId)
+        elif kind < 0.7:
+            taskIds = generator.sample(expected, min(len(expected), generator.randint(1, 40)))
+            positions = [expected.index(taskId) for taskId in taskIds]
+            changes = []
+            listener = lambda action, tasks, previous: changes.append(previous)
+            store.subscribe(listener)
+            removed = store.removeMany(taskIds)
+            store.unsubscribe(listener)
+            assert changes == [positions] # where each was before any of them went
+            for taskId in taskIds:
+                expected.remove(taskId)
+            if generator.random() < 0.5: # undone, so each goes back where it was
+                store.restore([(record.taskId, record.completed, record.task, record.deadline) for record in removed], positions)
+                for position, taskId in sorted(zip(positions, taskIds)):
+                    expected.insert(position, taskId)
+        elif kind < 0.85:
+            taskId = generator.choice(expected)
+            assert store.positionOf(taskId) == expected.index(taskId)
+        else:
+            position = generator.randrange(len(expected))
+            assert store.taskAt(position).taskId == expected[position]
+        assert len(store) == len(expected)
+    assert list(store.orderedIds()) == expected
+    assert [record[0] for record in store.records()] == expected
+
+def testRestoreMergesPositionsIntoTheList():
+    store = TaskStore()
+    store.extend((None, 0, letter, "") for letter in "abc")
+    store.restore([(10, 0, "x", ""), (11, 0, "y", ""), (12, 0, "z", "")], [4, 0, 2]) # given out of order
+    assert [record[2] for record in store.records()] == ["y", "a", "z", "b", "x", "c"]
+
+def testRestorePastTheEndAppends():
+    store = TaskStore()
+    store.extend((None, 0, letter, "") for letter in "ab")
+    store.restore([(10, 0, "x", ""), (11, 0, "y", "")], [7, 9]) # the tasks that were before them are gone
+    assert [record[2] for record in store.records()] == ["a", "b", "x", "y"]
+
+def testRestoreGivesTakenIdsNewOnes():
+    store = TaskStore()
+    kept = store.add("Kept", "")
+    restored = store.restore([(kept.taskId, 0, "Back", ""), (kept.taskId, 0, "Also back", "")], [0, 1])
+    ids = [record.taskId for record in restored]
+    assert len(set(ids + [kept.taskId])) == 3
+    assert store.add("New", "").taskId not in ids + [kept.taskId]
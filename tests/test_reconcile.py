@@ -0,0 +1,93 @@
+"""
+Module: tests.test_reconcile
+Purpose: Checks that a list brings in a file's changes as small changes where it can (TaskStore.reconcile),
+    and that FileWatcher notices when a list's files change.
+"""
+
+import os # used for changing the watched files' times
+
+from tasklist.core import TaskStore
+from tasklist.journal import journalPaths
+from tasklist.watch import FileWatcher
+
+def storeWith(records):
+    store = TaskStore()
+    store.replaceAll(records)
+    changes = []
+    store.subscribe(lambda action, tasks, previous: changes.append((action, [record.taskId for record in tasks], previous)))
+    return store, changes
+
+original = [(1, 0, "First", ""), (2, 1, "Second", "10/31/2026"), (3, 0, "Third", ""), (4, 0, "Fourth", "")]
+
+def testReconcileWithNoChanges():
+    store, changes = storeWith(original)
+    assert store.reconcile(original) == (0, 0, 0)
+    assert changes == []
+
+def testReconcileEditsRemovesAndAppends():
+    store, changes = storeWith(original)
+    wanted = [(1, 1, "First", ""), (3, 0, "Third, edited", ""), (4, 0, "Fourth", ""), (9, 0, "New", "")]
+    assert store.reconcile(wanted) == (1, 1, 2)
+    assert store.records() == wanted
+    assert [(action, taskIds) for action, taskIds, previous in changes] == [("remove", [2]), ("update", [1, 3]), ("add", [9])]
+    assert changes[-1][2] is None # added at the end, not put in place
+
+def testReconcileInsertsBetweenTasks():
+    store, changes = storeWith(original)
+    wanted = original[:1] + [(7, 0, "Between", "")] + original[1:3] + [(8, 0, "Also between", "")] + original[3:]
+    assert store.reconcile(wanted) == (2, 0, 0)
+    assert store.records() == wanted
+    assert changes == [("add", [7, 8], [1, 4])]
+
+def testReconcileReplacesAReorderedList():
+    store, changes = storeWith(original)
+    wanted = [original[1], original[0]] + original[2:]
+    assert store.reconcile(wanted) is None
+    assert store.records() == wanted
+    assert [action for action, taskIds, previous in changes] == ["reset"]
+
+def testReconcileReplacesAListWithoutIds():
+    store, changes = storeWith(original)
+    assert store.reconcile([(None, 0, "No id", "")] + original) is None
+    assert [record[2] for record in store.records()] == ["No id", "First", "Second", "Third", "Fourth"]
+    store, changes = storeWith(original)
+    assert store.reconcile(original + [(1, 0, "Repeated id", "")]) is None
+
+def touch(path, text, nanoseconds):
+    with open(path, 'w') as writtenFile:
+        writtenFile.write(text)
+    os.utime(path, ns = (nanoseconds, nanoseconds)) # a fixed time, so quick writes still differ
+
+def testWatcherNoticesChanges(tmp_path):
+    filePath = str(tmp_path / "tasks.json")
+    touch(filePath, "{}", 1_000_000_000)
+    watcher = FileWatcher(filePath)
+    assert not watcher.changed()
+    
+    touch(filePath, "{} ", 2_000_000_000) # another program saved it
+    assert watcher.changed()
+    assert not watcher.changed() # only reported once
+    
+    touch(filePath, "{} ", 3_000_000_000) # same size, newer time
+    assert watcher.changed()
+    
+    touch(journalPaths(filePath)[1], "{}\n", 3_000_000_000) # another program autosaved a change
+    assert watcher.changed()
+    os.remove(journalPaths(filePath)[1]) # and folded it in
+    assert watcher.changed()
+
+def testWatcherForgetsItsOwnWrites(tmp_path):
+    filePath = str(tmp_path / "tasks.json")
+    touch(filePath, "{}", 1_000_000_000)
+    watcher = FileWatcher(filePath, watchJournal = False)
+    touch(filePath, "{} ", 2_000_000_000)
+    watcher.remember() # this program wrote it
+    assert not watcher.changed()
+    touch(journalPaths(filePath)[1], "{}\n", 3_000_000_000) # its own journal isn't watched
+    assert not watcher.changed()
+
+def testWatcherNoticesAFileAppearing(tmp_path):
+    filePath = str(tmp_path / "tasks.json")
+    watcher = FileWatcher(filePath)
+    touch(filePath, "{}", 1_000_000_000)
+    assert watcher.changed()
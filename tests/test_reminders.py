@@ -0,0 +1,77 @@
+"""
+Module: tests.test_reminders
+Purpose: Checks that ReminderQueue always knows the next pending deadline: that completed, edited and deleted tasks
+    are skipped without searching the heap, that a new list is read again, and that overdue tasks aren't reminded of.
+"""
+
+from tasklist.core import TaskStore
+from tasklist.deadlines import parseDeadline
+from tasklist.reminders import ReminderQueue
+
+first, second, third = "12/31/2090", "1/1/2091", "6/15/2091 9am" # soonest first, all still to come
+overdue = "1/1/2000"
+
+def queueWith(deadlines):
+    store = TaskStore()
+    store.extend((None, 0, f"Task {number}", deadline) for number, deadline in enumerate(deadlines))
+    return store, ReminderQueue(store)
+
+def testSkipsOverdueTasks():
+    store, reminders = queueWith([overdue, second, "", "soon", first])
+    assert len(reminders) == 2 # no reminder for the overdue task, or for ones without a date
+    assert reminders.nextDue() == parseDeadline(first)
+    store.add("Added overdue", overdue)
+    assert len(reminders) == 2
+
+def testSkipsCompletedTasks():
+    store, reminders = queueWith([first, second])
+    store.add("Already done", "12/30/2090", completed = 1)
+    assert reminders.nextDue() == parseDeadline(first)
+
+def testLazyDeletion():
+    store, reminders = queueWith([first, second, third])
+    firstId, secondId, thirdId = store.orderedIds()
+    store.setCompleted(firstId, 1)
+    store.remove(secondId)
+    assert len(reminders.heap) == 3 # their entries are only dropped once they reach the top
+    assert reminders.nextDue() == parseDeadline(third)
+    assert len(reminders.heap) == 1
+    
+    store.setCompleted(firstId, 0) # pending again, so reminded of again
+    assert reminders.nextDue() == parseDeadline(first)
+
+def testEditedDeadlineReplacesTheOldOne():
+    store, reminders = queueWith([first, second])
+    firstId = store.orderedIds()[0]
+    store.edit(firstId, "Task 0", third)
+    assert reminders.nextDue() == parseDeadline(second)
+    assert reminders.popDue(parseDeadline(third)) == [store.orderedIds()[1], firstId] # soonest first, the old deadline skipped
+    assert reminders.nextDue() is None
+
+def testPopDueForgetsWhatItReturns():
+    store, reminders = queueWith([second, first, third])
+    secondId, firstId, thirdId = store.orderedIds()
+    assert reminders.popDue(parseDeadline(first) - 1) == []
+    assert reminders.popDue(parseDeadline(second)) == [firstId, secondId]
+    assert reminders.popDue(parseDeadline(second)) == []
+    assert reminders.nextDue() == parseDeadline(third)
+
+def testRebuildOnReset():
+    store, reminders = queueWith([first])
+    store.replaceAll([(5, 0, "New list", third), (6, 0, "Overdue in the new list", overdue)])
+    assert len(reminders) == 1
+    assert reminders.nextDue() == parseDeadline(third)
+    assert reminders.popDue(parseDeadline(third)) == [5]
+
+def testResetKeepsWhatWasAlreadyReminded():
+    store, reminders = queueWith([first, third])
+    reminders.popDue(parseDeadline(second)) # the first task's reminder has been shown
+    store.replaceAll(store.records()) # the same list, read again
+    assert reminders.nextDue() == parseDeadline(third)
+
+def testMostlyStaleHeapIsBuiltAgain():
+    store, reminders = queueWith([first] * 500)
+    store.removeMany(list(store.orderedIds())[:490])
+    store.add("One more", second)
+    assert len(reminders) == 11
+    assert len(reminders.heap) <= 2 * len(reminders) + 64
@@ -0,0 +1,90 @@
+"""
+Module: tests.test_sqlitestore
+Purpose: Checks the SQLite backend: reading the list a page at a time, undo and redo, importing and exporting
+    the JSON save format, and bringing in a file's changes.
+"""
+
+import json # used for reading the exported file
+
+import pytest
+
+from tasklist.core import readTaskFile
+from tasklist.sqlitestore import SqliteTaskStore, exportJsonFile, importJsonFile, streamDatabaseRecords
+from tasklist.undo import UndoLog
+
+@pytest.fixture
+def store(tmp_path):
+    store = SqliteTaskStore(str(tmp_path / "tasks.db"))
+    store.extend((None, number % 2, f"Task {number}", "10/31/2026" if number % 3 else "") for number in range(500))
+    yield store
+    store.close()
+
+def testPagesMatchTheList(store):
+    store.removeMany(list(store.orderedIds())[100:400:3]) # leaves holes in the ids
+    records = store.records()
+    for start in (0, 1, 99, 250, len(records) - 10):
+        assert [record.taskId for record in store.page(start, 25)] == [record[0] for record in records[start:start + 25]]
+    assert store.page(len(records), 25) == []
+    assert [record.taskId for record in store] == [record[0] for record in records] # iterates a page at a time
+    assert store.taskAt(123).taskId == records[123][0]
+
+def testUndoAndRedo(store):
+    undoLog = UndoLog(store)
+    before = store.records()
+    store.removeMany(list(store.orderedIds())[10:20])
+    store.setCompletedMany(list(store.orderedIds())[:5], 1)
+    store.edit(store.taskAt(30).taskId, "Edited", "")
+    store.add("Added", "")
+    after = store.records()
+    
+    while undoLog.canUndo():
+        undoLog.undo()
+    assert store.records() == before
+    assert store.completedCount == sum(record[1] for record in before)
+    while undoLog.canRedo():
+        undoLog.redo()
+    assert store.records() == after
+
+def testExportAndImportJson(store, tmp_path):
+    jsonPath = str(tmp_path / "tasks.json")
+    exportJsonFile(store, jsonPath)
+    json.loads(open(jsonPath).read()) # written a task at a time, but still one document
+    assert readTaskFile(jsonPath) == store.records()
+    
+    imported = importJsonFile(str(tmp_path / "imported.db"), jsonPath)
+    try:
+        assert imported.records() == store.records()
+        assert list(streamDatabaseRecords(str(tmp_path / "imported.db"))) == store.records()
+    finally:
+        imported.close()
+
+def testExportAnEmptyList(tmp_path):
+    store = SqliteTaskStore(str(tmp_path / "empty.db"))
+    try:
+        exportJsonFile(store, str(tmp_path / "empty.json"))
+        assert json.loads(open(tmp_path / "empty.json").read()) == {}
+    finally:
+        store.close()
+
+def testReconcileReadsTheListOnce(store):
+    records = store.records()
+    wanted = [(taskId, 1 - completed if taskId % 50 == 0 else completed, task, deadline) for taskId, completed, task, deadline in records if taskId % 7]
+    edited = sum(1 for record in wanted if record[0] % 50 == 0)
+    wanted += [(1000, 0, "New", ""), (1001, 1, "Newer", "")]
+    statements = []
+    store.connection.set_trace_callback(statements.append)
+    changes = []
+    store.subscribe(lambda action, tasks, previous: changes.append((action, len(tasks))))
+    
+    assert store.reconcile(wanted) == (2, len(records) - len(wanted) + 2, edited)
+    assert sum(statement.startswith("SELECT") for statement in statements) < 10 # not one per task
+    assert store.records() == wanted
+    assert [action for action, count in changes] == ["remove", "update", "add"]
+
+def testReconcilePutsNewTasksInIdOrder(store):
+    store.removeMany([3])
+    records = store.records()
+    wanted = records[:2] + [(3, 0, "Back", "")] + records[2:] # between tasks that stayed
+    assert store.reconcile(wanted) == (1, 0, 0)
+    assert store.records() == wanted
+    assert store.positionOf(3) == 2
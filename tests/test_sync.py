@@ -0,0 +1,157 @@
+"""
+Module: tests.test_sync
+Purpose: Checks that clients sharing a list through a SyncServer end up with the same tasks, in the same order, as the server.
+    The server runs on its own event loop thread, on a free local port; each client's changes are delivered
+    from the test's thread, the way the window delivers them from its own.
+"""
+
+import asyncio # used for running the server
+import random # used for the randomized changes
+import threading # used for running the server beside the test
+import time # used for waiting for changes to arrive
+
+import pytest
+
+from tasklist.sync import SyncClient, SyncServer, lineLimit
+from tasklist.undo import UndoLog
+
+settleTimeout = 10 # seconds to wait for every client to catch up
+
+class RunningServer:
+    def __init__(self, filePath):
+        self.server = SyncServer(filePath)
+        self.loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        self.thread = threading.Thread(target = self.run, args = (ready,), daemon = True)
+        self.thread.start()
+        ready.wait(settleTimeout)
+    
+    def run(self, ready):
+        asyncio.set_event_loop(self.loop)
+        listener = self.loop.run_until_complete(asyncio.start_server(self.server.handleClient, "127.0.0.1", 0, limit = lineLimit))
+        self.port = listener.sockets[0].getsockname()[1]
+        ready.set()
+        self.loop.run_forever()
+        listener.close()
+        connections = asyncio.all_tasks(self.loop)
+        if connections: # the tests close their clients first, so each connection ends on its own
+            self.loop.run_until_complete(asyncio.wait(connections, timeout = settleTimeout))
+        self.loop.run_until_complete(listener.wait_closed())
+        self.loop.close()
+    
+    def callSoon(self, function):
+        """Runs function on the server's thread and returns its result, so the server's list is read between messages."""
+        done = threading.Event()
+        result = []
+        def wrapper():
+            result.append(function())
+            done.set()
+        self.loop.call_soon_threadsafe(wrapper)
+        done.wait(settleTimeout)
+        return result[0]
+    
+    def join(self):
+        return SyncClient(f"127.0.0.1:{self.port}")
+    
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(settleTimeout)
+
+@pytest.fixture
+def running(tmp_path):
+    running = RunningServer(str(tmp_path / "shared.json"))
+    yield running
+    running.stop()
+
+def settle(running, clients):
+    """Waits until every client has applied every batch of changes the server has sent."""
+    deadline = time.time() + settleTimeout
+    quiet = 0
+    while quiet < 5: # the versions have to hold still for a moment, so changes still in flight are waited for too
+        assert time.time() < deadline, "the clients never caught up with the server"
+        time.sleep(0.01)
+        for client in clients:
+            client.deliver()
+        version = running.callSoon(lambda: running.server.version)
+        if all(client.version == version and not client.unsure for client in clients): # and none is still checking where tasks go
+            quiet += 1
+        else:
+            quiet = 0
+
+def assertSame(running, clients):
+    expected = running.callSoon(lambda: running.server.store.records())
+    for client in clients:
+        assert client.store.records() == expected
+        assert list(client.store.orderedIds()) == [record[0] for record in expected]
+
+def testDeleteUndoAddKeepsOtherClientsTasks(running):
+    first = running.join()
+    second = running.join()
+    clients = [first, second]
+    try:
+        helped = [second.store.add(f"From the second client {number}", "") for number in range(2)] # in the second client's block
+        settle(running, clients)
+        undoLog = UndoLog(first.store)
+        first.store.remove(helped[0].taskId)
+        undoLog.undo() # puts it back, which used to number the next new task after it
+        first.store.add("From the first client", "")
+        settle(running, clients)
+        second.store.add("Later", "")
+        settle(running, clients)
+        
+        assertSame(running, clients)
+        assert [record[2] for record in first.store.records()] == ["From the second client 0", "From the second client 1", "From the first client", "Later"]
+    finally:
+        for client in clients:
+            client.close()
+
+def testConcurrentAddsEndInTheServersOrder(running):
+    clients = [running.join() for number in range(2)]
+    try:
+        for turn in range(5):
+            for number, client in enumerate(clients): # both add before either hears of the other
+                client.store.add(f"Turn {turn} from {number}", "")
+            settle(running, clients)
+        assertSame(running, clients)
+    finally:
+        for client in clients:
+            client.close()
+
+@pytest.mark.parametrize("seed", range(8))
+def testRandomChangesFromSeveralClients(running, seed):
+    generator = random.Random(seed)
+    clients = [running.join() for number in range(4)]
+    undoLogs = [UndoLog(client.store) for client in clients]
+    try:
+        for step in range(60):
+            number = generator.randrange(len(clients))
+            store = clients[number].store
+            kind = generator.random()
+            if kind < 0.4 or not len(store):
+                store.add(f"Task {step}", "")
+            elif kind < 0.6:
+                store.remove(store.taskAt(generator.randrange(len(store))).taskId)
+            elif kind < 0.75:
+                record = store.taskAt(generator.randrange(len(store)))
+                store.setCompleted(record.taskId, not record.completed)
+            else:
+                undoLogs[number].undo()
+            if generator.random() < 0.5: # the rest of the time, changes cross on the way
+                settle(running, clients)
+        settle(running, clients)
+        assertSame(running, clients)
+    finally:
+        for client in clients:
+            client.close()
+
+def testBrokenMessageChangesNothing(tmp_path):
+    server = SyncServer(str(tmp_path / "shared.json"))
+    server.store.add("Kept", "")
+    ops = [
+        {"op": "add", "id": 100, "completed": 0, "task": "Would be added", "deadline": ""},
+        {"op": "rm", "id": server.store.taskAt(0).taskId},
+        {"op": "set", "id": 100, "completed": 0, "task": ["not", "text"], "deadline": ""} # breaks the message's last run
+    ]
+    with pytest.raises(ValueError):
+        server.apply(ops)
+    assert [record[2] for record in server.store.records()] == ["Kept"]